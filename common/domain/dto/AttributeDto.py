@@ -1,6 +1,6 @@
 from abc import ABC
 from datetime import datetime
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from uuid import UUID
 
 from common.domain.dto.AttributeMetadata import AttributeMetadata
@@ -10,8 +10,10 @@ from common.domain.enum.AttributeType import AttributeType
 class AttributeDto(ABC):
     """
     Is a DTO for Model Attributes.  The `metadata` consists of ``AttributeMetadata`` objects which are JSON
-    serializable allowing straightforward conversion to a ``ModelAttribute`` entity.
+    serializable allowing straightforward conversion to a ``ModelAttribute`` entity.  Transforms create many of
+    these, instances have ``__slots__`` rather than a ``__dict__`` (subclasses must declare ``__slots__ = ()``).
     """
+    __slots__ = ('attributeId', 'title', 'modelId', 'metadata', 'updatedAt')
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -21,6 +23,12 @@ class AttributeDto(ABC):
         self.metadata = metadata
         self.updatedAt = updatedAt
 
+    def identity(self) -> Tuple:
+        """
+        :return: the fields significant for equality and hashing, everything but ``metadata``
+        """
+        return type(self), self.attributeId, self.title, self.modelId, self.updatedAt
+
     def __eq__(self, other: Any) -> bool:
         """
         Only ``attribute_type`` and ``title`` are significant for equality
@@ -29,7 +37,7 @@ class AttributeDto(ABC):
         """
         if not type(self) == type(other):
             return False
-        return self.attributeId == other.attributeId and self.title == other.title and self.modelId == other.modelId and self.updatedAt == other.updatedAt
+        return self.identity() == other.identity()
 
     def _assertStrictEq(self, other: Any) -> None:
         """
@@ -59,7 +67,7 @@ class AttributeDto(ABC):
         Only ``attribute_type`` and ``title`` are hashed (similar to ``__eq__``)
         :return:
         """
-        return hash((type(self), self.attributeId, self.title, self.modelId, self.updatedAt))
+        return hash(self.identity())
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.title})"
@@ -70,6 +78,7 @@ class AttributeDto(ABC):
 
 
 class Engine(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -77,6 +86,7 @@ class Engine(AttributeDto):
 
 
 class Transmission(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -84,6 +94,7 @@ class Transmission(AttributeDto):
 
 
 class Drive(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -91,6 +102,7 @@ class Drive(AttributeDto):
 
 
 class BodyStyle(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -98,6 +110,7 @@ class BodyStyle(AttributeDto):
 
 
 class Grade(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -105,6 +118,7 @@ class Grade(AttributeDto):
 
 
 class Package(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -112,6 +126,7 @@ class Package(AttributeDto):
 
 
 class InteriorColor(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -119,6 +134,7 @@ class InteriorColor(AttributeDto):
 
 
 class ExteriorColor(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -126,6 +142,7 @@ class ExteriorColor(AttributeDto):
 
 
 class Accessory(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -133,6 +150,7 @@ class Accessory(AttributeDto):
 
 
 class Option(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
@@ -140,6 +158,7 @@ class Option(AttributeDto):
 
 
 class Other(AttributeDto):
+    __slots__ = ()
 
     def __init__(self, title: str, attributeId: Optional[UUID] = None, modelId: Optional[UUID] = None,
                  metadata: Optional[List[AttributeMetadata]] = None, updatedAt: Optional[datetime] = None):
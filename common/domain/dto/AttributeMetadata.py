@@ -5,6 +5,7 @@ from common.domain.enum.MetadataUnit import MetadataUnit
 
 
 class AttributeMetadata:
+    __slots__ = ('metadataType', 'value', 'unit')
 
     def __init__(self, metadataType: MetadataType, value: Any, unit: Optional[MetadataUnit] = None):
         self.metadataType = metadataType
@@ -14,7 +15,7 @@ class AttributeMetadata:
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return self.__dict__ == other.__dict__
+        return (self.metadataType, self.value, self.unit) == (other.metadataType, other.value, other.unit)
 
     def __hash__(self) -> int:
         return hash((self.metadataType, self.value, self.unit))
@@ -0,0 +1,34 @@
+import pickle
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from common.domain.dto.AttributeDto import Grade, attributeDtoToAttributeType
+from common.domain.dto.AttributeMetadata import AttributeMetadata
+from common.domain.enum.MetadataType import MetadataType
+from common.domain.enum.MetadataUnit import MetadataUnit
+
+
+class TestAttributeDto(TestCase):
+
+    def setUp(self) -> None:
+        self.metadata = [AttributeMetadata(metadataType=MetadataType.COMMON_BASE_MSRP, value=30_000,
+                                           unit=MetadataUnit.DOLLARS)]
+
+    @parameterized.expand([(attributeDtoType.__name__, attributeDtoType)
+                           for attributeDtoType in attributeDtoToAttributeType])
+    def test_hasNoInstanceDict(self, _name, attributeDtoType):
+        self.assertFalse(hasattr(attributeDtoType(title='title'), '__dict__'))
+
+    def test_attributeMetadataHasNoInstanceDict(self):
+        self.assertFalse(hasattr(self.metadata[0], '__dict__'))
+
+    def test_pickle(self):
+        grade = Grade(title='LE', metadata=self.metadata)
+        grade._assertStrictEq(pickle.loads(pickle.dumps(grade)))
+
+    def test_attributeMetadataEqualityAndHash(self):
+        same = AttributeMetadata(metadataType=MetadataType.COMMON_BASE_MSRP, value=30_000, unit=MetadataUnit.DOLLARS)
+        self.assertEqual(self.metadata[0], same)
+        self.assertEqual(hash(self.metadata[0]), hash(same))
+        self.assertNotEqual(self.metadata[0], AttributeMetadata(metadataType=MetadataType.COMMON_BASE_MSRP, value=1))
@@ -1,8 +1,11 @@
-from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, String, UniqueConstraint, text, Text, Enum
+from sqlalchemy import CHAR, CheckConstraint, Column, Date, DateTime, ForeignKey, String, UniqueConstraint, text, Text, \
+    Enum, LargeBinary, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.orm import relationship, declarative_base, deferred
+from sqlalchemy.orm.attributes import set_committed_value
 
 from common.domain.enum.AttributeType import AttributeType
+from common.domain.json.canonicalJson import decompressJson
 
 Base = declarative_base()
 
@@ -44,16 +47,49 @@ class Model(Base):
 class RawData(Base):
     __tablename__ = 'model_raw_config_data'
     __table_args__ = (
+        CheckConstraint('(raw_data IS NULL) <> (raw_data_archive IS NULL)'),
         UniqueConstraint('model_id', 'created_at'),
     )
 
     data_id = Column(UUID, primary_key=True, server_default=text("uuid_generate_v4()"))
-    raw_data = Column(JSONB(astext_type=Text()), nullable=False)
+    # null when archived, populated from raw_data_archive on load (see _loadArchivedRawData)
+    raw_data = Column(JSONB(astext_type=Text()))
+    raw_data_archive = Column(LargeBinary)
     model_id = Column(ForeignKey('model.model_id'), nullable=False)
-    created_at = Column(DateTime(True), nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    created_at = Column(DateTime(True), nullable=False, server_default=text("CURRENT_TIMESTAMP"), index=True)
+    content_hash = Column(CHAR(64))
+    subtree_hashes = deferred(Column(JSONB(astext_type=Text())))
 
     model = relationship('Model', back_populates='raw_data')
 
+@event.listens_for(RawData, 'load')
+@event.listens_for(RawData, 'refresh')
+def _loadArchivedRawData(rawData: RawData, *args) -> None:
+    # archived rows are read like hot rows, the decompressed value is not a pending change
+    if rawData.raw_data is None and rawData.raw_data_archive is not None:
+        set_committed_value(rawData, 'raw_data', decompressJson(rawData.raw_data_archive))
+
+class RawDataDiff(Base):
+    __tablename__ = 'model_raw_data_diff'
+    __table_args__ = (
+        UniqueConstraint('old_data_id', 'new_data_id'),
+    )
+
+    diff_id = Column(UUID, primary_key=True, server_default=text("uuid_generate_v4()"))
+    model_id = Column(ForeignKey('model.model_id', ondelete='CASCADE'), nullable=False, index=True)
+    old_data_id = Column(ForeignKey('model_raw_config_data.data_id', ondelete='CASCADE'), nullable=False)
+    new_data_id = Column(ForeignKey('model_raw_config_data.data_id', ondelete='CASCADE'), nullable=False)
+    changes = Column(JSONB(astext_type=Text()), nullable=False)
+    created_at = Column(DateTime(True), nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+
+class TransformState(Base):
+    __tablename__ = 'model_transform_state'
+
+    model_id = Column(ForeignKey('model.model_id', ondelete='CASCADE'), primary_key=True)
+    data_id = Column(ForeignKey('model_raw_config_data.data_id', ondelete='SET NULL'))
+    content_hash = Column(CHAR(64))
+    transformed_at = Column(DateTime(True), nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+
 class ModelAttribute(Base):
     __tablename__ = 'model_attribute'
     __table_args__ = (
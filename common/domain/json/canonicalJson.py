@@ -0,0 +1,39 @@
+import hashlib
+import json
+import zlib
+from typing import Any
+
+
+def canonicalDumps(data: Any) -> str:
+    """
+    Serializes ``data`` to a canonical JSON string: keys sorted, no insignificant whitespace, non-ascii characters
+    unescaped.  Equal JSON values always produce the same string (JSONB does not preserve key order).
+    :param data: a JSON serializable value
+    :return:
+    """
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def contentHash(data: Any) -> str:
+    """
+    :param data: a JSON serializable value
+    :return: hex encoded sha256 of the canonical JSON of ``data``
+    """
+    return hashlib.sha256(canonicalDumps(data).encode('utf-8')).hexdigest()
+
+
+def compressJson(data: Any) -> bytes:
+    """
+    :param data: a JSON serializable value
+    :return: zlib compressed canonical JSON of ``data``
+    """
+    return zlib.compress(canonicalDumps(data).encode('utf-8'))
+
+
+def decompressJson(compressed: bytes) -> Any:
+    """
+    Inverse of ``compressJson``.
+    :param compressed:
+    :return:
+    """
+    return json.loads(zlib.decompress(compressed).decode('utf-8'))
@@ -0,0 +1,134 @@
+import hashlib
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from common.domain.json.canonicalJson import canonicalDumps
+
+# bytes per subtree hash, 128 bits is ample to identify subtrees of one payload
+DIGEST_SIZE = 16
+
+ADD = 'add'
+REMOVE = 'remove'
+REPLACE = 'replace'
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _leafHash(value: Any) -> str:
+    return _hash(canonicalDumps(value).encode('utf-8'))
+
+
+def _childPointer(pointer: str, key: Any) -> str:
+    # RFC 6901 JSON pointer
+    return f"{pointer}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def _isContainer(value: Any) -> bool:
+    return isinstance(value, (dict, list))
+
+
+def _fillHashes(value: Any, pointer: str, hashes: Dict[str, str]) -> str:
+    if isinstance(value, dict):
+        childHashes = sorted((key, _fillHashes(child, _childPointer(pointer, key), hashes))
+                             for key, child in value.items())
+        digest = _hash(('{' + ','.join(f'{canonicalDumps(key)}:{childHash}' for key, childHash in childHashes))
+                       .encode('utf-8'))
+    elif isinstance(value, list):
+        childHashes = [_fillHashes(child, _childPointer(pointer, index), hashes) for index, child in enumerate(value)]
+        digest = _hash(('[' + ','.join(childHashes)).encode('utf-8'))
+    else:
+        return _leafHash(value)
+    hashes[pointer] = digest
+    return digest
+
+
+def subtreeHashes(data: Any) -> Dict[str, str]:
+    """
+    Computes a Merkle hash of every object and array in ``data``, bottom up in a single traversal.  Equal subtrees
+    have equal hashes regardless of key order.
+    :param data: a JSON value
+    :return: hash by JSON pointer (``''`` is the root), scalars are not included
+    """
+    hashes = dict()
+    _fillHashes(data, '', hashes)
+    return hashes
+
+
+class _JsonDiff:
+
+    def __init__(self, oldHashes: Dict[str, str], newHashes: Dict[str, str]):
+        self.oldHashes = oldHashes
+        self.newHashes = newHashes
+        self.changes = list()
+
+    def _add(self, pointer: str, value: Any) -> None:
+        self.changes.append({'op': ADD, 'path': pointer, 'new': value})
+
+    def _remove(self, pointer: str, value: Any) -> None:
+        self.changes.append({'op': REMOVE, 'path': pointer, 'old': value})
+
+    def _oldHash(self, value: Any, pointer: str) -> str:
+        return self.oldHashes[pointer] if _isContainer(value) else _leafHash(value)
+
+    def _newHash(self, value: Any, pointer: str) -> str:
+        return self.newHashes[pointer] if _isContainer(value) else _leafHash(value)
+
+    def diff(self, old: Any, new: Any, oldPointer: str, newPointer: str) -> None:
+        if isinstance(old, dict) and isinstance(new, dict):
+            if self.oldHashes[oldPointer] != self.newHashes[newPointer]:
+                self._diffDict(old, new, oldPointer, newPointer)
+        elif isinstance(old, list) and isinstance(new, list):
+            if self.oldHashes[oldPointer] != self.newHashes[newPointer]:
+                self._diffList(old, new, oldPointer, newPointer)
+        elif type(old) is not type(new) or old != new:
+            self.changes.append({'op': REPLACE, 'path': newPointer, 'old': old, 'new': new})
+
+    def _diffDict(self, old: Dict, new: Dict, oldPointer: str, newPointer: str) -> None:
+        for key in sorted(old.keys() | new.keys()):
+            if key not in new:
+                self._remove(_childPointer(oldPointer, key), old[key])
+            elif key not in old:
+                self._add(_childPointer(newPointer, key), new[key])
+            else:
+                self.diff(old[key], new[key], _childPointer(oldPointer, key), _childPointer(newPointer, key))
+
+    def _diffList(self, old: List, new: List, oldPointer: str, newPointer: str) -> None:
+        # elements present, unchanged, in both lists are matched by hash (moves are not reported), the remaining
+        # elements are paired in order and diffed, any surplus is added or removed
+        unmatchedOldByHash = dict()
+        for index, element in enumerate(old):
+            unmatchedOldByHash.setdefault(self._oldHash(element, _childPointer(oldPointer, index)), deque()).append(index)
+        unmatchedNew = list()
+        for index, element in enumerate(new):
+            if candidates := unmatchedOldByHash.get(self._newHash(element, _childPointer(newPointer, index))):
+                candidates.popleft()
+            else:
+                unmatchedNew.append(index)
+        unmatchedOld = sorted(index for indices in unmatchedOldByHash.values() for index in indices)
+        for oldIndex, newIndex in zip(unmatchedOld, unmatchedNew):
+            self.diff(old[oldIndex], new[newIndex], _childPointer(oldPointer, oldIndex),
+                      _childPointer(newPointer, newIndex))
+        for oldIndex in unmatchedOld[len(unmatchedNew):]:
+            self._remove(_childPointer(oldPointer, oldIndex), old[oldIndex])
+        for newIndex in unmatchedNew[len(unmatchedOld):]:
+            self._add(_childPointer(newPointer, newIndex), new[newIndex])
+
+
+def diffJson(old: Any, new: Any, oldHashes: Optional[Dict[str, str]] = None,
+             newHashes: Optional[Dict[str, str]] = None) -> List[Dict]:
+    """
+    Structural diff of two JSON values.  Subtrees with equal hashes are skipped without being walked, so passing
+    precomputed ``subtreeHashes`` makes the cost proportional to the size of the changed subtrees.
+    :param old:
+    :param new:
+    :param oldHashes: ``subtreeHashes(old)``, computed if not provided
+    :param newHashes: ``subtreeHashes(new)``, computed if not provided
+    :return: changes ``{'op': 'add' | 'remove' | 'replace', 'path': JSON pointer, 'old': value, 'new': value}``,
+    ``path`` refers to ``old`` for removals and ``new`` otherwise
+    """
+    differ = _JsonDiff(oldHashes=subtreeHashes(old) if oldHashes is None else oldHashes,
+                       newHashes=subtreeHashes(new) if newHashes is None else newHashes)
+    differ.diff(old, new, '', '')
+    return differ.changes
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from common.domain.json.canonicalJson import canonicalDumps, contentHash, compressJson, decompressJson
+
+
+class TestCanonicalJson(TestCase):
+
+    def test_canonicalDumpsIgnoresKeyOrder(self):
+        self.assertEqual(canonicalDumps({'b': [1, {'d': 2, 'c': 3}], 'a': 'é'}),
+                         canonicalDumps({'a': 'é', 'b': [1, {'c': 3, 'd': 2}]}))
+        self.assertEqual('{"a":"é","b":[1,{"c":3,"d":2}]}', canonicalDumps({'b': [1, {'d': 2, 'c': 3}], 'a': 'é'}))
+
+    def test_contentHashDetectsChanges(self):
+        self.assertEqual(contentHash({'a': 1, 'b': 2}), contentHash({'b': 2, 'a': 1}))
+        self.assertNotEqual(contentHash({'a': [1, 2]}), contentHash({'a': [2, 1]}))
+        self.assertEqual(64, len(contentHash({})))
+
+    def test_compressJsonRoundTrips(self):
+        data = {'model': [{'name': 'Camry', 'price': 26420, 'options': ['a'] * 100}], 'year': 2023}
+        compressed = compressJson(data)
+        self.assertLess(len(compressed), len(canonicalDumps(data)))
+        self.assertEqual(data, decompressJson(compressed))
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from common.domain.json.jsonDiff import subtreeHashes, diffJson
+
+
+class TestJsonDiff(TestCase):
+
+    def test_subtreeHashesIgnoreKeyOrder(self):
+        old = {'model': [{'code': 'camry', 'price': 100}], 'year': 2023}
+        new = {'year': 2023, 'model': [{'price': 100, 'code': 'camry'}]}
+        self.assertEqual(subtreeHashes(old), subtreeHashes(new))
+        self.assertEqual({'', '/model', '/model/0'}, subtreeHashes(old).keys())
+
+    def test_subtreeHashesDetectChanges(self):
+        old = subtreeHashes({'a': {'b': [1, 2]}, 'c': {'d': 1}})
+        new = subtreeHashes({'a': {'b': [1, 3]}, 'c': {'d': 1}})
+        self.assertNotEqual(old['/a/b'], new['/a/b'])
+        self.assertEqual(old['/c'], new['/c'])
+
+    def test_diffJsonEqual(self):
+        self.assertEqual([], diffJson({'a': [1, {'b': 2}]}, {'a': [1, {'b': 2}]}))
+
+    def test_diffJsonDict(self):
+        old = {'price': 100, 'name': 'Camry', 'colors': {'red': 1}}
+        new = {'price': 110, 'name': 'Camry', 'grades': ['LE']}
+        expected = [{'op': 'remove', 'path': '/colors', 'old': {'red': 1}},
+                    {'op': 'add', 'path': '/grades', 'new': ['LE']},
+                    {'op': 'replace', 'path': '/price', 'old': 100, 'new': 110}]
+        self.assertEqual(expected, diffJson(old, new))
+
+    def test_diffJsonListMatchesUnchangedElements(self):
+        old = {'options': [{'code': 'A', 'price': 1}, {'code': 'B', 'price': 2}, {'code': 'C', 'price': 3}]}
+        new = {'options': [{'code': 'Z', 'price': 9}, {'code': 'A', 'price': 1}, {'code': 'C', 'price': 4}]}
+        expected = [{'op': 'replace', 'path': '/options/0/code', 'old': 'B', 'new': 'Z'},
+                    {'op': 'replace', 'path': '/options/0/price', 'old': 2, 'new': 9},
+                    {'op': 'replace', 'path': '/options/2/price', 'old': 3, 'new': 4}]
+        self.assertEqual(expected, diffJson(old, new))
+
+    def test_diffJsonListSurplus(self):
+        self.assertEqual([{'op': 'add', 'path': '/2', 'new': 3}], diffJson([1, 2], [1, 2, 3]))
+        self.assertEqual([{'op': 'remove', 'path': '/0', 'old': 1}], diffJson([1, 2], [2]))
+
+    def test_diffJsonTypeChange(self):
+        self.assertEqual([{'op': 'replace', 'path': '/a', 'old': 1, 'new': True}], diffJson({'a': 1}, {'a': True}))
+        self.assertEqual([{'op': 'replace', 'path': '/a', 'old': [1], 'new': {'0': 1}}],
+                         diffJson({'a': [1]}, {'a': {'0': 1}}))
+
+    def test_diffJsonEscapesPointers(self):
+        self.assertEqual([{'op': 'replace', 'path': '/a~1b~0c', 'old': 1, 'new': 2}],
+                         diffJson({'a/b~c': 1}, {'a/b~c': 2}))
+
+    def test_diffJsonSkipsSubtreesWithEqualHashes(self):
+        old, new = {'a': {'b': 1}}, {'a': {'b': 2}}
+        # hashes claim the subtree is unchanged, so it isn't walked
+        self.assertEqual([], diffJson(old, new, oldHashes=subtreeHashes(old), newHashes=subtreeHashes(old)))
@@ -1,6 +1,8 @@
 import uuid
 from datetime import date
+from typing import Iterable, Set, NamedTuple
 
+from sqlalchemy import delete, insert, update, bindparam, func
 from sqlalchemy.orm import Session
 
 from common.domain.dto.AttributeDto import *
@@ -8,6 +10,12 @@ from common.domain.entities import ModelAttribute, Model
 from common.repository.ModelRepository import modelRepository
 
 
+class AttributeSyncResult(NamedTuple):
+    inserted: int
+    updated: int
+    deleted: int
+
+
 class ModelAttributeRepository:
 
     def __init__(self):
@@ -26,6 +34,70 @@ class ModelAttributeRepository:
             raise ValueError('A Model ID or a Model Entity must be provided')
         session.add(modelAttribute)
 
+    def insertMany(self, modelAttributes: List[ModelAttribute], session: Session) -> None:
+        """
+        Inserts new attributes with a single multi-row ``INSERT``.  The database generates ``attribute_id`` and
+        ``updated_at``, the entities are not added to the session.
+        :param modelAttributes: transient entities with ``model_id`` set
+        :param session:
+        :return:
+        """
+        if not modelAttributes:
+            return
+        if not all(modelAttribute.model_id for modelAttribute in modelAttributes):
+            raise ValueError('A Model ID must be provided')
+        session.execute(insert(ModelAttribute).values(
+            [{'attribute_type': modelAttribute.attribute_type, 'title': modelAttribute.title,
+              'model_id': str(modelAttribute.model_id), 'attribute_metadata': modelAttribute.attribute_metadata}
+             for modelAttribute in modelAttributes]))
+
+    def sync(self, modelIds: Iterable['uuid'], modelAttributes: List[ModelAttribute],
+             session: Session) -> AttributeSyncResult:
+        """
+        Makes the attributes of the models equal to ``modelAttributes``, matching rows on ``model_attribute_no_dups``
+        ``(attribute_type, title, model_id)``: new attributes are inserted, attributes whose metadata changed are
+        updated (with ``updated_at``) and attributes no longer present are deleted.  Unchanged rows are not written.
+        Each kind of change is a single statement, entities already loaded in the session are not updated.
+        :param modelIds: models being synced, a model without attributes in ``modelAttributes`` loses all of its
+        attributes
+        :param modelAttributes: transient entities with ``model_id`` set, for a repeated key the last wins
+        :param session:
+        :return:
+        """
+        modelIds = [str(modelId) for modelId in modelIds]
+        if not all(modelAttribute.model_id for modelAttribute in modelAttributes):
+            raise ValueError('A Model ID must be provided')
+        newByKey = {(modelAttribute.attribute_type, modelAttribute.title, str(modelAttribute.model_id)): modelAttribute
+                    for modelAttribute in modelAttributes}
+        existing = session.query(ModelAttribute.attribute_id, ModelAttribute.attribute_type, ModelAttribute.title,
+                                 ModelAttribute.model_id, ModelAttribute.attribute_metadata)\
+            .where(ModelAttribute.model_id.in_(modelIds)).all()
+        existingKeys = set()
+        updates = list()
+        deletedIds = list()
+        for attributeId, attributeType, title, modelId, metadata in existing:
+            existingKeys.add((attributeType, title, modelId))
+            if (modelAttribute := newByKey.get((attributeType, title, modelId))) is None:
+                deletedIds.append(attributeId)
+            elif modelAttribute.attribute_metadata != metadata:
+                updates.append({'b_attribute_id': attributeId,
+                                'b_attribute_metadata': modelAttribute.attribute_metadata})
+        inserts = [modelAttribute for key, modelAttribute in newByKey.items() if key not in existingKeys]
+        if deletedIds:
+            session.execute(delete(ModelAttribute).where(ModelAttribute.attribute_id.in_(deletedIds))
+                            .execution_options(synchronize_session=False))
+        if updates:
+            table = ModelAttribute.__table__
+            session.execute(update(table).where(table.c.attribute_id == bindparam('b_attribute_id'))
+                            .values(attribute_metadata=bindparam('b_attribute_metadata'), updated_at=func.now()),
+                            updates)
+        self.insertMany(modelAttributes=inserts, session=session)
+        return AttributeSyncResult(inserted=len(inserts), updated=len(updates), deleted=len(deletedIds))
+
+    def getModelIdsWithAttributes(self, modelIds: Iterable['uuid'], session: Session) -> Set[str]:
+        return {modelId for modelId, in session.query(ModelAttribute.model_id).distinct()
+                .where(ModelAttribute.model_id.in_([str(modelId) for modelId in modelIds]))}
+
     def getAttributesFor(self, brandName: str, modelName: str, modelYear: date, session: Session) -> ModelAttribute:
         return self._getModel(brandName=brandName, modelName=modelName, modelYear=modelYear,
                               session=session).model_attribute
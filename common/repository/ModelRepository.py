@@ -39,6 +39,9 @@ class ModelRepository:
             modelId = str(modelId)
         return session.query(Model).where(Model.model_id==modelId).first()
 
+    def getModelsByModelIds(self, modelIds: Iterable[UUID | str], session: 'Session') -> List['Model']:
+        return session.query(Model).where(Model.model_id.in_([str(modelId) for modelId in modelIds])).all()
+
     def getMostRecentModel(self, brandName: str, modelName: str, session: 'Session') -> 'Model':
         stmt = select(Model).outerjoin(Brand).where(
             brandName == Brand.name, modelName == Model.name).order_by(desc(Model.model_year) ).limit(1)
@@ -0,0 +1,54 @@
+from typing import *
+from uuid import UUID
+
+from sqlalchemy import desc, func
+from sqlalchemy.orm import Session
+
+from common.domain.entities import RawDataDiff, RawData
+
+
+class RawDataDiffRepository:
+
+    def __init__(self):
+        pass
+
+    def insert(self, rawDataDiff: 'RawDataDiff', session: 'Session') -> None:
+        if not (rawDataDiff.model_id and rawDataDiff.old_data_id and rawDataDiff.new_data_id):
+            raise ValueError('A Model ID, old Data ID and new Data ID must be provided.')
+        session.add(rawDataDiff)
+
+    def getByDataIds(self, oldDataId: UUID | str, newDataId: UUID | str, session: 'Session') -> Optional['RawDataDiff']:
+        return session.query(RawDataDiff).where(RawDataDiff.old_data_id == str(oldDataId),
+                                                RawDataDiff.new_data_id == str(newDataId)).first()
+
+    def getDiffsFor(self, modelId: UUID | str, session: 'Session') -> List['RawDataDiff']:
+        return session.query(RawDataDiff).where(RawDataDiff.model_id == str(modelId))\
+            .order_by(desc(RawDataDiff.created_at)).all()
+
+    def getDiffsContaining(self, change: Dict, session: 'Session') -> Iterator['RawDataDiff']:
+        """
+        Uses the GIN index on ``changes``.
+        :param change: partial change to match, i.e. ``{'op': 'replace', 'path': '/model/0/price'}``
+        :param session:
+        :return: diffs with at least one change containing all items of ``change``
+        """
+        return session.query(RawDataDiff).where(RawDataDiff.changes.contains([change]))
+
+    def getUndiffedPairs(self, session: 'Session') -> List[Tuple[str, str, str]]:
+        """
+        :param session:
+        :return: ``(model_id, old_data_id, new_data_id)`` of each model's two most recent raw data rows, for models
+        with at least two rows and no diff stored for the pair
+        """
+        ranked = session.query(RawData.model_id, RawData.data_id, func.row_number().over(
+            partition_by=RawData.model_id, order_by=desc(RawData.created_at)).label('rank')).subquery()
+        newest = ranked.alias('newest')
+        previous = ranked.alias('previous')
+        query = session.query(newest.c.model_id, previous.c.data_id, newest.c.data_id)\
+            .join(previous, newest.c.model_id == previous.c.model_id)\
+            .outerjoin(RawDataDiff, (RawDataDiff.old_data_id == previous.c.data_id) &
+                       (RawDataDiff.new_data_id == newest.c.data_id))\
+            .where(newest.c.rank == 1, previous.c.rank == 2, RawDataDiff.diff_id.is_(None))
+        return [tuple(row) for row in query]
+
+rawDataDiffRepository = RawDataDiffRepository()
@@ -1,15 +1,23 @@
-from datetime import date
+from datetime import date, datetime
 from typing import *
 from uuid import UUID
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, func, and_, null, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import Select
 
-from common.domain.entities import RawData, Model
+from common.domain.dto.RawDataDto import RawDataDto
+from common.domain.entities import RawData, Model, Brand
+from common.domain.json.canonicalJson import contentHash, compressJson, decompressJson
 from common.repository.ModelRepository import modelRepository
 
 
 class RawDataRepository:
+    # number of rows loaded and compressed at a time by archiveAllButMostRecent
+    ARCHIVE_BATCH_SIZE = 100
+    # rows buffered per round trip by streamRawDataDtos
+    STREAM_FETCH_SIZE = 500
 
     def __init__(self):
         pass
@@ -27,15 +35,66 @@ class RawDataRepository:
     def getByDataId(self, dataId: UUID, session: 'Session') -> RawData:
         return session.query(RawData).where(RawData.data_id==dataId).first()
 
+    def getSummaryByDataId(self, dataId: UUID | str, session: 'Session') -> Optional['Row']:
+        """
+        :param dataId:
+        :param session:
+        :return: ``(data_id, model_id, created_at, content_hash)`` without loading the payload
+        """
+        return session.query(RawData.data_id, RawData.model_id, RawData.created_at, RawData.content_hash)\
+            .where(RawData.data_id == str(dataId)).first()
+
+    def getSummariesByDataIds(self, dataIds: Iterable[UUID | str], session: 'Session') -> List['Row']:
+        return session.query(RawData.data_id, RawData.model_id, RawData.created_at, RawData.content_hash)\
+            .where(RawData.data_id.in_([str(dataId) for dataId in dataIds])).all()
+
+    def getByDataIdsWithModelAndBrand(self, dataIds: Iterable[UUID | str], session: 'Session') -> List['RawData']:
+        """
+        :param dataIds:
+        :param session:
+        :return: raw data with ``model`` and ``model.brand`` loaded by the same query, in no particular order
+        """
+        return session.query(RawData).options(joinedload(RawData.model).joinedload(Model.brand))\
+            .where(RawData.data_id.in_([str(dataId) for dataId in dataIds])).all()
+
     def insertDataBy(self, data: Dict, brandName: str, modelName: str, modelYear: date, session: 'Session') -> None:
         model = self._getModel(brandName=brandName, modelName=modelName, modelYear=modelYear, session=session)
-        model.raw_data.append(RawData(raw_data=data, model_id=model.model_id) )
+        model.raw_data.append(RawData(raw_data=data, model_id=model.model_id, content_hash=contentHash(data)) )
 
     def insert(self, rawData: 'RawData', session : 'Session') -> None:
         if not rawData.model_id and not rawData.model:
             raise ValueError('A Model ID or a Model Entity must be provided.')
+        if rawData.content_hash is None:
+            rawData.content_hash = contentHash(rawData.raw_data)
         session.add(rawData)
 
+    def _getMostRecentHash(self, modelId: UUID | str, session: 'Session') -> Optional[str]:
+        # avoids loading raw_data unless the most recent row predates content hashing
+        found = session.query(RawData.data_id, RawData.content_hash).where(RawData.model_id == str(modelId))\
+            .order_by(desc(RawData.created_at)).first()
+        if not found:
+            return None
+        if found.content_hash is None:
+            mostRecent = self.getByDataId(dataId=found.data_id, session=session)
+            mostRecent.content_hash = contentHash(mostRecent.raw_data)  # backfill
+            return mostRecent.content_hash
+        return found.content_hash
+
+    def insertIfChanged(self, rawData: 'RawData', session: 'Session') -> bool:
+        """
+        Inserts ``rawData`` unless its content is identical to the most recent raw data of the same model.
+        :param rawData: must reference a model by ``model_id``
+        :param session:
+        :return: ``True`` if inserted, ``False`` if the content was unchanged
+        """
+        if not rawData.model_id:
+            raise ValueError('A Model ID must be provided.')
+        rawData.content_hash = contentHash(rawData.raw_data)
+        if rawData.content_hash == self._getMostRecentHash(modelId=rawData.model_id, session=session):
+            return False
+        self.insert(rawData=rawData, session=session)
+        return True
+
     def getDataFor(self, brandName: str, modelName: str, modelYear:date, session: 'Session') -> Iterator['RawData']:
         return self._getModel(brandName=brandName, modelName=modelName, modelYear=modelYear, session=session).raw_data
 
@@ -48,5 +107,73 @@ class RawDataRepository:
         for record in toDel:
             session.delete(record)
 
+    def archiveAllButMostRecent(self, session: 'Session', olderThan: Optional[datetime] = None) -> int:
+        """
+        Moves the raw data of every snapshot except each model's most recent into the compressed
+        ``raw_data_archive`` column.  Archived rows are read like any other, ``raw_data`` is decompressed on load.
+        Changes are flushed, the caller commits.
+        :param session:
+        :param olderThan: only archive snapshots created before this time
+        :return: number of snapshots archived
+        """
+        newest = session.query(RawData.model_id, func.max(RawData.created_at).label('created_at'))\
+            .group_by(RawData.model_id).subquery()
+        query = session.query(RawData.data_id).outerjoin(
+            newest, and_(RawData.model_id == newest.c.model_id, RawData.created_at == newest.c.created_at))\
+            .where(newest.c.model_id.is_(None), RawData.raw_data_archive.is_(None))
+        if olderThan is not None:
+            query = query.where(RawData.created_at < olderThan)
+        dataIds = [dataId for dataId, in query]
+        for start in range(0, len(dataIds), self.ARCHIVE_BATCH_SIZE):
+            batch = session.query(RawData).where(RawData.data_id.in_(dataIds[start:start + self.ARCHIVE_BATCH_SIZE])).all()
+            for rawData in batch:
+                rawData.raw_data_archive = compressJson(rawData.raw_data)
+                rawData.raw_data = null()  # SQL NULL, None would be stored as JSON null
+            session.flush()
+            for rawData in batch:
+                session.expunge(rawData)  # release payloads
+        return len(dataIds)
+
+    def _streamRawDataDtos(self, statement: 'Select', fetchSize: int, session: 'Session') -> Iterator[RawDataDto]:
+        for row in session.execute(statement.execution_options(stream_results=True, yield_per=fetchSize)):
+            rawData = row.raw_data if row.raw_data_archive is None else decompressJson(row.raw_data_archive)
+            yield RawDataDto(dataId=row.data_id, rawData=rawData, modelId=row.model_id, createdAt=row.created_at)
+
+    def streamRawDataDtos(self, session: 'Session', brandName: Optional[str] = None, startYear: Optional[int] = None,
+                          endYear: Optional[int] = None, createdAfter: Optional[datetime] = None,
+                          createdBefore: Optional[datetime] = None,
+                          fetchSize: int = STREAM_FETCH_SIZE) -> Iterator[RawDataDto]:
+        """
+        Streams raw data, oldest first, through a server side cursor holding at most ``fetchSize`` rows in memory.
+        Columns are selected rather than entities so the session's identity map does not grow with the scan.  The
+        session must stay open while iterating.
+        :param session:
+        :param brandName: only raw data of this brand's models
+        :param startYear: first model year, inclusive
+        :param endYear: last model year, inclusive
+        :param createdAfter: exclusive
+        :param createdBefore: exclusive
+        :param fetchSize: rows fetched per round trip
+        :return:
+        """
+        if fetchSize < 1:
+            raise ValueError(f"fetchSize must be >= 1, received: {fetchSize}")
+        statement = select(RawData.data_id, RawData.raw_data, RawData.raw_data_archive, RawData.model_id,
+                           RawData.created_at)
+        if brandName is not None or startYear is not None or endYear is not None:
+            statement = statement.join(Model, RawData.model_id == Model.model_id)
+        if brandName is not None:
+            statement = statement.join(Brand, Model.brand_id == Brand.brand_id).where(Brand.name == brandName)
+        if startYear is not None:
+            statement = statement.where(Model.model_year >= date(startYear, 1, 1))
+        if endYear is not None:
+            statement = statement.where(Model.model_year <= date(endYear, 1, 1))
+        if createdAfter is not None:
+            statement = statement.where(RawData.created_at > createdAfter)
+        if createdBefore is not None:
+            statement = statement.where(RawData.created_at < createdBefore)
+        statement = statement.order_by(RawData.created_at, RawData.data_id)
+        return self._streamRawDataDtos(statement=statement, fetchSize=fetchSize, session=session)
+
 rawDataRepository = RawDataRepository()
 
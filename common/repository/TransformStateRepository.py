@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import *
+from uuid import UUID
+
+from sqlalchemy import desc, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from common.domain.entities import RawData, TransformState
+
+
+class TransformStateRepository:
+
+    def __init__(self):
+        pass
+
+    def getByModelId(self, modelId: UUID | str, session: 'Session') -> Optional['TransformState']:
+        return session.get(TransformState, str(modelId))
+
+    def getByModelIds(self, modelIds: Iterable[UUID | str], session: 'Session') -> List['TransformState']:
+        return session.query(TransformState)\
+            .where(TransformState.model_id.in_([str(modelId) for modelId in modelIds])).all()
+
+    def upsert(self, modelId: UUID | str, dataId: UUID | str, contentHash: Optional[str], session: 'Session') -> None:
+        """
+        Records ``dataId`` as the raw data the model's current attributes were transformed from.
+        :param modelId:
+        :param dataId:
+        :param contentHash: ``RawData.content_hash`` of ``dataId``
+        :param session:
+        :return:
+        """
+        self.upsertMany([(modelId, dataId, contentHash)], session=session)
+
+    def upsertMany(self, states: List[Tuple[UUID | str, UUID | str, Optional[str]]], session: 'Session') -> None:
+        """
+        ``upsert`` of several models in a single statement.
+        :param states: ``(modelId, dataId, contentHash)`` at most one per model
+        :param session:
+        :return:
+        """
+        if not states:
+            return
+        statement = insert(TransformState).values(
+            [{'model_id': str(modelId), 'data_id': str(dataId), 'content_hash': contentHash}
+             for modelId, dataId, contentHash in states])
+        statement = statement.on_conflict_do_update(
+            index_elements=[TransformState.model_id],
+            set_={'data_id': statement.excluded.data_id, 'content_hash': statement.excluded.content_hash,
+                  'transformed_at': func.now()})
+        session.execute(statement)
+
+    def getPending(self, session: 'Session', since: Optional[datetime] = None) -> List['Row']:
+        """
+        Finds each model's most recent raw data when the model's attributes have not been transformed from it: the
+        model was never transformed, or was transformed from another row with different (or unknown) content.
+        :param session:
+        :param since: watermark, only rows created after it are considered (uses the ``created_at`` index)
+        :return: ``(data_id, model_id, created_at)`` oldest first
+        """
+        latest = session.query(RawData.data_id, RawData.model_id, RawData.content_hash, RawData.created_at)\
+            .distinct(RawData.model_id).order_by(RawData.model_id, desc(RawData.created_at))
+        if since is not None:
+            latest = latest.where(RawData.created_at > since)
+        latest = latest.subquery()
+        contentChanged = or_(TransformState.content_hash.is_(None), latest.c.content_hash.is_(None),
+                             TransformState.content_hash != latest.c.content_hash)
+        query = session.query(latest.c.data_id, latest.c.model_id, latest.c.created_at)\
+            .outerjoin(TransformState, TransformState.model_id == latest.c.model_id)\
+            .where(or_(TransformState.model_id.is_(None),
+                       TransformState.data_id.is_distinct_from(latest.c.data_id) & contentChanged))\
+            .order_by(latest.c.created_at)
+        return query.all()
+
+
+transformStateRepository = TransformStateRepository()
@@ -28,26 +28,72 @@ CREATE TABLE IF NOT EXISTS public.model (
 
 CREATE TABLE IF NOT EXISTS public.model_raw_config_data (
 	data_id uuid NOT NULL PRIMARY KEY DEFAULT uuid_generate_v4(),
-	raw_data jsonb NOT NULL,
+	-- older snapshots are archived: raw_data is moved, zlib compressed, to raw_data_archive
+	raw_data jsonb,
+	raw_data_archive bytea,
 	model_id uuid NOT NULL REFERENCES public.model NOT NULL,
 	created_at timestamptz NOT NULL DEFAULT current_timestamp,
-	CONSTRAINT model_raw_config_no_dups UNIQUE (model_id,created_at)
+	-- sha256 of the canonical json of raw_data, null for rows written before hashing
+	content_hash char(64),
+	-- merkle hash of each object/array in raw_data by json pointer, computed when first diffed
+	subtree_hashes jsonb,
+	CONSTRAINT model_raw_config_no_dups UNIQUE (model_id,created_at),
+	CONSTRAINT raw_data_xor_archive CHECK ( (raw_data IS NULL) <> (raw_data_archive IS NULL) )
 );
 
-CREATE TYPE public.attribute_type AS ENUM (
-	'ENGINE',
-    'TRANSMISSION',
-    'DRIVE',
-    'BODY_STYLE',
-    'GRADE',
-    'PACKAGE',
-    'INTERIOR_COLOR',
-    'EXTERIOR_COLOR',
-    'ACCESSORY',
-    'OPTION',
-    'OTHER'
+-- brings databases created from an earlier version of this file up to date
+ALTER TABLE public.model_raw_config_data ADD COLUMN IF NOT EXISTS content_hash char(64);
+ALTER TABLE public.model_raw_config_data ADD COLUMN IF NOT EXISTS subtree_hashes jsonb;
+ALTER TABLE public.model_raw_config_data ADD COLUMN IF NOT EXISTS raw_data_archive bytea;
+ALTER TABLE public.model_raw_config_data ALTER COLUMN raw_data DROP NOT NULL;
+
+DO $$
+BEGIN
+	IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'raw_data_xor_archive') THEN
+		ALTER TABLE public.model_raw_config_data
+			ADD CONSTRAINT raw_data_xor_archive CHECK ( (raw_data IS NULL) <> (raw_data_archive IS NULL) );
+	END IF;
+END
+$$;
+
+-- supports incremental transforms, which only scan rows created after the last run's watermark
+CREATE INDEX IF NOT EXISTS model_raw_config_data_created_at_idx ON public.model_raw_config_data (created_at);
+
+CREATE TABLE IF NOT EXISTS public.model_raw_data_diff (
+	diff_id uuid NOT NULL PRIMARY KEY DEFAULT uuid_generate_v4(),
+	model_id uuid NOT NULL REFERENCES public.model ON DELETE CASCADE,
+	old_data_id uuid NOT NULL REFERENCES public.model_raw_config_data ON DELETE CASCADE,
+	new_data_id uuid NOT NULL REFERENCES public.model_raw_config_data ON DELETE CASCADE,
+	-- [{"op": "add" | "remove" | "replace", "path": json pointer, "old": value, "new": value}, ...]
+	changes jsonb NOT NULL,
+	created_at timestamptz NOT NULL DEFAULT current_timestamp,
+	CONSTRAINT model_raw_data_diff_no_dups UNIQUE (old_data_id, new_data_id)
 );
 
+CREATE INDEX IF NOT EXISTS model_raw_data_diff_model_id_idx ON public.model_raw_data_diff (model_id);
+CREATE INDEX IF NOT EXISTS model_raw_data_diff_changes_idx ON public.model_raw_data_diff USING gin (changes jsonb_path_ops);
+
+-- postgres has no CREATE TYPE IF NOT EXISTS, so that this file can be re-run to apply the statements above
+DO $$
+BEGIN
+	CREATE TYPE public.attribute_type AS ENUM (
+		'ENGINE',
+		'TRANSMISSION',
+		'DRIVE',
+		'BODY_STYLE',
+		'GRADE',
+		'PACKAGE',
+		'INTERIOR_COLOR',
+		'EXTERIOR_COLOR',
+		'ACCESSORY',
+		'OPTION',
+		'OTHER'
+	);
+EXCEPTION
+	WHEN duplicate_object THEN NULL;
+END
+$$;
+
 CREATE TABLE IF NOT EXISTS public.model_attribute (
 	attribute_id uuid NOT NULL DEFAULT uuid_generate_v4(),
 	attribute_type attribute_type NOT NULL,
@@ -56,4 +102,12 @@ CREATE TABLE IF NOT EXISTS public.model_attribute (
 	attribute_metadata jsonb NOT NULL,
 	updated_at timestamptz NOT NULL DEFAULT current_timestamp,
 	CONSTRAINT model_attribute_no_dups UNIQUE(attribute_type, title, model_id)
-);
\ No newline at end of file
+);
+
+-- the raw data row a model's current attributes were transformed from
+CREATE TABLE IF NOT EXISTS public.model_transform_state (
+	model_id uuid NOT NULL PRIMARY KEY REFERENCES public.model ON DELETE CASCADE,
+	data_id uuid REFERENCES public.model_raw_config_data ON DELETE SET NULL,
+	content_hash char(64),
+	transformed_at timestamptz NOT NULL DEFAULT current_timestamp
+);
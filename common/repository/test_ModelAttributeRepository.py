@@ -1,3 +1,4 @@
+import uuid
 from datetime import date
 from unittest import TestCase
 
@@ -87,3 +88,50 @@ class TestModelAttributeRepository(TestCase):
             foundAttributes = set(
                 modelAttributeRepository.getAttributesByAttributeId(attributeIds=queryIds, session=session))
             self.assertEqual(expectedAttributes, foundAttributes)
+
+    def test_insertMany(self) -> None:
+        with sessionFactory.newSession() as session:
+            camry2022 = modelAttributeRepository._getModel(brandName='Toyota', modelName="Camry",
+                                                           modelYear=date(2022, 1, 1), session=session)
+            newAttributes = [ModelAttribute(model_id=camry2022.model_id, attribute_type=AttributeType.GRADE,
+                                            title=title, attribute_metadata={'starting_msrp': 27_760})
+                             for title in ("SE", "XSE")]
+            modelAttributeRepository.insertMany(modelAttributes=newAttributes, session=session)
+            session.commit()
+            foundTitles = {attribute.title for attribute in
+                           modelAttributeRepository.getAttributesByModelId(modelId=camry2022.model_id, session=session)}
+            self.assertEqual({"LE", "SE", "XSE"}, foundTitles)
+
+    def test_getModelIdsWithAttributes(self) -> None:
+        with sessionFactory.newSession() as session:
+            camry2023 = modelAttributeRepository._getModel(brandName='Toyota', modelName="Camry",
+                                                           modelYear=date(2023, 1, 1), session=session)
+            camry2022 = modelAttributeRepository._getModel(brandName='Toyota', modelName="Camry",
+                                                           modelYear=date(2022, 1, 1), session=session)
+            modelIds = [camry2023.model_id, camry2022.model_id]
+            self.assertEqual(set(modelIds), modelAttributeRepository.getModelIdsWithAttributes(
+                modelIds=modelIds + [str(uuid.uuid4())], session=session))
+
+    def test_sync(self) -> None:
+        with sessionFactory.newSession() as session:
+            camry2023 = modelAttributeRepository._getModel(brandName='Toyota', modelName="Camry",
+                                                           modelYear=date(2023, 1, 1), session=session)
+            before = {attribute.title: (attribute.attribute_id, attribute.updated_at)
+                      for attribute in camry2023.model_attribute}
+            modelAttributes = [
+                ModelAttribute(model_id=camry2023.model_id, attribute_type=AttributeType.GRADE, title="LE",
+                               attribute_metadata={'starting_msrp': 26_220}),  # unchanged
+                ModelAttribute(model_id=camry2023.model_id, attribute_type=AttributeType.GRADE, title="LE Hybrid",
+                               attribute_metadata={'starting_msrp': 28_855}),  # changed
+                ModelAttribute(model_id=camry2023.model_id, attribute_type=AttributeType.GRADE, title="SE",
+                               attribute_metadata={'starting_msrp': 27_760})]  # new
+            result = modelAttributeRepository.sync(modelIds=[camry2023.model_id], modelAttributes=modelAttributes,
+                                                   session=session)
+            session.commit()
+            self.assertEqual((1, 1, 2), result)
+            session.expire_all()
+            after = {attribute.title: attribute for attribute in camry2023.model_attribute}
+        self.assertEqual({"LE", "LE Hybrid", "SE"}, after.keys())
+        self.assertEqual(before["LE"], (after["LE"].attribute_id, after["LE"].updated_at), "unchanged row untouched")
+        self.assertEqual(before["LE Hybrid"][0], after["LE Hybrid"].attribute_id, "changed row updated in place")
+        self.assertEqual({'starting_msrp': 28_855}, after["LE Hybrid"].attribute_metadata)
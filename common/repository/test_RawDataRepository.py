@@ -3,6 +3,7 @@ import uuid
 from unittest import TestCase
 
 from common.domain.entities import RawData
+from common.domain.json.canonicalJson import contentHash
 from common.repository.ModelRepository import modelRepository
 from common.repository.RawDataRepository import rawDataRepository
 from common.repository.SessionFactory import sessionFactory
@@ -124,3 +125,86 @@ class TestRawDataRepository(TestCase):
             raises = lambda: rawDataRepository.deleteAllButMostRecent(brandName='Toyota', modelName='Camry',
                                                                       modelYear=datetime.date(2080, 1, 1), session=session)
             self.assertRaises(ValueError, raises)
+
+    def test_insertSetsContentHash(self):
+        with sessionFactory.newSession() as session:
+            model = modelRepository.getMostRecentModel(brandName='Toyota', modelName='Camry', session=session)
+            toInsert = RawData(raw_data={'b': 1, 'a': 2}, model_id=model.model_id)
+            rawDataRepository.insert(toInsert, session)
+            session.commit()
+            self.assertEqual(contentHash({'a': 2, 'b': 1}), toInsert.content_hash)
+
+    def test_insertIfChangedSkipsUnchangedData(self):
+        with sessionFactory.newSession() as session:
+            session.begin()
+            model = modelRepository.getMostRecentModel(brandName='Toyota', modelName='Camry', session=session)
+            # test record has no content hash, matching the most recent row backfills it
+            self.assertFalse(rawDataRepository.insertIfChanged(
+                RawData(raw_data={'engine': ['V6', 'I4'], 'year': 2023}, model_id=model.model_id), session=session))
+            session.commit()
+            self.assertEqual(1, len(list(rawDataRepository.getDataFor(
+                brandName='Toyota', modelName='Camry', modelYear=datetime.date(2023, 1, 1), session=session))))
+
+    def test_insertIfChangedInsertsChangedData(self):
+        with sessionFactory.newSession() as session:
+            session.begin()
+            model = modelRepository.getMostRecentModel(brandName='Toyota', modelName='Camry', session=session)
+            self.assertTrue(rawDataRepository.insertIfChanged(
+                RawData(raw_data={'engine': ['V6'], 'year': 2023}, model_id=model.model_id), session=session))
+            session.commit()
+            newestRecord = rawDataRepository.getMostRecentlyCreated(brandName='Toyota', modelName='Camry',
+                                                                    modelYear=datetime.date(2023, 1, 1), session=session)
+            self.assertEqual(['V6'], newestRecord.raw_data['engine'])
+
+    def test_archiveAllButMostRecent(self):
+        with sessionFactory.newSession() as session:
+            session.begin()
+            rawDataRepository.insertDataBy(data={'year': 2023, 'engine': ['V6']}, brandName='Toyota',
+                                           modelName='Camry', modelYear=datetime.date(2023, 1, 1), session=session)
+            session.commit()
+            session.begin()
+            self.assertEqual(1, rawDataRepository.archiveAllButMostRecent(session=session))
+            session.commit()
+            archived, = session.query(RawData.raw_data, RawData.raw_data_archive).where(
+                RawData.raw_data.is_(None)).all()
+            self.assertIsNotNone(archived.raw_data_archive)
+            # reads decompress transparently
+            camry2023Data = rawDataRepository.getDataFor(
+                brandName='Toyota', modelName='Camry', modelYear=datetime.date(2023, 1, 1), session=session)
+            self.assertCountEqual([['V6', 'I4'], ['V6']], [record.raw_data['engine'] for record in camry2023Data])
+            newestRecord = rawDataRepository.getMostRecentlyCreated(brandName='Toyota', modelName='Camry',
+                                                                    modelYear=datetime.date(2023, 1, 1), session=session)
+            self.assertIsNone(newestRecord.raw_data_archive)
+
+    def test_streamRawDataDtos(self):
+        with sessionFactory.newSession() as session:
+            rawDataDtos = list(rawDataRepository.streamRawDataDtos(session=session, fetchSize=2))
+            self.assertEqual(5, len(rawDataDtos))
+            self.assertEqual(sorted(rawDataDto.createdAt for rawDataDto in rawDataDtos),
+                             [rawDataDto.createdAt for rawDataDto in rawDataDtos])
+            self.assertEqual(0, len(session.identity_map), "No entities are loaded into the session")
+
+    def test_streamRawDataDtosFiltersByBrandAndYears(self):
+        with sessionFactory.newSession() as session:
+            rawDataDtos = rawDataRepository.streamRawDataDtos(session=session, brandName='Toyota', startYear=2022,
+                                                              endYear=2022)
+            self.assertCountEqual([2022, 2022], [rawDataDto.rawData['year'] for rawDataDto in rawDataDtos])
+            self.assertEqual([], list(rawDataRepository.streamRawDataDtos(session=session, brandName='Lexus')))
+
+    def test_streamRawDataDtosDecompressesArchivedData(self):
+        with sessionFactory.newSession() as session:
+            session.begin()
+            rawDataRepository.insertDataBy(data={'year': 2023, 'engine': ['V6']}, brandName='Toyota',
+                                           modelName='Camry', modelYear=datetime.date(2023, 1, 1), session=session)
+            session.commit()
+            session.begin()
+            rawDataRepository.archiveAllButMostRecent(session=session)
+            session.commit()
+            rawDataDtos = rawDataRepository.streamRawDataDtos(session=session, brandName='Toyota', startYear=2023,
+                                                              endYear=2023)
+            self.assertCountEqual([['V6', 'I4'], ['I6', 'I4'], ['V6']],
+                                  [rawDataDto.rawData['engine'] for rawDataDto in rawDataDtos])
+
+    def test_streamRawDataDtosRaisesOnInvalidFetchSize(self):
+        with sessionFactory.newSession() as session:
+            self.assertRaises(ValueError, lambda: rawDataRepository.streamRawDataDtos(session=session, fetchSize=0))
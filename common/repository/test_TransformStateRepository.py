@@ -0,0 +1,86 @@
+import datetime
+from unittest import TestCase
+
+from common.domain.entities import RawData
+from common.domain.json.canonicalJson import contentHash
+from common.repository.ModelRepository import modelRepository
+from common.repository.RawDataRepository import rawDataRepository
+from common.repository.SessionFactory import sessionFactory
+from common.repository.TransformStateRepository import transformStateRepository
+from common.repository.test_common.DbContainer import DbContainer
+
+
+class TestTransformStateRepository(TestCase):
+    container = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.container = DbContainer()
+        cls.container.start()
+        cls.container.initTables()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.container.stop()
+
+    def setUp(self) -> None:
+        self.container.insetTestRecords()
+
+    def tearDown(self) -> None:
+        self.container.deleteAll()
+
+    def getCamry2023(self, session):
+        return modelRepository.getModelByBrandNameModelNameModelYear(
+            brandName='Toyota', modelName='Camry', modelYear=datetime.date(2023, 1, 1), session=session)
+
+    def markTransformed(self, rawData: RawData, session) -> None:
+        transformStateRepository.upsert(modelId=rawData.model_id, dataId=rawData.data_id,
+                                        contentHash=rawData.content_hash, session=session)
+
+    def test_getPendingIncludesModelsNeverTransformed(self):
+        with sessionFactory.newSession() as session:
+            self.assertEqual(5, len(transformStateRepository.getPending(session=session)))
+
+    def test_getPendingExcludesTransformedData(self):
+        with sessionFactory.newSession() as session:
+            session.begin()
+            camry2023Data = self.getCamry2023(session).raw_data[0]
+            self.markTransformed(camry2023Data, session)
+            session.commit()
+            pendingDataIds = {row.data_id for row in transformStateRepository.getPending(session=session)}
+        self.assertEqual(4, len(pendingDataIds))
+        self.assertNotIn(camry2023Data.data_id, pendingDataIds)
+
+    def test_getPendingIncludesChangedData(self):
+        with sessionFactory.newSession() as session:
+            session.begin()
+            camry2023 = self.getCamry2023(session)
+            self.markTransformed(camry2023.raw_data[0], session)
+            newData = RawData(model=camry2023, raw_data={'year': 2023, 'engine': ['V6']})
+            rawDataRepository.insert(newData, session=session)
+            session.commit()
+            pendingDataIds = {row.data_id for row in transformStateRepository.getPending(session=session)}
+        self.assertIn(newData.data_id, pendingDataIds)
+
+    def test_getPendingExcludesUnchangedContent(self):
+        data = {'year': 2023, 'engine': ['V6', 'I4']}
+        with sessionFactory.newSession() as session:
+            session.begin()
+            camry2023 = self.getCamry2023(session)
+            oldData = RawData(model=camry2023, raw_data=data, created_at=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc))
+            rawDataRepository.insert(oldData, session=session)
+            session.flush()
+            self.markTransformed(oldData, session)
+            # the test record is newer and has the same content
+            camry2023.raw_data[0].content_hash = contentHash(data)
+            session.commit()
+            pendingModelIds = {row.model_id for row in transformStateRepository.getPending(session=session)}
+        self.assertNotIn(camry2023.model_id, pendingModelIds)
+
+    def test_getPendingOnlyConsidersDataCreatedAfterWatermark(self):
+        with sessionFactory.newSession() as session:
+            pending = transformStateRepository.getPending(session=session)
+            newest = pending[-1]
+            self.assertEqual([], transformStateRepository.getPending(session=session, since=newest.created_at))
+            self.assertEqual(pending, transformStateRepository.getPending(
+                session=session, since=pending[0].created_at - datetime.timedelta(seconds=1)))
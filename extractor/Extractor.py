@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from typing import List, Dict, Optional
 from uuid import UUID
@@ -10,15 +12,28 @@ from common.repository.ManufacturerRepository import manufacturerRepository
 from common.repository.ModelRepository import modelRepository
 from common.repository.RawDataRepository import rawDataRepository
 from common.repository.SessionFactory import sessionFactory
+from extractor.scraper.AsyncModelInfoScraper import AsyncModelInfoScraper
 from extractor.scraper.ModelInfoScraper import ModelInfoScraper
-from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName
+from extractor.RunJournal import RunJournal
+from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName, ModelDtoAndJsonData, streamModels
+
+log = logging.getLogger()
+
+# default upper bound on the number of (brand, model year) extractions in flight at once.  Each extraction fetches
+# its models with up to ModelInfoScraper.maxWorkers threads, HttpClient.POOL_MAXSIZE keeps a connection for each
+MAX_CONCURRENT_YEARS = 4
+# default number of models written per transaction by Extractor.extractStreaming
+STREAM_BATCH_SIZE = 10
 
 
 class Extractor:
 
+    # kwargs: noPersist True/False, for testing doesn't create or fetch the brand; journal RunJournal, makes
+    # persisting extractions resumable
     def __init__(self, scraper: ModelInfoScraper, **kwargs):
         self.log = logging.getLogger(self.__class__.__name__)
         self.scraper = scraper
+        self.journal: Optional[RunJournal] = kwargs.get('journal')
         self.brandId = self._createOrFetchBrand(noPersist=kwargs.get("noPersist", False) )
 
     def _createOrFetchBrand(self, noPersist: bool) -> Optional[UUID]:
@@ -51,12 +66,17 @@ class Extractor:
             modelDto.brand_id = self.brandId
         if (diff := modelNames.symmetric_difference(jsonDataByName.keys()) ):
             raise ValueError(f"Missing model <-> jsonData relationship for modelName(s): {diff}")
+        unchanged = 0
         with sessionFactory.newSession() as session:
             session.begin()
             for modelEntity in modelRepository.upsert(modelDtos, session):
                 jsonData = jsonDataByName[modelEntity.name]
-                rawDataRepository.insert(RawData(raw_data=jsonData, model_id=modelEntity.model_id), session=session)
+                if not rawDataRepository.insertIfChanged(RawData(raw_data=jsonData, model_id=modelEntity.model_id),
+                                                         session=session):
+                    unchanged += 1
             session.commit()
+        if unchanged:
+            self.log.debug(f"Skipped {unchanged} unchanged raw data record(s) for brand: {self.scraper.getBrandName()}")
 
     def extract(self, modelYear: date, persist: bool = True) -> Optional[ModelDtosAndJsonDataByName]:
         """
@@ -69,10 +89,153 @@ class Extractor:
         and will return fetched data as ``ModelDtosAndJsonDataByName`` object
         :return: ``None`` or ``ModelDtosAndJsonDataByName`` *(see persist parameter)*
         """
+        if persist and self._isJournaledComplete(modelYear):
+            return None
         modelDtosAndJsonDataByName = self.scraper.fetchModelYear(modelYear)
         if not persist:
             return modelDtosAndJsonDataByName
+        self._persistModelYear(modelDtosAndJsonDataByName, modelYear)
+
+    def _persistModelYear(self, modelDtosAndJsonDataByName: ModelDtosAndJsonDataByName, modelYear: date) -> None:
         if not (modelDtos := modelDtosAndJsonDataByName.modelDtos):
             self.log.info(f"No models retrieved for brand: {self.scraper.getBrandName()} year {modelYear}")
         self._persistModels(modelDtos=modelDtos,
                             jsonDataByName=modelDtosAndJsonDataByName.jsonDataByName)
+        if self.journal:
+            self.journal.recordYearComplete(brandName=self.scraper.getBrandName(), modelYear=modelYear)
+
+    def _isJournaledComplete(self, modelYear: date) -> bool:
+        if self.journal and self.journal.isYearComplete(brandName=self.scraper.getBrandName(), modelYear=modelYear):
+            self.log.info(f"Skipping brand: {self.scraper.getBrandName()} year {modelYear}, already persisted.")
+            return True
+        return False
+
+    def _persistBatch(self, batch: List[ModelDtoAndJsonData], modelYear: date) -> None:
+        self._persistModels(modelDtos=[modelDto for modelDto, _jsonData in batch],
+                            jsonDataByName={modelDto.name: jsonData for modelDto, jsonData in batch})
+        if self.journal:
+            self.journal.recordModels(brandName=self.scraper.getBrandName(), modelYear=modelYear,
+                                      modelNames=(modelDto.name for modelDto, _jsonData in batch))
+
+    def extractStreaming(self, modelYear: date, batchSize: int = STREAM_BATCH_SIZE) -> int:
+        """
+        Memory bounded version of ``extract``.  Models are persisted as their data arrives, ``batchSize`` models per
+        transaction, instead of after the whole model year has been fetched.  Requires a scraper that implements
+        ``fetchModelFetchDtos``.  With a journal, models committed by an earlier, interrupted run are not fetched
+        again and the year is journaled complete once every discovered model has been committed.
+        :param modelYear: see ``extract``
+        :param batchSize: number of models upserted (with their raw data) per commit
+        :return: number of models persisted
+        """
+        if batchSize < 1:
+            raise ValueError("batchSize must be >= 1")
+        if self._isJournaledComplete(modelYear):
+            return 0
+        modelFetchDtosByName = self.scraper.fetchModelFetchDtos(modelYear)
+        if self.journal:
+            persistedNames = self.journal.getPersistedModels(brandName=self.scraper.getBrandName(), modelYear=modelYear)
+            modelFetchDtosByName = {modelName: fetchDto for modelName, fetchDto in modelFetchDtosByName.items()
+                                    if modelName not in persistedNames}
+            if persistedNames:
+                self.log.info(f"Resuming brand: {self.scraper.getBrandName()} year {modelYear}, "
+                              f"{len(modelFetchDtosByName)} models remaining.")
+        persisted = 0
+        batch = list()
+        for modelDtoAndJsonData in streamModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear,
+                                                maxWorkers=self.scraper.maxWorkers):
+            batch.append(modelDtoAndJsonData)
+            if len(batch) >= batchSize:
+                self._persistBatch(batch, modelYear)
+                persisted += len(batch)
+                batch = list()
+        if batch:
+            self._persistBatch(batch, modelYear)
+            persisted += len(batch)
+        if not persisted:
+            self.log.info(f"No models retrieved for brand: {self.scraper.getBrandName()} year {modelYear}")
+        if self.journal and persisted == len(modelFetchDtosByName):
+            self.journal.recordYearComplete(brandName=self.scraper.getBrandName(), modelYear=modelYear)
+        return persisted
+
+    def extractRange(self, startYear: int, endYear: int, maxWorkers: int = MAX_CONCURRENT_YEARS,
+                     streaming: bool = False) -> Dict[int, Optional[Exception]]:
+        """
+        Extracts and persists every model year from ``startYear`` to ``endYear`` (inclusive).  See module-level
+        ``extractor.Extractor.extractRange``.
+        :param startYear:
+        :param endYear:
+        :param maxWorkers: maximum number of years extracted concurrently
+        :param streaming: see module-level ``extractor.Extractor.extractRange``
+        :return: ``{year: None}`` for each persisted year, ``{year: exception}`` for each failed year
+        """
+        return extractRange([self], startYear=startYear, endYear=endYear, maxWorkers=maxWorkers,
+                            streaming=streaming)[self.scraper.getBrandName()]
+
+    async def extractAsync(self, modelYear: date, persist: bool = True) -> Optional[ModelDtosAndJsonDataByName]:
+        """
+        Awaitable version of ``extract``.  Model discovery and model data fetches are awaited, so extractions for
+        many brands may share one event loop (see ``extractBrands``).  Like ``extract``, years journaled complete
+        are skipped and persisted years are journaled.
+        :param modelYear: see ``extract``
+        :param persist: see ``extract``
+        :return: see ``extract``
+        """
+        if persist and self._isJournaledComplete(modelYear):
+            return None
+        modelDtosAndJsonDataByName = await AsyncModelInfoScraper(self.scraper).fetchModelYear(modelYear)
+        if not persist:
+            return modelDtosAndJsonDataByName
+        await asyncio.to_thread(self._persistModelYear, modelDtosAndJsonDataByName, modelYear)
+
+
+async def extractBrands(extractors: List[Extractor], modelYear: date,
+                        persist: bool = True) -> List[Optional[ModelDtosAndJsonDataByName]]:
+    """
+    Runs ``Extractor.extractAsync`` for each extractor concurrently on the running event loop.
+    :param extractors: typically one per brand
+    :param modelYear:
+    :param persist:
+    :return: results in the order of ``extractors`` *(see Extractor.extract)*
+    """
+    return await asyncio.gather(*(extractor.extractAsync(modelYear=modelYear, persist=persist)
+                                  for extractor in extractors))
+
+
+def extractRange(extractors: List[Extractor], startYear: int, endYear: int, maxWorkers: int = MAX_CONCURRENT_YEARS,
+                 streaming: bool = False) -> Dict[str, Dict[int, Optional[Exception]]]:
+    """
+    Backfill of model years ``startYear`` to ``endYear`` (inclusive) for each extractor.  Every (brand, year) pair is
+    extracted on a bounded pool of threads, newest years first, and each is persisted as soon as it is fetched so
+    only ``maxWorkers`` years are held in memory.  Extractors (and their scrapers) are shared by all years of a
+    brand, so brand records and scraper lookup data are fetched once.  A failed year is logged and reported, it
+    does not stop the backfill.
+    :param extractors: typically one per brand
+    :param startYear:
+    :param endYear:
+    :param maxWorkers: maximum number of (brand, year) pairs extracted concurrently
+    :param streaming: ``True`` extracts with ``Extractor.extractStreaming``, holding only a few models per year in
+    memory
+    :return: ``{brandName: {year: None or exception raised}}``, years in ascending order
+    """
+    if startYear > endYear:
+        raise ValueError(f"startYear: {startYear} is after endYear: {endYear}")
+    if maxWorkers < 1:
+        raise ValueError("maxWorkers must be >= 1")
+    resultsByBrand = {extractor.scraper.getBrandName(): dict() for extractor in extractors}
+    with ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='extractRange') as executor:
+        futures = dict()
+        for year in range(endYear, startYear - 1, -1):
+            for extractor in extractors:
+                extract = extractor.extractStreaming if streaming else extractor.extract
+                futures[executor.submit(extract, date(year, 1, 1))] = (extractor.scraper.getBrandName(), year)
+        for future in as_completed(futures):
+            brandName, year = futures[future]
+            try:
+                future.result()
+                resultsByBrand[brandName][year] = None
+                log.info(f"Persisted brand: {brandName} year: {year}")
+            except Exception as e:
+                # i.e. HTTP errors that outlasted retries or database errors, only this year fails
+                resultsByBrand[brandName][year] = e
+                log.warning(f"Unable to extract brand: {brandName} year: {year}. {e}", exc_info=e)
+    return {brandName: dict(sorted(results.items())) for brandName, results in resultsByBrand.items()}
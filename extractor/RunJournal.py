@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+import threading
+from datetime import date
+from typing import Set, Dict, Tuple, Iterable
+
+
+class RunJournal:
+    """
+    Local, append-only record of an extraction run's progress, one JSON object per line:
+
+    * ``{"brand": "Toyota", "year": 2022, "model": "Camry"}`` - the model's raw data has been committed
+    * ``{"brand": "Toyota", "year": 2022, "complete": true}`` - every model of the year has been committed
+
+    A restarted ``Extractor`` given the same journal skips completed years and already persisted models, so only
+    the remainder is fetched.  Each entry is flushed to disk once the transaction it describes has committed.  A
+    journal describes a single run (i.e. one backfill), use a new path to extract the same years again.
+    """
+
+    def __init__(self, path: str):
+        self.log = logging.getLogger(type(self).__name__)
+        self.path = path
+        self._modelsByYear: Dict[Tuple[str, int], Set[str]] = dict()
+        self._completeYears: Set[Tuple[str, int]] = set()
+        self._terminateLastLine = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            line = ''
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = (entry['brand'], entry['year'])
+                except (ValueError, KeyError, TypeError):
+                    # a run that died mid-write may leave a partial final line
+                    self.log.warning(f"Skipping unreadable journal entry: {line.strip()}")
+                    continue
+                if entry.get('complete'):
+                    self._completeYears.add(key)
+                elif (modelName := entry.get('model')) is not None:
+                    self._modelsByYear.setdefault(key, set()).add(modelName)
+        # don't let the next entry continue a partial final line
+        self._terminateLastLine = bool(line) and not line.endswith('\n')
+
+    def _append(self, entries: Iterable[Dict]) -> None:
+        # caller must hold self._lock
+        with open(self.path, 'a', encoding='utf-8') as f:
+            if self._terminateLastLine:
+                f.write('\n')
+                self._terminateLastLine = False
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def getPersistedModels(self, brandName: str, modelYear: date) -> Set[str]:
+        with self._lock:
+            return set(self._modelsByYear.get((brandName, modelYear.year), set()))
+
+    def isYearComplete(self, brandName: str, modelYear: date) -> bool:
+        with self._lock:
+            return (brandName, modelYear.year) in self._completeYears
+
+    def recordModels(self, brandName: str, modelYear: date, modelNames: Iterable[str]) -> None:
+        modelNames = list(modelNames)
+        with self._lock:
+            self._append({'brand': brandName, 'year': modelYear.year, 'model': modelName} for modelName in modelNames)
+            self._modelsByYear.setdefault((brandName, modelYear.year), set()).update(modelNames)
+
+    def recordYearComplete(self, brandName: str, modelYear: date) -> None:
+        with self._lock:
+            self._append(({'brand': brandName, 'year': modelYear.year, 'complete': True},))
+            self._completeYears.add((brandName, modelYear.year))
@@ -36,7 +36,7 @@ class Test(TestCase):
             self.manufacturerId = gmManufacturer.manufacturer_id
             session.commit()
         # Not required but ensures no fetches occur
-        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmScraper.httpClient.getRequest',
+        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmMetadataCatalog.httpClient.getRequest',
                                             side_effect=RuntimeError("GmScraper tried to fetch!") )
         self.patcherHttpClient.start()
         self.scraper = ChevroletScraper(noInit=True)
@@ -0,0 +1,44 @@
+import asyncio
+from datetime import date
+from typing import Type
+
+from extractor.scraper.ModelInfoScraper import ModelInfoScraper
+from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName, fetchModelsAsync
+
+
+class AsyncModelInfoScraper:
+    """
+    Async counterpart of a ``ModelInfoScraper``.  Wraps a scraper that implements ``fetchModelFetchDtos`` so
+    that model discovery and model data fetches may be awaited, allowing many brands to be swept from a single
+    event loop.
+    """
+
+    def __init__(self, scraper: ModelInfoScraper):
+        self.scraper = scraper
+
+    @classmethod
+    async def create(cls, scraperType: Type[ModelInfoScraper], **kwargs) -> 'AsyncModelInfoScraper':
+        """
+        Constructs ``scraperType`` without blocking the event loop (scraper constructors may fetch lookup data).
+        :param scraperType: a ``ModelInfoScraper`` implementation, i.e. ``ToyotaScraper``
+        :param kwargs: forwarded to the ``scraperType`` constructor
+        :return:
+        """
+        scraper = await asyncio.to_thread(scraperType, **kwargs)
+        return cls(scraper)
+
+    def getBrandName(self) -> str:
+        return self.scraper.getBrandName()
+
+    def getManufacturerCommon(self) -> str:
+        return self.scraper.getManufacturerCommon()
+
+    async def fetchModelYear(self, modelYear: date) -> ModelDtosAndJsonDataByName:
+        """
+        Awaitable version of ``ModelInfoScraper.fetchModelYear``.
+        :param modelYear:
+        :return:
+        """
+        modelFetchDtosByName = await asyncio.to_thread(self.scraper.fetchModelFetchDtos, modelYear)
+        return await fetchModelsAsync(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear,
+                                      maxInFlight=self.scraper.maxWorkers)
@@ -1,14 +1,18 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import date
-from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName
+from typing import Dict
+
+from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName, MAX_WORKERS, ModelFetchDto
 
 class ModelInfoScraper(ABC):
 
+    # kwargs: maxWorkers int, maximum concurrent model data requests made by fetchModelYear
     def __init__(self, brandName: str, manufacturerCommon: str, **kwargs):
         super().__init__()
         self.brandName = brandName
         self.manufacturerCommon = manufacturerCommon
+        self.maxWorkers = kwargs.get('maxWorkers', MAX_WORKERS)
         self.log = logging.getLogger()
 
     def _validateModelYear(self, modelYear: date) -> None:
@@ -22,6 +26,16 @@ class ModelInfoScraper(ABC):
     def getManufacturerCommon(self) -> str:
         return self.manufacturerCommon
 
+    @abstractmethod
+    def fetchModelFetchDtos(self, modelYear: date) -> Dict[str, ModelFetchDto]:
+        """
+        Discovers the models available for ``modelYear`` without fetching their JSON data, i.e. for
+        ``AsyncModelInfoScraper`` and ``Extractor.extractStreaming``.
+        :param modelYear:
+        :return: ``ModelFetchDto``s by model name
+        """
+        pass
+
     @abstractmethod
     def fetchModelYear(self, date: 'date') -> ModelDtosAndJsonDataByName:
         """
@@ -0,0 +1,22 @@
+import asyncio
+
+from requests import Response
+
+from extractor.scraper.common.HttpClient import HttpClient, httpClient
+
+
+class AsyncHttpClient:
+    """
+    Awaitable facade over ``HttpClient``.  Requests share ``HttpClient``'s pooled keep-alive session and are
+    dispatched off the event loop so many brands' requests may be awaited concurrently from a single loop.
+    Limiting the number of requests in flight is left to the caller (see ``fetchModelsAsync``).
+    """
+
+    def __init__(self, httpClient: HttpClient):
+        self.httpClient = httpClient
+
+    # returns raw response text or throws if 4/5xx response
+    async def getRequest(self, fullPath: str, **kwargs) -> 'Response':
+        return await asyncio.to_thread(self.httpClient.getRequest, fullPath, **kwargs)
+
+asyncHttpClient = AsyncHttpClient(httpClient)
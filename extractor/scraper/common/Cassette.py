@@ -0,0 +1,106 @@
+import base64
+import enum
+import gzip
+import json
+import logging
+import threading
+from collections import deque
+from typing import Dict, Optional, Mapping, Deque, List
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+class CassetteMode(enum.Enum):
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+
+class Cassette:
+    """
+    A gzip compressed archive of HTTP interactions.  In ``RECORD`` mode every response received by ``HttpClient``
+    is appended to the cassette, ``save`` writes the archive.  In ``REPLAY`` mode the archive is loaded and
+    ``HttpClient`` serves responses from it without using the network.  Interactions are matched on URL and
+    request headers; repeated requests are answered in recorded order, the final recording is reused once a
+    request's recordings are exhausted.
+
+    May be used as a context manager, which saves a recording cassette on exit.
+    """
+    VERSION = 1
+
+    def __init__(self, path: str, mode: CassetteMode):
+        self.log = logging.getLogger(type(self).__name__)
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._recorded: List[Dict] = list()
+        self._replayByKey: Dict[str, Deque[Dict]] = dict()
+        if mode is CassetteMode.REPLAY:
+            self._load()
+
+    def __enter__(self) -> 'Cassette':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.mode is CassetteMode.RECORD:
+            self.save()
+
+    def isReplaying(self) -> bool:
+        return self.mode is CassetteMode.REPLAY
+
+    def _createKey(self, url: str, headers: Optional[Mapping]) -> str:
+        headerItems = sorted((str(key).lower(), str(value)) for key, value in (headers or dict()).items())
+        return json.dumps([url, headerItems])
+
+    def _load(self) -> None:
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            archive = json.load(f)
+        if archive.get('version') != self.VERSION:
+            raise ValueError(f"Unsupported cassette version: {archive.get('version')}")
+        for interaction in archive['interactions']:
+            key = self._createKey(interaction['url'], interaction['requestHeaders'])
+            self._replayByKey.setdefault(key, deque()).append(interaction)
+
+    def record(self, url: str, headers: Optional[Mapping], response: 'Response') -> None:
+        if self.mode is not CassetteMode.RECORD:
+            raise ValueError("Cassette is not in RECORD mode")
+        interaction = {'url': url,
+                       'requestHeaders': {str(key): str(value) for key, value in (headers or dict()).items()},
+                       'status': response.status_code,
+                       'headers': dict(response.headers),
+                       'encoding': response.encoding,
+                       'body': base64.b64encode(response.content).decode('ascii')}
+        with self._lock:
+            self._recorded.append(interaction)
+
+    def play(self, url: str, headers: Optional[Mapping]) -> 'Response':
+        """
+        :param url:
+        :param headers: request headers
+        :return: the recorded response
+        :raises: ``KeyError`` if the request was not recorded
+        """
+        if self.mode is not CassetteMode.REPLAY:
+            raise ValueError("Cassette is not in REPLAY mode")
+        key = self._createKey(url, headers)
+        with self._lock:
+            interactions = self._replayByKey.get(key)
+            if not interactions:
+                raise KeyError(f"No recorded interaction for: {url}")
+            interaction = interactions.popleft() if len(interactions) > 1 else interactions[0]
+        response = Response()
+        response.url = url
+        response.status_code = interaction['status']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = interaction['encoding']
+        response._content = base64.b64decode(interaction['body'])
+        return response
+
+    def save(self) -> None:
+        if self.mode is not CassetteMode.RECORD:
+            raise ValueError("Cassette is not in RECORD mode")
+        with self._lock:
+            archive = {'version': self.VERSION, 'interactions': list(self._recorded)}
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump(archive, f)
+        self.log.info(f"Saved {len(archive['interactions'])} interactions to {self.path}")
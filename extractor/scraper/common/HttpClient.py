@@ -1,20 +1,167 @@
+import logging
+import time
+from typing import Optional, Dict
+
 import requests
-from requests import Response
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from extractor.scraper.common.Cassette import Cassette
+from extractor.scraper.common.HttpMetrics import HttpMetrics
+from extractor.scraper.common.RateLimiter import HostRateLimiter
+from extractor.scraper.common.ResponseCache import ResponseCache
+from extractor.scraper.common.RetryPolicy import RetryPolicy
 
 
 class HttpClient:
+    # number of hosts with a cached connection pool, each brand's scraper talks to ~1-2 hosts
+    POOL_CONNECTIONS = 10
+    # max keep-alive connections per host, should be >= the number of concurrent fetches: extractRange runs
+    # Extractor.MAX_CONCURRENT_YEARS (4) extractions at once, each fetching with fetchModelData.MAX_WORKERS (8)
+    POOL_MAXSIZE = 32
 
-    def __init__(self):
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: ``poolConnections``: ``int`` - number of per-host connection pools to cache,
+        ``poolMaxSize``: ``int`` - maximum number of keep-alive connections kept per host,
+        ``responseCache``: ``ResponseCache`` - optional persistent cache for successful responses,
+        ``cassette``: ``Cassette`` - optional archive to record responses to or replay responses from,
+        ``rateLimiter``: ``HostRateLimiter`` - optional adaptive per-host request rate limit,
+        ``retryPolicy``: ``RetryPolicy`` - optional retries of 429/5xx responses and connection errors
+        """
+        self.log = logging.getLogger(type(self).__name__)
         # fallback if response encoding unspecified
         self.defaultEncoding = 'utf-8'
+        self.poolConnections = kwargs.get('poolConnections', self.POOL_CONNECTIONS)
+        self.poolMaxSize = kwargs.get('poolMaxSize', self.POOL_MAXSIZE)
+        self.session = self._createSession()
+        self.responseCache: Optional[ResponseCache] = kwargs.get('responseCache')
+        self.cassette: Optional[Cassette] = kwargs.get('cassette')
+        self.rateLimiter: Optional[HostRateLimiter] = kwargs.get('rateLimiter')
+        self.retryPolicy: Optional[RetryPolicy] = kwargs.get('retryPolicy')
+        self.metrics = HttpMetrics()
 
-    # returns raw response text or throws if 4/5xx response
-    def getRequest(self, fullPath: str, **kwargs) -> 'Response':
-        res = requests.get(fullPath, **kwargs)
+    def setResponseCache(self, responseCache: Optional[ResponseCache]) -> None:
+        """
+        :param responseCache: cache to use for subsequent requests, ``None`` disables caching
+        :return:
+        """
+        self.responseCache = responseCache
+
+    def setCassette(self, cassette: Optional[Cassette]) -> None:
+        """
+        :param cassette: a recording cassette captures all subsequent responses, a replaying cassette serves all
+        subsequent responses without network access.  ``None`` restores normal operation.
+        :return:
+        """
+        self.cassette = cassette
+
+    def _createSession(self) -> 'Session':
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.poolConnections, pool_maxsize=self.poolMaxSize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _send(self, fullPath: str, **kwargs) -> 'Response':
+        cassette = self.cassette
+        if cassette and cassette.isReplaying():
+            try:
+                return cassette.play(fullPath, kwargs.get('headers'))
+            except KeyError as e:
+                raise RuntimeError(f"No recorded response for: {fullPath}.") from e
+        res = self._sendWithRetries(fullPath, **kwargs)
+        if cassette:
+            cassette.record(fullPath, kwargs.get('headers'), res)
+        return res
+
+    def _sendWithRetries(self, fullPath: str, **kwargs) -> 'Response':
+        retryPolicy = self.retryPolicy
+        if retryPolicy:
+            retryPolicy.recordRequest()
+        attempt = 0
+        while True:
+            if self.rateLimiter:
+                self.metrics.add('rateLimitWaitSeconds', self.rateLimiter.acquire(fullPath))
+            self.metrics.add('requests')
+            retryAfter = None
+            try:
+                res = self.session.get(fullPath, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not self._tryAcquireRetry(attempt):
+                    raise
+                self.log.debug(f"Retrying {fullPath} after: {e}")
+            else:
+                retryAfter = RetryPolicy.retryAfterSeconds(res)
+                if self.rateLimiter and self.rateLimiter.onResponse(fullPath, res.status_code, retryAfter):
+                    self.metrics.add('throttled')
+                if not retryPolicy or not retryPolicy.isRetryable(res) or not self._tryAcquireRetry(attempt):
+                    return res
+                self.log.debug(f"Retrying {fullPath} after a {res.status_code} status code.")
+            time.sleep(retryPolicy.delay(attempt, retryAfter))
+            attempt += 1
+
+    def _tryAcquireRetry(self, attempt: int) -> bool:
+        if not self.retryPolicy:
+            return False
+        if self.retryPolicy.tryAcquireRetry(attempt):
+            self.metrics.add('retries')
+            return True
+        if attempt < self.retryPolicy.maxRetries:
+            self.metrics.add('retryBudgetExhausted')
+        return False
+
+    def getMetrics(self) -> Dict:
+        """
+        :return: snapshot of the ``HttpMetrics`` counters and, if rate limited, ``rates``: current requests per
+        second by host
+        """
+        metrics = self.metrics.snapshot()
+        if self.rateLimiter:
+            metrics['rates'] = self.rateLimiter.getRates()
+        return metrics
+
+    def _get(self, fullPath: str, **kwargs) -> 'Response':
+        res = self._send(fullPath, **kwargs)
         if res.status_code >= 400:
             raise RuntimeError(f"received a {res.status_code} status code for: {fullPath}.")
         if not res.encoding:
             res.encoding = self.defaultEncoding
         return res
 
-httpClient = HttpClient()
\ No newline at end of file
+    def _getCached(self, fullPath: str, **kwargs) -> 'Response':
+        cache = self.responseCache
+        key = cache.createKey(fullPath, kwargs.get('headers'))
+        cached = cache.get(key)
+        if cached and cache.isFresh(cached) and (res := cache.toResponse(key, cached)):
+            return res
+        if cached and cached.hasValidator():  # stale, revalidate
+            conditionalKwargs = {**kwargs, 'headers': {**(kwargs.get('headers') or dict()),
+                                                       **cached.conditionalHeaders()}}
+            res = self._get(fullPath, **conditionalKwargs)
+            if res.status_code == 304 and (cachedRes := cache.toResponse(key, cached)):
+                cache.touch(key, cached)
+                return cachedRes
+            if res.status_code == 304:  # body evicted between metadata read and now, refetch unconditionally
+                res = self._get(fullPath, **kwargs)
+        else:
+            res = self._get(fullPath, **kwargs)
+        if res.status_code == 200:
+            cache.put(key, res)
+        return res
+
+    # returns raw response text or throws if 4/5xx response
+    def getRequest(self, fullPath: str, **kwargs) -> 'Response':
+        if self.responseCache is None:
+            return self._get(fullPath, **kwargs)
+        return self._getCached(fullPath, **kwargs)
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.  The client remains usable, new connections are opened on demand.
+        :return:
+        """
+        self.session.close()
+        self.session = self._createSession()
+
+httpClient = HttpClient(rateLimiter=HostRateLimiter(), retryPolicy=RetryPolicy())
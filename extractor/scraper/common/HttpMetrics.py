@@ -0,0 +1,33 @@
+import threading
+from typing import Dict
+
+
+class HttpMetrics:
+    """
+    Thread safe counters describing ``HttpClient`` traffic:
+
+    * ``requests`` - requests sent over the network, retries included
+    * ``retries`` - requests repeated after a retryable status or connection error
+    * ``throttled`` - responses that throttled a host (``429``, ``503``)
+    * ``retryBudgetExhausted`` - retryable failures returned because the retry budget was spent
+    * ``rateLimitWaitSeconds`` - total time spent waiting on the rate limiter
+    """
+    NAMES = ('requests', 'retries', 'throttled', 'retryBudgetExhausted', 'rateLimitWaitSeconds')
+
+    def __init__(self):
+        self._values: Dict[str, float] = dict.fromkeys(self.NAMES, 0)
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: float = 1) -> None:
+        if name not in self._values:
+            raise ValueError(f"Unrecognized metric: {name}")
+        with self._lock:
+            self._values[name] += amount
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values = dict.fromkeys(self.NAMES, 0)
@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket whose refill ``rate`` adapts to the server: ``throttle`` multiplies the rate by
+    ``decreaseFactor`` (and optionally pauses the bucket), ``recover`` adds ``increaseStep`` up to ``maxRate``
+    (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate: float, burst: float, minRate: float, maxRate: float, increaseStep: float,
+                 decreaseFactor: float):
+        if not 0 < minRate <= rate <= maxRate:
+            raise ValueError("Expected 0 < minRate <= rate <= maxRate")
+        if burst < 1 or not 0 < decreaseFactor < 1:
+            raise ValueError("Expected burst >= 1 and 0 < decreaseFactor < 1")
+        self.rate = rate
+        self.burst = burst
+        self.minRate = minRate
+        self.maxRate = maxRate
+        self.increaseStep = increaseStep
+        self.decreaseFactor = decreaseFactor
+        self._tokens = burst
+        self._updatedAt = time.monotonic()
+        self._pausedUntil = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updatedAt) * self.rate)
+        self._updatedAt = now
+
+    def acquire(self) -> float:
+        """
+        Blocks until a token is available.
+        :return: seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._pausedUntil:
+                    wait = self._pausedUntil - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def throttle(self, pauseSeconds: Optional[float] = None) -> None:
+        with self._lock:
+            self.rate = max(self.minRate, self.rate * self.decreaseFactor)
+            if pauseSeconds:
+                self._pausedUntil = max(self._pausedUntil, time.monotonic() + pauseSeconds)
+
+    def recover(self) -> None:
+        with self._lock:
+            self.rate = min(self.maxRate, self.rate + self.increaseStep)
+
+
+class HostRateLimiter:
+    """
+    One adaptive ``TokenBucket`` per host.  ``HttpClient`` acquires a token before each request and reports each
+    response: ``429`` and ``503`` responses throttle the host (honoring ``Retry-After``), other responses slowly
+    raise its rate again, so throughput settles near the highest rate a manufacturer tolerates.
+    """
+    THROTTLE_STATUSES = frozenset((429, 503))
+    RATE = 5.0  # requests per second
+    BURST = 10.0
+    MIN_RATE = 0.5
+    MAX_RATE = 20.0
+    INCREASE_STEP = 0.1
+    DECREASE_FACTOR = 0.5
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: ``rate``, ``burst``, ``minRate``, ``maxRate``, ``increaseStep``, ``decreaseFactor`` -
+        initial configuration of each host's ``TokenBucket``, see class constants for defaults
+        """
+        self.rate = kwargs.get('rate', self.RATE)
+        self.burst = kwargs.get('burst', self.BURST)
+        self.minRate = kwargs.get('minRate', self.MIN_RATE)
+        self.maxRate = kwargs.get('maxRate', self.MAX_RATE)
+        self.increaseStep = kwargs.get('increaseStep', self.INCREASE_STEP)
+        self.decreaseFactor = kwargs.get('decreaseFactor', self.DECREASE_FACTOR)
+        self._bucketByHost: Dict[str, TokenBucket] = dict()
+        self._lock = threading.Lock()
+        self._createBucket()  # validate configuration eagerly
+
+    def _createBucket(self) -> TokenBucket:
+        return TokenBucket(rate=self.rate, burst=self.burst, minRate=self.minRate, maxRate=self.maxRate,
+                           increaseStep=self.increaseStep, decreaseFactor=self.decreaseFactor)
+
+    def _getBucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if (bucket := self._bucketByHost.get(host)) is None:
+                bucket = self._bucketByHost[host] = self._createBucket()
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        :param url:
+        :return: seconds spent waiting for the host's token
+        """
+        return self._getBucket(url).acquire()
+
+    def onResponse(self, url: str, statusCode: int, retryAfter: Optional[float] = None) -> bool:
+        """
+        :param url:
+        :param statusCode:
+        :param retryAfter: seconds requested by the server's ``Retry-After`` header
+        :return: ``True`` if the response throttled the host
+        """
+        bucket = self._getBucket(url)
+        if statusCode in self.THROTTLE_STATUSES:
+            bucket.throttle(retryAfter)
+            return True
+        bucket.recover()
+        return False
+
+    def getRates(self) -> Dict[str, float]:
+        """
+        :return: current requests per second by host
+        """
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._bucketByHost.items()}
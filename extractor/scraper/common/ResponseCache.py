@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Mapping
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    storedAt: float
+    etag: Optional[str] = None
+    lastModified: Optional[str] = None
+    encoding: Optional[str] = None
+    headers: Dict = None
+
+    def isFresh(self, ttl: float, now: float) -> bool:
+        return now - self.storedAt < ttl
+
+    def hasValidator(self) -> bool:
+        return bool(self.etag or self.lastModified)
+
+    def conditionalHeaders(self) -> Dict[str, str]:
+        headers = dict()
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.lastModified:
+            headers['If-Modified-Since'] = self.lastModified
+        return headers
+
+
+class ResponseCache:
+    """
+    A persistent, on-disk cache of successful GET responses keyed by URL and request headers.  Each entry is a
+    pair of files in ``cacheDir``: ``<key>.json`` (metadata, including ``ETag``/``Last-Modified`` validators) and
+    ``<key>.body`` (raw response bytes).  Entries younger than ``ttl`` seconds are served without a request,
+    older entries are revalidated with a conditional request by ``HttpClient``.  When the total body size exceeds
+    ``maxBytes`` the least recently used entries are evicted.
+    """
+    TTL = 60 * 60  # seconds
+    MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(self, cacheDir: str, ttl: float = TTL, maxBytes: int = MAX_BYTES):
+        if ttl < 0 or maxBytes < 0:
+            raise ValueError("ttl and maxBytes must be >= 0")
+        self.log = logging.getLogger(type(self).__name__)
+        self.cacheDir = cacheDir
+        self.ttl = ttl
+        self.maxBytes = maxBytes
+        self._lock = threading.Lock()
+        # total body bytes, tracked by put and remove so the directory is only scanned to evict.  None until the
+        # first put scans entries left by earlier runs
+        self._totalBytes: Optional[int] = None
+        os.makedirs(cacheDir, exist_ok=True)
+
+    def createKey(self, url: str, headers: Optional[Mapping] = None) -> str:
+        headerItems = sorted((str(key).lower(), str(value)) for key, value in (headers or dict()).items())
+        return hashlib.sha256(json.dumps([url, headerItems]).encode('utf-8')).hexdigest()
+
+    def _metadataPath(self, key: str) -> str:
+        return os.path.join(self.cacheDir, f'{key}.json')
+
+    def _bodyPath(self, key: str) -> str:
+        return os.path.join(self.cacheDir, f'{key}.body')
+
+    def _writeAtomic(self, path: str, data: bytes) -> None:
+        tmpPath = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmpPath, 'wb') as f:
+            f.write(data)
+        os.replace(tmpPath, path)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            with open(self._metadataPath(key), 'r', encoding='utf-8') as f:
+                return CachedResponse(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def isFresh(self, cached: CachedResponse) -> bool:
+        return cached.isFresh(ttl=self.ttl, now=time.time())
+
+    def toResponse(self, key: str, cached: CachedResponse) -> Optional['Response']:
+        """
+        :param key:
+        :param cached:
+        :return: a ``Response`` reconstructed from disk, or ``None`` if the body is missing
+        """
+        try:
+            with open(self._bodyPath(key), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(self._bodyPath(key))  # mark as recently used for eviction
+        except OSError:
+            pass  # evicted since it was read, the content read is still valid
+        response = Response()
+        response.status_code = 200
+        response.url = cached.url
+        response.encoding = cached.encoding
+        response.headers = CaseInsensitiveDict(cached.headers or dict())
+        response._content = content
+        return response
+
+    def put(self, key: str, response: 'Response') -> None:
+        cached = CachedResponse(url=response.url, storedAt=time.time(), etag=response.headers.get('ETag'),
+                                lastModified=response.headers.get('Last-Modified'), encoding=response.encoding,
+                                headers=dict(response.headers))
+        content = response.content
+        if len(content) > self.maxBytes:
+            self.log.debug(f"Response for {response.url} too large to cache.")
+            return
+        with self._lock:
+            replacedBytes = self._bodySize(key)
+            self._writeAtomic(self._bodyPath(key), content)
+            self._writeAtomic(self._metadataPath(key), json.dumps(asdict(cached)).encode('utf-8'))
+            if self._totalBytes is not None:
+                self._totalBytes += len(content) - replacedBytes
+            if self._totalBytes is None or self._totalBytes > self.maxBytes:
+                self._evict()
+
+    def touch(self, key: str, cached: CachedResponse) -> None:
+        """
+        Restarts the ``ttl`` of an entry, i.e. after a ``304 Not Modified`` response.
+        :param key:
+        :param cached:
+        :return:
+        """
+        cached.storedAt = time.time()
+        with self._lock:
+            self._writeAtomic(self._metadataPath(key), json.dumps(asdict(cached)).encode('utf-8'))
+
+    def _bodySize(self, key: str) -> int:
+        try:
+            return os.stat(self._bodyPath(key)).st_size
+        except OSError:
+            return 0
+
+    def _evict(self) -> None:
+        # caller must hold self._lock, also resyncs self._totalBytes with the directory
+        bodies = list()
+        totalBytes = 0
+        with os.scandir(self.cacheDir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.body'):
+                    stat = entry.stat()
+                    bodies.append((stat.st_mtime, stat.st_size, entry.name[:-len('.body')]))
+                    totalBytes += stat.st_size
+        bodies.sort()  # least recently used first
+        for _mtime, size, key in bodies:
+            if totalBytes <= self.maxBytes:
+                break
+            self._remove(key)
+            totalBytes -= size
+        self._totalBytes = totalBytes
+
+    def _remove(self, key: str) -> None:
+        # caller must hold self._lock
+        removedBytes = self._bodySize(key)
+        for path in self._metadataPath(key), self._bodyPath(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        if self._totalBytes is not None:
+            self._totalBytes -= removedBytes
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in os.listdir(self.cacheDir):
+                if name.endswith(('.json', '.body')):
+                    os.remove(os.path.join(self.cacheDir, name))
+            self._totalBytes = 0
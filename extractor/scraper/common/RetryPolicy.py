@@ -0,0 +1,80 @@
+import random
+import threading
+from typing import Optional
+
+from requests import Response
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff with a retry budget.  A failed attempt ``n`` (from 0) waits a random delay in
+    ``[0, min(maxDelay, baseDelay * 2^n)]``, or at least the server's ``Retry-After``.  The budget allows
+    ``minRetries`` retries plus ``budgetRatio`` retries per request made, so a struggling server sees a bounded
+    amount of extra load instead of every request being multiplied by ``maxRetries``.
+    """
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+    MAX_RETRIES = 3
+    BASE_DELAY = 0.5  # seconds
+    MAX_DELAY = 30.0  # seconds
+    BUDGET_RATIO = 0.2
+    MIN_RETRIES = 10
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: ``maxRetries``, ``baseDelay``, ``maxDelay``, ``budgetRatio``, ``minRetries`` - see class
+        constants for defaults
+        """
+        self.maxRetries = kwargs.get('maxRetries', self.MAX_RETRIES)
+        self.baseDelay = kwargs.get('baseDelay', self.BASE_DELAY)
+        self.maxDelay = kwargs.get('maxDelay', self.MAX_DELAY)
+        self.budgetRatio = kwargs.get('budgetRatio', self.BUDGET_RATIO)
+        self.minRetries = kwargs.get('minRetries', self.MIN_RETRIES)
+        if min(self.maxRetries, self.baseDelay, self.maxDelay, self.budgetRatio, self.minRetries) < 0:
+            raise ValueError("Retry parameters must be >= 0")
+        self._requests = 0
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def isRetryable(self, response: 'Response') -> bool:
+        return response.status_code in self.RETRY_STATUSES
+
+    def recordRequest(self) -> None:
+        """
+        Records a first attempt, funding the retry budget.
+        :return:
+        """
+        with self._lock:
+            self._requests += 1
+
+    def tryAcquireRetry(self, attempt: int) -> bool:
+        """
+        :param attempt: number of the failed attempt, from 0
+        :return: ``True`` if a retry is permitted, the retry is charged to the budget
+        """
+        if attempt >= self.maxRetries:
+            return False
+        with self._lock:
+            if self._retries >= self.minRetries + self.budgetRatio * self._requests:
+                return False
+            self._retries += 1
+            return True
+
+    def delay(self, attempt: int, retryAfter: Optional[float] = None) -> float:
+        """
+        :param attempt: number of the failed attempt, from 0
+        :param retryAfter: seconds requested by the server
+        :return: seconds to wait before the next attempt
+        """
+        backoff = random.uniform(0, min(self.maxDelay, self.baseDelay * 2 ** attempt))
+        return max(backoff, min(retryAfter or 0, self.maxDelay))
+
+    @staticmethod
+    def retryAfterSeconds(response: 'Response') -> Optional[float]:
+        """
+        :param response:
+        :return: the ``Retry-After`` header in seconds, ``None`` if absent or an HTTP-date
+        """
+        try:
+            return max(0.0, float(response.headers['Retry-After']))
+        except (KeyError, ValueError, TypeError):
+            return None
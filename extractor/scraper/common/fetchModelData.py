@@ -1,15 +1,24 @@
+import asyncio
+import itertools
 import logging
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass
 from datetime import datetime
 from typing import *
 
+import requests
+
 from common.domain.dto.modelDto import Model as ModelDto
 from extractor.scraper.common.HttpClient import httpClient
 
 log = logging.getLogger()
 
+# default upper bound on the number of model data requests in flight at once
+MAX_WORKERS = 8
+
 ModelDtosAndJsonDataByName = namedtuple('ModelDtosAndJsonDataByName', ['modelDtos', 'jsonDataByName'])
+ModelDtoAndJsonData = namedtuple('ModelDtoAndJsonData', ['modelDto', 'jsonData'])
 
 
 @dataclass
@@ -44,26 +53,97 @@ def _addMetadata(jsonData: Dict, metadata: Dict) -> None:
 def _fetchJsonData(modelFetchDto: ModelFetchDto) -> Optional[Dict]:
     try:
         return httpClient.getRequest(modelFetchDto.path).json()
-    except RuntimeError as e:
+    # RequestException: connection errors and timeouts that outlasted HttpClient's retries
+    except (RuntimeError, requests.RequestException) as e:
         log.info(f"Unable to fetch {modelFetchDto.modelName}")
         log.debug(e.__cause__)
         return None
 
 
+async def _fetchJsonDataAsync(modelFetchDto: ModelFetchDto, semaphore: asyncio.Semaphore) -> Optional[Dict]:
+    async with semaphore:
+        return await asyncio.to_thread(_fetchJsonData, modelFetchDto)
+
+
 def fetchModels(modelFetchDtosByName: Dict[str, ModelFetchDto],
-                modelYear: datetime.date) -> ModelDtosAndJsonDataByName:
+                modelYear: datetime.date, maxWorkers: int = MAX_WORKERS) -> ModelDtosAndJsonDataByName:
     """
     This fetches all jsonData, logging any failures.  Models for which no JSON could be retrieved are filtered.
-    The json data is returned as a dict by ModelName to maintain a relationship between the model and data
+    The json data is returned as a dict by ModelName to maintain a relationship between the model and data.
+    Requests are made concurrently, with at most ``maxWorkers`` in flight at once.  Results are assembled in the
+    iteration order of ``modelFetchDtosByName``, regardless of the order in which requests complete.
+    :param modelFetchDtosByName:
+    :param modelYear:
+    :param maxWorkers: maximum number of concurrent requests, ``1`` fetches sequentially
+    :return:
+    """
+    if maxWorkers < 1:
+        raise ValueError(f"maxWorkers must be >= 1, received: {maxWorkers}")
+    if maxWorkers == 1 or len(modelFetchDtosByName) <= 1:
+        jsonDataIter = map(_fetchJsonData, modelFetchDtosByName.values())
+        return _collectModels(modelFetchDtosByName=modelFetchDtosByName, jsonDataIter=jsonDataIter,
+                              modelYear=modelYear)
+    with ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='fetchModels') as executor:
+        # executor.map yields results in submission order
+        jsonDataIter = executor.map(_fetchJsonData, modelFetchDtosByName.values())
+        return _collectModels(modelFetchDtosByName=modelFetchDtosByName, jsonDataIter=jsonDataIter,
+                              modelYear=modelYear)
+
+
+def streamModels(modelFetchDtosByName: Dict[str, ModelFetchDto], modelYear: datetime.date,
+                 maxWorkers: int = MAX_WORKERS) -> Iterator[ModelDtoAndJsonData]:
+    """
+    Streaming counterpart of ``fetchModels``.  Each model is yielded with its json data as soon as it is fetched
+    (in completion order), failures are logged and skipped.  A new request is only started when one completes, so
+    at most ``maxWorkers`` payloads are held at once however many models are fetched.
+    :param modelFetchDtosByName:
+    :param modelYear:
+    :param maxWorkers: maximum number of concurrent requests
+    :return:
+    """
+    if maxWorkers < 1:
+        raise ValueError(f"maxWorkers must be >= 1, received: {maxWorkers}")
+    fetchDtos = iter(modelFetchDtosByName.values())
+    with ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='streamModels') as executor:
+        pending = {executor.submit(_fetchJsonData, fetchDto): fetchDto
+                   for fetchDto in itertools.islice(fetchDtos, maxWorkers)}
+        while pending:
+            done, _notDone = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                fetchDto = pending.pop(future)
+                if (nextFetchDto := next(fetchDtos, None)) is not None:
+                    pending[executor.submit(_fetchJsonData, nextFetchDto)] = nextFetchDto
+                if (jsonData := future.result()) is None:
+                    continue
+                _addMetadata(jsonData=jsonData, metadata=fetchDto.metadata)
+                yield ModelDtoAndJsonData(modelDto=_createUnsyncedModelDto(modelFetchDto=fetchDto, modelYear=modelYear),
+                                          jsonData=jsonData)
+
+
+async def fetchModelsAsync(modelFetchDtosByName: Dict[str, ModelFetchDto],
+                           modelYear: datetime.date, maxInFlight: int = MAX_WORKERS) -> ModelDtosAndJsonDataByName:
+    """
+    Awaitable counterpart of ``fetchModels``.  At most ``maxInFlight`` requests from this call are pending at once.
     :param modelFetchDtosByName:
-    :param brandId:
     :param modelYear:
+    :param maxInFlight: maximum number of concurrent requests
     :return:
     """
+    if maxInFlight < 1:
+        raise ValueError(f"maxInFlight must be >= 1, received: {maxInFlight}")
+    semaphore = asyncio.Semaphore(maxInFlight)
+    jsonData = await asyncio.gather(
+        *(_fetchJsonDataAsync(fetchDto, semaphore) for fetchDto in modelFetchDtosByName.values()))
+    return _collectModels(modelFetchDtosByName=modelFetchDtosByName, jsonDataIter=iter(jsonData),
+                          modelYear=modelYear)
+
+
+def _collectModels(modelFetchDtosByName: Dict[str, ModelFetchDto], jsonDataIter: Iterator[Optional[Dict]],
+                   modelYear: datetime.date) -> ModelDtosAndJsonDataByName:
     models = list()
     jsonDataByName = dict()
-    for modelName, fetchDto in modelFetchDtosByName.items():
-        if (jsonData := _fetchJsonData(fetchDto)) is None:
+    for (modelName, fetchDto), jsonData in zip(modelFetchDtosByName.items(), jsonDataIter):
+        if jsonData is None:
             continue
         _addMetadata(jsonData=jsonData, metadata=fetchDto.metadata)
         models.append(
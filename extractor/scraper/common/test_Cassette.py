@@ -0,0 +1,88 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from requests import Response
+
+from extractor.scraper.common.Cassette import Cassette, CassetteMode
+from extractor.scraper.common.HttpClient import HttpClient
+
+
+def createResponse(status: int = 200, content: bytes = b'{"data": true}') -> Response:
+    response = Response()
+    response.status_code = status
+    response._content = content
+    response.encoding = 'utf-8'
+    response.headers.update({'Content-Type': 'application/json'})
+    return response
+
+
+class TestCassette(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempDir.name, 'cassette.json.gz')
+        self.url = 'https://www.toyota.com/service/tcom/series/en'
+
+    def tearDown(self) -> None:
+        self.tempDir.cleanup()
+
+    def test_recordThenReplay(self):
+        with Cassette(self.path, CassetteMode.RECORD) as cassette:
+            cassette.record(self.url, {'a': 'b'}, createResponse())
+        found = Cassette(self.path, CassetteMode.REPLAY).play(self.url, {'A': 'b'})
+        self.assertEqual(200, found.status_code)
+        self.assertEqual({"data": True}, found.json())
+        self.assertEqual('application/json', found.headers['content-type'])
+
+    def test_replayRepeatedRequestsInOrder(self):
+        with Cassette(self.path, CassetteMode.RECORD) as cassette:
+            cassette.record(self.url, None, createResponse(content=b'1'))
+            cassette.record(self.url, None, createResponse(content=b'2'))
+        cassette = Cassette(self.path, CassetteMode.REPLAY)
+        found = [cassette.play(self.url, None).content for _ in range(3)]
+        self.assertEqual([b'1', b'2', b'2'], found)
+
+    def test_playRaisesOnMiss(self):
+        with Cassette(self.path, CassetteMode.RECORD) as cassette:
+            cassette.record(self.url, None, createResponse())
+        cassette = Cassette(self.path, CassetteMode.REPLAY)
+        self.assertRaises(KeyError, lambda: cassette.play(self.url, {'a': 'b'}))
+
+    def test_recordRaisesWhenReplaying(self):
+        Cassette(self.path, CassetteMode.RECORD).save()
+        cassette = Cassette(self.path, CassetteMode.REPLAY)
+        self.assertRaises(ValueError, lambda: cassette.record(self.url, None, createResponse()))
+
+
+class TestHttpClientWithCassette(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempDir.name, 'cassette.json.gz')
+        self.url = 'https://www.toyota.com/service/tcom/series/en'
+
+    def tearDown(self) -> None:
+        self.tempDir.cleanup()
+
+    def test_getRequestRecordsAndReplays(self):
+        recorder = HttpClient()
+        recorder.session.get = MagicMock(side_effect=[createResponse(), createResponse(status=404)])
+        with Cassette(self.path, CassetteMode.RECORD) as cassette:
+            recorder.setCassette(cassette)
+            recorder.getRequest(self.url)
+            self.assertRaises(RuntimeError, lambda: recorder.getRequest(self.url + '/missing'))
+
+        player = HttpClient(cassette=Cassette(self.path, CassetteMode.REPLAY))
+        player.session.get = MagicMock()
+        self.assertEqual({"data": True}, player.getRequest(self.url).json())
+        self.assertRaises(RuntimeError, lambda: player.getRequest(self.url + '/missing'))
+        player.session.get.assert_not_called()
+
+    def test_getRequestRaisesOnUnrecordedRequest(self):
+        Cassette(self.path, CassetteMode.RECORD).save()
+        player = HttpClient(cassette=Cassette(self.path, CassetteMode.REPLAY))
+        player.session.get = MagicMock()
+        self.assertRaises(RuntimeError, lambda: player.getRequest(self.url))
+        player.session.get.assert_not_called()
@@ -0,0 +1,103 @@
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+import requests
+from requests import Response
+
+from extractor.scraper.common.HttpClient import HttpClient
+from extractor.scraper.common.RateLimiter import HostRateLimiter
+from extractor.scraper.common.RetryPolicy import RetryPolicy
+
+
+def createResponse(status: int, headers: dict = None) -> Response:
+    response = Response()
+    response.status_code = status
+    response.headers.update(headers or dict())
+    return response
+
+
+class TestHttpClient(TestCase):
+
+    def setUp(self) -> None:
+        self.httpClient = HttpClient(poolConnections=2, poolMaxSize=4)
+        self.response = Response()
+        self.response.status_code = 200
+        self.httpClient.session.get = MagicMock(return_value=self.response)
+
+    def tearDown(self) -> None:
+        self.httpClient = None
+
+    def test_sessionAdapterPoolSizedByConfiguration(self):
+        client = HttpClient(poolConnections=3, poolMaxSize=7)
+        adapter = client.session.get_adapter('https://www.chevrolet.com')
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(7, adapter._pool_maxsize)
+
+    def test_getRequestUsesSession(self):
+        self.httpClient.getRequest('https://www.toyota.com', headers={'a': 'b'})
+        self.httpClient.session.get.assert_called_once_with('https://www.toyota.com', headers={'a': 'b'})
+
+    def test_getRequestSetsDefaultEncoding(self):
+        self.response.encoding = None
+        found = self.httpClient.getRequest('https://www.toyota.com')
+        self.assertEqual('utf-8', found.encoding)
+
+    def test_getRequestRaisesOnErrorStatus(self):
+        self.response.status_code = 404
+        self.assertRaises(RuntimeError, lambda: self.httpClient.getRequest('https://www.toyota.com'))
+
+    def test_closeReplacesSession(self):
+        oldSession = self.httpClient.session
+        self.httpClient.close()
+        self.assertIsNot(oldSession, self.httpClient.session)
+
+
+class TestHttpClientRetries(TestCase):
+
+    def setUp(self) -> None:
+        self.rateLimiter = HostRateLimiter(rate=1000, burst=1000, maxRate=1000)
+        self.httpClient = HttpClient(rateLimiter=self.rateLimiter,
+                                     retryPolicy=RetryPolicy(maxRetries=2, baseDelay=0, minRetries=10))
+        self.httpClient.session.get = MagicMock()
+        self.patcherTime = mock.patch('extractor.scraper.common.HttpClient.time')
+        self.sleepMock = self.patcherTime.start().sleep
+        self.url = 'https://www.toyota.com'
+
+    def tearDown(self) -> None:
+        self.patcherTime.stop()
+
+    def test_getRequestRetriesRetryableStatus(self):
+        self.httpClient.session.get.side_effect = [createResponse(503), createResponse(200)]
+        self.assertEqual(200, self.httpClient.getRequest(self.url).status_code)
+        metrics = self.httpClient.getMetrics()
+        self.assertEqual(2, metrics['requests'])
+        self.assertEqual(1, metrics['retries'])
+        self.assertEqual(1, metrics['throttled'])
+        self.assertLess(metrics['rates']['www.toyota.com'], 1000)
+
+    def test_getRequestHonorsRetryAfter(self):
+        self.httpClient.rateLimiter = None  # would also pause for Retry-After
+        self.httpClient.session.get.side_effect = [createResponse(429, {'Retry-After': '3'}), createResponse(200)]
+        self.httpClient.getRequest(self.url)
+        self.sleepMock.assert_called_once_with(3)
+
+    def test_getRequestRaisesWhenRetriesExhausted(self):
+        self.httpClient.session.get.return_value = createResponse(500)
+        self.assertRaises(RuntimeError, lambda: self.httpClient.getRequest(self.url))
+        self.assertEqual(3, self.httpClient.session.get.call_count)
+
+    def test_getRequestDoesNotRetryClientError(self):
+        self.httpClient.session.get.return_value = createResponse(404)
+        self.assertRaises(RuntimeError, lambda: self.httpClient.getRequest(self.url))
+        self.httpClient.session.get.assert_called_once()
+
+    def test_getRequestRetriesConnectionError(self):
+        self.httpClient.session.get.side_effect = [requests.ConnectionError('reset'), createResponse(200)]
+        self.assertEqual(200, self.httpClient.getRequest(self.url).status_code)
+
+    def test_getRequestStopsRetryingWhenBudgetSpent(self):
+        self.httpClient.retryPolicy = RetryPolicy(maxRetries=2, baseDelay=0, minRetries=0, budgetRatio=0)
+        self.httpClient.session.get.return_value = createResponse(500)
+        self.assertRaises(RuntimeError, lambda: self.httpClient.getRequest(self.url))
+        self.httpClient.session.get.assert_called_once()
+        self.assertEqual(1, self.httpClient.getMetrics()['retryBudgetExhausted'])
@@ -0,0 +1,43 @@
+from unittest import TestCase, mock
+
+from extractor.scraper.common.RateLimiter import TokenBucket, HostRateLimiter
+
+
+class TestTokenBucket(TestCase):
+
+    def setUp(self) -> None:
+        self.bucket = TokenBucket(rate=10, burst=2, minRate=1, maxRate=20, increaseStep=1, decreaseFactor=0.5)
+
+    def test_acquireWaitsWhenEmpty(self):
+        with mock.patch('extractor.scraper.common.RateLimiter.time') as mockTime:
+            mockTime.monotonic.return_value = 0.0
+            self.bucket = TokenBucket(rate=10, burst=2, minRate=1, maxRate=20, increaseStep=1, decreaseFactor=0.5)
+            # a sleeping caller lets time pass
+            mockTime.sleep.side_effect = lambda seconds: setattr(mockTime.monotonic, 'return_value',
+                                                                 mockTime.monotonic.return_value + seconds)
+            self.assertEqual(0, self.bucket.acquire())
+            self.assertEqual(0, self.bucket.acquire())
+            self.assertAlmostEqual(0.1, self.bucket.acquire())
+
+    def test_throttleAndRecoverStayWithinBounds(self):
+        for _ in range(10):
+            self.bucket.throttle()
+        self.assertEqual(1, self.bucket.rate)
+        for _ in range(50):
+            self.bucket.recover()
+        self.assertEqual(20, self.bucket.rate)
+
+    def test_raisesOnInvalidConfiguration(self):
+        self.assertRaises(ValueError, lambda: TokenBucket(rate=30, burst=2, minRate=1, maxRate=20,
+                                                          increaseStep=1, decreaseFactor=0.5))
+
+
+class TestHostRateLimiter(TestCase):
+
+    def test_onResponseThrottlesOnlyThatHost(self):
+        rateLimiter = HostRateLimiter(rate=4, minRate=1, maxRate=8)
+        self.assertTrue(rateLimiter.onResponse('https://www.toyota.com/a', 429))
+        self.assertFalse(rateLimiter.onResponse('https://www.lexus.com/a', 200))
+        rates = rateLimiter.getRates()
+        self.assertEqual(2, rates['www.toyota.com'])
+        self.assertAlmostEqual(4.1, rates['www.lexus.com'])
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+from requests import Response
+
+from extractor.scraper.common.HttpClient import HttpClient
+from extractor.scraper.common.ResponseCache import ResponseCache
+
+
+def createResponse(status: int = 200, content: bytes = b'{"data": true}', headers: dict = None) -> Response:
+    response = Response()
+    response.status_code = status
+    response._content = content
+    response.url = 'https://www.toyota.com/service/tcom/series/en'
+    response.encoding = 'utf-8'
+    response.headers.update(headers or dict())
+    return response
+
+
+class TestResponseCache(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(cacheDir=self.tempDir.name, ttl=60, maxBytes=1024)
+
+    def tearDown(self) -> None:
+        self.tempDir.cleanup()
+
+    def test_createKeyDependsOnHeaders(self):
+        url = 'https://www.chevrolet.com'
+        self.assertEqual(self.cache.createKey(url, {'A': '1', 'b': '2'}), self.cache.createKey(url, {'b': '2', 'a': '1'}))
+        self.assertNotEqual(self.cache.createKey(url), self.cache.createKey(url, {'a': '1'}))
+
+    def test_putAndGet(self):
+        key = self.cache.createKey('https://www.toyota.com')
+        self.cache.put(key, createResponse(headers={'ETag': '"abc"'}))
+        cached = self.cache.get(key)
+        self.assertEqual('"abc"', cached.etag)
+        self.assertTrue(self.cache.isFresh(cached))
+        found = self.cache.toResponse(key, cached)
+        self.assertEqual({"data": True}, found.json())
+
+    def test_getReturnsNoneWhenMissing(self):
+        self.assertIsNone(self.cache.get(self.cache.createKey('https://www.toyota.com')))
+
+    def test_putEvictsLeastRecentlyUsed(self):
+        oldKey, newKey = self.cache.createKey('old'), self.cache.createKey('new')
+        self.cache.put(oldKey, createResponse(content=b'0' * 600))
+        os.utime(os.path.join(self.tempDir.name, f'{oldKey}.body'), (time.time() - 100, time.time() - 100))
+        self.cache.put(newKey, createResponse(content=b'1' * 600))
+        self.assertIsNone(self.cache.get(oldKey))
+        self.assertIsNotNone(self.cache.get(newKey))
+
+    def test_putScansDirectoryOnlyToEvict(self):
+        with mock.patch('extractor.scraper.common.ResponseCache.os.scandir', wraps=os.scandir) as scandir:
+            for i in range(3):
+                self.cache.put(self.cache.createKey(str(i)), createResponse(content=b'0' * 300))
+            self.assertEqual(1, scandir.call_count, "initial scan only")
+            self.cache.put(self.cache.createKey('3'), createResponse(content=b'0' * 300))
+            self.assertEqual(2, scandir.call_count)
+        self.assertLessEqual(self.cache._totalBytes, 1024)
+
+    def test_putTracksReplacedAndRemovedEntries(self):
+        key = self.cache.createKey('replaced')
+        for _ in range(3):
+            self.cache.put(key, createResponse(content=b'0' * 600))
+        self.cache.remove(key)
+        self.assertEqual(0, self.cache._totalBytes)
+
+    def test_toResponseWhenEvictedAfterRead(self):
+        key = self.cache.createKey('https://www.toyota.com')
+        self.cache.put(key, createResponse())
+        with mock.patch('extractor.scraper.common.ResponseCache.os.utime', side_effect=FileNotFoundError()):
+            found = self.cache.toResponse(key, self.cache.get(key))
+        self.assertEqual({"data": True}, found.json())
+
+    def test_putSkipsOversizedResponse(self):
+        key = self.cache.createKey('big')
+        self.cache.put(key, createResponse(content=b'0' * 2048))
+        self.assertIsNone(self.cache.get(key))
+
+
+class TestHttpClientWithResponseCache(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(cacheDir=self.tempDir.name, ttl=60)
+        self.httpClient = HttpClient(responseCache=self.cache)
+        self.httpClient.session.get = MagicMock()
+        self.url = 'https://www.toyota.com/service/tcom/series/en'
+
+    def tearDown(self) -> None:
+        self.tempDir.cleanup()
+
+    def test_getRequestServesFreshEntryWithoutRequest(self):
+        self.httpClient.session.get.return_value = createResponse()
+        self.httpClient.getRequest(self.url)
+        found = self.httpClient.getRequest(self.url)
+        self.assertEqual({"data": True}, found.json())
+        self.httpClient.session.get.assert_called_once()
+
+    def test_getRequestRevalidatesStaleEntry(self):
+        self.cache.ttl = 0
+        self.httpClient.session.get.return_value = createResponse(headers={'ETag': '"v1"',
+                                                                          'Last-Modified': 'Sun, 01 Jan 2023 00:00:00 GMT'})
+        self.httpClient.getRequest(self.url, headers={'a': 'b'})
+        self.httpClient.session.get.return_value = createResponse(status=304, content=b'')
+        found = self.httpClient.getRequest(self.url, headers={'a': 'b'})
+        self.assertEqual({"data": True}, found.json())
+        self.httpClient.session.get.assert_called_with(self.url, headers={
+            'a': 'b', 'If-None-Match': '"v1"', 'If-Modified-Since': 'Sun, 01 Jan 2023 00:00:00 GMT'})
+
+    def test_getRequestReplacesModifiedEntry(self):
+        self.cache.ttl = 0
+        self.httpClient.session.get.return_value = createResponse(headers={'ETag': '"v1"'})
+        self.httpClient.getRequest(self.url)
+        self.httpClient.session.get.return_value = createResponse(content=b'{"data": false}', headers={'ETag': '"v2"'})
+        found = self.httpClient.getRequest(self.url)
+        self.assertEqual({"data": False}, found.json())
+        self.assertEqual('"v2"', self.cache.get(self.cache.createKey(self.url)).etag)
+
+    def test_getRequestDoesNotCacheErrors(self):
+        self.httpClient.session.get.return_value = createResponse(status=500)
+        self.assertRaises(RuntimeError, lambda: self.httpClient.getRequest(self.url))
+        self.assertIsNone(self.cache.get(self.cache.createKey(self.url)))
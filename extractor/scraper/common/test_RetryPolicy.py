@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from requests import Response
+
+from extractor.scraper.common.RetryPolicy import RetryPolicy
+
+
+class TestRetryPolicy(TestCase):
+
+    def test_delayIsBoundedExponentialBackoff(self):
+        retryPolicy = RetryPolicy(baseDelay=1, maxDelay=5)
+        for attempt, upperBound in (0, 1), (1, 2), (2, 4), (5, 5):
+            for _ in range(20):
+                self.assertTrue(0 <= retryPolicy.delay(attempt) <= upperBound)
+
+    def test_delayHonorsRetryAfter(self):
+        retryPolicy = RetryPolicy(baseDelay=0, maxDelay=5)
+        self.assertEqual(3, retryPolicy.delay(0, retryAfter=3))
+        self.assertEqual(5, retryPolicy.delay(0, retryAfter=60))
+
+    def test_tryAcquireRetryLimitedByMaxRetries(self):
+        retryPolicy = RetryPolicy(maxRetries=2)
+        self.assertTrue(retryPolicy.tryAcquireRetry(1))
+        self.assertFalse(retryPolicy.tryAcquireRetry(2))
+
+    def test_tryAcquireRetryLimitedByBudget(self):
+        retryPolicy = RetryPolicy(minRetries=1, budgetRatio=0.5)
+        for _ in range(2):
+            retryPolicy.recordRequest()
+        self.assertEqual([True, True, False], [retryPolicy.tryAcquireRetry(0) for _ in range(3)])
+
+    def test_retryAfterSeconds(self):
+        response = Response()
+        self.assertIsNone(RetryPolicy.retryAfterSeconds(response))
+        response.headers['Retry-After'] = '7'
+        self.assertEqual(7, RetryPolicy.retryAfterSeconds(response))
+        response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        self.assertIsNone(RetryPolicy.retryAfterSeconds(response))
@@ -1,13 +1,16 @@
+import asyncio
 import datetime
+import time
 from unittest import TestCase, mock
 from unittest.mock import MagicMock
 
+import requests
 from requests import Response
 
 from common.domain.dto.modelDto import Model as ModelDto
 from extractor.scraper.common.fetchModelData import _addMetadata, _createUnsyncedModelDto, ModelFetchDto, \
     _fetchJsonData, \
-    ModelDtosAndJsonDataByName, fetchModels
+    ModelDtosAndJsonDataByName, fetchModels, fetchModelsAsync, streamModels, ModelDtoAndJsonData
 
 
 class Test(TestCase):
@@ -55,6 +58,11 @@ class Test(TestCase):
         modelFetchDto = ModelFetchDto(modelName="CarModel", modelCode="car-model", path="http://www.ericgha.com")
         self.assertIsNone(_fetchJsonData(modelFetchDto))
 
+    def test__fetchJsonDataConnectionFailure(self):
+        self.httpClientMock.side_effect = requests.ConnectionError("DummyError")
+        modelFetchDto = ModelFetchDto(modelName="CarModel", modelCode="car-model", path="http://www.ericgha.com")
+        self.assertIsNone(_fetchJsonData(modelFetchDto))
+
     def test_fetchModelsSuccessfulFetch(self):
         json = {"success": True}
         metadata = {"metadata": True}
@@ -77,3 +85,102 @@ class Test(TestCase):
         expected = ModelDtosAndJsonDataByName(modelDtos=list(), jsonDataByName=dict())
         found = fetchModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear)
         self.assertEqual(expected, found)
+
+    def test_fetchModelsConcurrentPreservesOrder(self):
+        # responses complete out of order, results should still follow modelFetchDtosByName order
+        delays = {"http://www.ericgha.com/0": .03, "http://www.ericgha.com/1": 0, "http://www.ericgha.com/2": .01}
+
+        def getRequest(path: str) -> Response:
+            time.sleep(delays[path])
+            response = Response()
+            response.json = MagicMock(return_value={"path": path})
+            return response
+
+        self.httpClientMock.side_effect = getRequest
+        modelFetchDtosByName = {f"Model{i}": ModelFetchDto(modelName=f"Model{i}", modelCode=f"model-{i}",
+                                                          path=f"http://www.ericgha.com/{i}") for i in range(3)}
+        modelYear = datetime.date(2022, 1, 1)
+        found = fetchModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear, maxWorkers=3)
+        self.assertEqual(["Model0", "Model1", "Model2"], [modelDto.name for modelDto in found.modelDtos])
+        self.assertEqual(["Model0", "Model1", "Model2"], list(found.jsonDataByName.keys()))
+        self.assertEqual({"path": "http://www.ericgha.com/2"}, found.jsonDataByName["Model2"])
+
+    def test_fetchModelsConcurrentFiltersFailures(self):
+        def getRequest(path: str) -> Response:
+            if path.endswith("fail"):
+                raise RuntimeError("DummyError")
+            return self.httpClientResponseMock
+
+        self.httpClientMock.side_effect = getRequest
+        self.httpClientResponseMock.json.side_effect = lambda: {"success": True}
+        modelFetchDtosByName = {
+            "Success": ModelFetchDto(modelName="Success", modelCode="success", path="http://www.ericgha.com/ok"),
+            "Failure": ModelFetchDto(modelName="Failure", modelCode="failure", path="http://www.ericgha.com/fail")}
+        modelYear = datetime.date(2022, 1, 1)
+        found = fetchModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear, maxWorkers=2)
+        expected = ModelDtosAndJsonDataByName(modelDtos=[ModelDto(name="Success", model_year=modelYear)],
+                                              jsonDataByName={"Success": {"success": True}})
+        self.assertEqual(expected, found)
+
+    def test_fetchModelsRaisesOnInvalidMaxWorkers(self):
+        self.assertRaises(ValueError, lambda: fetchModels(modelFetchDtosByName=dict(),
+                                                          modelYear=datetime.date(2022, 1, 1), maxWorkers=0))
+
+    def test_streamModelsYieldsFetchedModels(self):
+        def getRequest(path: str) -> Response:
+            if path.endswith("fail"):
+                raise RuntimeError("DummyError")
+            response = Response()
+            response.json = MagicMock(return_value={"path": path})
+            return response
+
+        self.httpClientMock.side_effect = getRequest
+        modelFetchDtosByName = {f"Model{i}": ModelFetchDto(modelName=f"Model{i}", modelCode=f"model-{i}",
+                                                          path=f"http://www.ericgha.com/{i}",
+                                                          metadata={"metadata": i}) for i in range(5)}
+        modelFetchDtosByName["Failure"] = ModelFetchDto(modelName="Failure", modelCode="failure",
+                                                        path="http://www.ericgha.com/fail")
+        modelYear = datetime.date(2022, 1, 1)
+        found = list(streamModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear, maxWorkers=2))
+        expected = [ModelDtoAndJsonData(modelDto=ModelDto(name=f"Model{i}", model_year=modelYear),
+                                        jsonData={"path": f"http://www.ericgha.com/{i}", "metadata": i})
+                    for i in range(5)]
+        self.assertCountEqual(expected, found)
+
+    def test_streamModelsBoundsRequestsInFlight(self):
+        consumed = list()
+        self.httpClientMock.side_effect = lambda path: consumed.append(path) or self.httpClientResponseMock
+        self.httpClientResponseMock.json.side_effect = lambda: dict()
+        modelFetchDtosByName = {f"Model{i}": ModelFetchDto(modelName=f"Model{i}", modelCode=f"model-{i}",
+                                                          path=f"http://www.ericgha.com/{i}") for i in range(10)}
+        stream = streamModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=datetime.date(2022, 1, 1),
+                              maxWorkers=2)
+        next(stream)
+        # first two submitted, then one more as each completes, before the first model is yielded
+        self.assertLessEqual(len(consumed), 4)
+        self.assertEqual(9, len(list(stream)))
+
+    def test_fetchModelsAsyncSuccessfulFetch(self):
+        json = {"success": True}
+        metadata = {"metadata": True}
+        self.httpClientResponseMock.json.side_effect = lambda: dict(json)
+        modelFetchDtosByName = {
+            "ModelName": ModelFetchDto(modelName="ModelName", modelCode="car-model", path="http://www.ericgha.com",
+                                       metadata=metadata),
+            "OtherName": ModelFetchDto(modelName="OtherName", modelCode="other-model", path="http://www.ericgha.com")}
+        modelYear = datetime.date(2022, 1, 1)
+        expected = ModelDtosAndJsonDataByName(
+            modelDtos=[ModelDto(name="ModelName", model_year=modelYear), ModelDto(name="OtherName", model_year=modelYear)],
+            jsonDataByName={"ModelName": {**json, **metadata}, "OtherName": json})
+        found = asyncio.run(fetchModelsAsync(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear,
+                                             maxInFlight=1))
+        self.assertEqual(expected, found)
+
+    def test_fetchModelsAsyncFetchFailure(self):
+        self.httpClientMock.side_effect = RuntimeError("DummyError")
+        modelFetchDtosByName = {
+            "ModelName": ModelFetchDto(modelName="CarModel", modelCode="car-model", path="http://www.ericgha.com")}
+        modelYear = datetime.date(2022, 1, 1)
+        expected = ModelDtosAndJsonDataByName(modelDtos=list(), jsonDataByName=dict())
+        found = asyncio.run(fetchModelsAsync(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear))
+        self.assertEqual(expected, found)
@@ -1,7 +1,6 @@
 from datetime import date
-from typing import Iterable, Dict
 
-from extractor.scraper.common.fetchModelData import ModelFetchDto, ModelDtosAndJsonDataByName, fetchModels
+from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName, fetchModels
 from extractor.scraper.gm.GmScraper import GmScraper
 
 
@@ -21,18 +20,7 @@ class BuickScraper(GmScraper):
             self.log.info(f"Unable to match {bodyStyle}.  Using {foundModel}")
         return foundModel
 
-    def _createModelFetchDtosByName(self, bodyStyles: Iterable[str], modelYear: date) -> Dict[str, ModelFetchDto]:
-        if not bodyStyles:
-            raise ValueError("Received an empty or null bodyStyles argument")
-        dtos = dict()
-        for bodyStyle in bodyStyles:
-            modelName = self._getModelName(bodyStyle)
-            dtos[modelName] = self._createModelFetchDto(bodyStyle=bodyStyle, modelName=modelName, modelYear=modelYear)
-        return dtos
-
     def fetchModelYear(self, modelYear: date) -> ModelDtosAndJsonDataByName:
-        self._validateModelYear(modelYear)
-        bodyStyles = self._fetchBodyStyles(modelYear)
-        modelFetchDtosByName = self._createModelFetchDtosByName(bodyStyles=bodyStyles, modelYear=modelYear)
+        modelFetchDtosByName = self.fetchModelFetchDtos(modelYear)
         return fetchModels(modelFetchDtosByName=modelFetchDtosByName,
-                           modelYear=modelYear)
\ No newline at end of file
+                           modelYear=modelYear, maxWorkers=self.maxWorkers)
\ No newline at end of file
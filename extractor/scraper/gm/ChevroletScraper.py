@@ -1,6 +1,4 @@
-from typing import Iterable, Dict
-
-from extractor.scraper.common.fetchModelData import ModelFetchDto, fetchModels, ModelDtosAndJsonDataByName
+from extractor.scraper.common.fetchModelData import fetchModels, ModelDtosAndJsonDataByName
 from extractor.scraper.gm.GmScraper import GmScraper
 from datetime import date
 
@@ -32,21 +30,10 @@ class ChevroletScraper(GmScraper):
             self.log.info(f"Could not locate {bodyStyle}. Using model name {bodyStyle}")
             return " ".join(nameElems+suffix)
 
-    def _createModelFetchDtosByName(self, bodyStyles: Iterable[str], modelYear: date) -> Dict[str, ModelFetchDto]:
-        if not bodyStyles:
-            raise ValueError("Received an empty or null bodyStyles argument")
-        dtos = dict()
-        for bodyStyle in bodyStyles:
-            modelName = self._getModelName(bodyStyle)
-            dtos[modelName] = self._createModelFetchDto(bodyStyle=bodyStyle, modelName=modelName, modelYear=modelYear)
-        return dtos
-
     def fetchModelYear(self, modelYear: date) -> ModelDtosAndJsonDataByName:
-        self._validateModelYear(modelYear)
-        bodyStyles = self._fetchBodyStyles(modelYear)
-        modelFetchDtosByName = self._createModelFetchDtosByName(bodyStyles=bodyStyles, modelYear=modelYear)
+        modelFetchDtosByName = self.fetchModelFetchDtos(modelYear)
         return fetchModels(modelFetchDtosByName=modelFetchDtosByName,
-                                                 modelYear=modelYear)
+                           modelYear=modelYear, maxWorkers=self.maxWorkers)
 
 
 
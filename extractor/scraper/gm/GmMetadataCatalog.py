@@ -0,0 +1,75 @@
+import logging
+import threading
+from typing import Dict, List, Hashable, Union
+
+import requests
+
+from extractor.scraper.common.HttpClient import httpClient
+
+
+class GmMetadataCatalog:
+    """
+    Per-brand store of the GM lookup documents used to discover models: the ``shoppingLinks`` document and the
+    ``getVehicleInfo`` model list of each year.  Each document is fetched at most once over the life of the catalog
+    (a scraper instance), so that repeated ``fetchModelYear`` calls and scraper initialization share a single
+    download.  A year without models is remembered as well, HTTP and connection errors are not, the next caller
+    fetches again.  Safe for concurrent use, concurrent requests for the same document wait for a single
+    fetch.
+    """
+    # these are the minimum required headers, 415 or 400 responses if any less
+    VEHICLE_INFO_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+                            'clientApplicationId': 'quantum'}
+
+    def __init__(self, brandName: str, domain: str):
+        self.log = logging.getLogger(type(self).__name__)
+        self.brandName = brandName
+        self.domain = domain
+        self._documents: Dict[Hashable, Union[Dict, List, ValueError]] = dict()
+        self._locks: Dict[Hashable, threading.Lock] = dict()
+        self._locksLock = threading.Lock()
+
+    def shoppingLinksUrl(self) -> str:
+        # ex: https://www.chevrolet.com/apps/atomic/shoppingLinks.brand=chevrolet.country=US.region=na.language=en.json
+        return f'{self.domain}/apps/atomic/shoppingLinks.brand={self.brandName.lower()}.country=US.region=na.language=en.json'
+
+    def vehicleInfoUrl(self, year: int) -> str:
+        return self.domain + f'/bypass/pcf/vehicle-selector-service/v1/getVehicleInfo/{self.brandName.lower()}/us/b2c/en?requestType=models&year={year}'
+
+    def _getOnce(self, key: Hashable, fetch) -> Union[Dict, List]:
+        with self._locksLock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._documents:
+                try:
+                    self._documents[key] = fetch()
+                except ValueError as e:
+                    self._documents[key] = e
+        found = self._documents[key]
+        if isinstance(found, ValueError):
+            raise found
+        return found
+
+    def getShoppingLinks(self) -> Dict:
+        """
+        :return: the ``shoppingLinks`` document, ``{year: {carLine: {bodyStyle: ...}}}``
+        """
+        return self._getOnce('shoppingLinks', lambda: httpClient.getRequest(self.shoppingLinksUrl()).json())
+
+    def _fetchVehicleInfoOptions(self, year: int) -> List[Dict]:
+        res = httpClient.getRequest(self.vehicleInfoUrl(year), headers=self.VEHICLE_INFO_HEADERS)
+        options = res.json().get('options')
+        if not options:
+            raise ValueError(f'No models found for model year {year}.')
+        return options
+
+    def getVehicleInfoOptions(self, year: int) -> List[Dict]:
+        """
+        :param year:
+        :return: the ``getVehicleInfo`` models of ``year``, ``[{'code': bodyStyle, 'title': name}, ...]``
+        :raises: ``ValueError`` if the year could not be fetched
+        """
+        try:
+            return self._getOnce(('vehicleInfo', year), lambda: self._fetchVehicleInfoOptions(year))
+        except (RuntimeError, requests.RequestException) as e:
+            # possibly transient, not cached
+            raise ValueError(f'Unable to fetch model year {year}.') from e
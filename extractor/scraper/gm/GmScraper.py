@@ -3,8 +3,8 @@ from datetime import date
 from typing import *
 
 from extractor.scraper.ModelInfoScraper import ModelInfoScraper
-from extractor.scraper.common.HttpClient import httpClient
 from extractor.scraper.common.fetchModelData import ModelFetchDto, ModelDtosAndJsonDataByName
+from extractor.scraper.gm.GmMetadataCatalog import GmMetadataCatalog
 
 CarLineAndBodyStyle = namedtuple('CarLineAndBodyStyle', ['carLine', 'bodyStyle'] )
 BodyStyleAndName = namedtuple('BodyStyleAndName', ['bodyStyle', 'name'] )
@@ -18,6 +18,8 @@ class GmScraper(ModelInfoScraper):
     def __init__(self, brandName: str, domain: str, **kwargs):
         super().__init__(brandName=brandName, manufacturerCommon=self.MANUFACTURER_COMMON, **kwargs)
         self.domain = domain
+        # lookup documents are fetched once and shared by initialization and every fetchModelYear call
+        self.catalog = GmMetadataCatalog(brandName=brandName, domain=domain)
         if not kwargs.get('noInit', False ):
             self.bodyStyleToName = self._getBodyStyleToName()
             self.bodyStyleToCarLine = self._getBodyStyleToCarLine()
@@ -26,14 +28,12 @@ class GmScraper(ModelInfoScraper):
             self.bodyStyleToCarLine = dict()
 
     def _generateModelListUrl(self) -> str:
-        # ex: https://www.chevrolet.com/apps/atomic/shoppingLinks.brand=chevrolet.country=US.region=na.language=en.json
-        return f'{self.domain}/apps/atomic/shoppingLinks.brand={self.brandName.lower() }.country=US.region=na.language=en.json'
+        return self.catalog.shoppingLinksUrl()
 
-    # data is optional: will fetch otherwise
+    # data is optional: will use the catalog otherwise
     def _fetchCarLinesAndBodyStyles(self, year: int, data: Dict = None) -> List[CarLineAndBodyStyle]:
         if not data:
-            url = self._generateModelListUrl()
-            data = httpClient.getRequest(url).json()
+            data = self.catalog.getShoppingLinks()
         carLines = data.get(str(year))
         if carLines is None:
             raise ValueError(f'No models for year: {year} could be located.')
@@ -46,16 +46,7 @@ class GmScraper(ModelInfoScraper):
 
     # This api works for more recent model lists
     def _fetchBodyStylesAndNames(self, year: int) -> List[BodyStyleAndName]:
-        # these are the minimum required headers, 415 or 400 responses if any less
-        HEADERS = {'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8', 'clientApplicationId': 'quantum'}
-        URL = self.domain + f'/bypass/pcf/vehicle-selector-service/v1/getVehicleInfo/{self.brandName.lower()}/us/b2c/en?requestType=models&year={year}'
-        try:
-            res = httpClient.getRequest(URL, headers=HEADERS)
-        except RuntimeError:
-            raise ValueError(f'Unable to fetch model year {year}.')
-        modelYear = res.json().get('options')
-        if not modelYear:
-            raise ValueError(f'Unable to fetch model year {year}.')
+        modelYear = self.catalog.getVehicleInfoOptions(year)
         # in gm terminology bodystyle is a specific model in a carline (ie carline: corvette, bodystyle:
         # corvette-z06)
         stylesAndNames = list()
@@ -82,9 +73,7 @@ class GmScraper(ModelInfoScraper):
         return bodyStyleToName
 
     def _getBodyStyleToCarLine(self) -> Dict[str, str]:
-        URL = self._generateModelListUrl()
-        res = httpClient.getRequest(URL)
-        shoppingLinks = res.json()
+        shoppingLinks = self.catalog.getShoppingLinks()
         minYear, maxYear = float('inf'), float('-inf')
         for year in shoppingLinks.keys():
             minYear = min(int(year), minYear)
@@ -150,6 +139,20 @@ class GmScraper(ModelInfoScraper):
         metadata = {"metadata" : { "bodyStyle": bodyStyle, "carLine" : carLine }}
         return ModelFetchDto(modelCode=bodyStyle, path=path, metadata=metadata, modelName=modelName)
 
+    def _createModelFetchDtosByName(self, bodyStyles: Iterable[str], modelYear: date) -> Dict[str, ModelFetchDto]:
+        if not bodyStyles:
+            raise ValueError("Received an empty or null bodyStyles argument")
+        dtos = dict()
+        for bodyStyle in bodyStyles:
+            modelName = self._getModelName(bodyStyle)
+            dtos[modelName] = self._createModelFetchDto(bodyStyle=bodyStyle, modelName=modelName, modelYear=modelYear)
+        return dtos
+
+    def fetchModelFetchDtos(self, modelYear: date) -> Dict[str, ModelFetchDto]:
+        self._validateModelYear(modelYear)
+        bodyStyles = self._fetchBodyStyles(modelYear)
+        return self._createModelFetchDtosByName(bodyStyles=bodyStyles, modelYear=modelYear)
+
     def fetchModelYear(self, date: 'date') -> ModelDtosAndJsonDataByName:
         """
         Extending classes should implement
@@ -19,7 +19,7 @@ class TestChevroletScraper(TestCase):
         self.sessionFactoryMock = MockSessionFactory()
         self.httpClientResponseMock = Response()
         self.httpClientResponseMock.json = MagicMock(return_value={})
-        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmScraper.httpClient.getRequest',
+        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmMetadataCatalog.httpClient.getRequest',
                                             return_value=self.httpClientResponseMock)
         self.httpClientMock = self.patcherHttpClient.start()
         self.scraper = ChevroletScraper(noInit=True, noPersist=True)
@@ -0,0 +1,72 @@
+from datetime import date
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+import requests
+from parameterized import parameterized
+from requests import Response
+
+from extractor.scraper.gm.GmMetadataCatalog import GmMetadataCatalog
+from extractor.scraper.gm.GmScraper import GmScraper
+
+
+class TestGmMetadataCatalog(TestCase):
+
+    def setUp(self) -> None:
+        self.httpClientResponseMock = Response()
+        self.httpClientResponseMock.json = MagicMock(return_value={'2022': {'corvette': {'corvette-z06': {}}}})
+        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmMetadataCatalog.httpClient.getRequest',
+                                            return_value=self.httpClientResponseMock)
+        self.httpClientMock = self.patcherHttpClient.start()
+        self.catalog = GmMetadataCatalog('Chevrolet', 'https://www.chevrolet.com')
+
+    def tearDown(self) -> None:
+        self.patcherHttpClient.stop()
+
+    def test_getShoppingLinksFetchesOnce(self):
+        for _ in range(3):
+            self.assertEqual({'2022': {'corvette': {'corvette-z06': {}}}}, self.catalog.getShoppingLinks())
+        self.httpClientMock.assert_called_once_with(
+            'https://www.chevrolet.com/apps/atomic/shoppingLinks.brand=chevrolet.country=US.region=na.language=en.json')
+
+    def test_getVehicleInfoOptionsFetchesOncePerYear(self):
+        self.httpClientResponseMock.json = MagicMock(return_value={'options': [{'code': 'blazer', 'title': 'Blazer'}]})
+        for year in (2022, 2023, 2022, 2023):
+            self.assertEqual([{'code': 'blazer', 'title': 'Blazer'}], self.catalog.getVehicleInfoOptions(year))
+        self.assertEqual(2, self.httpClientMock.call_count)
+
+    def test_getVehicleInfoOptionsRemembersYearWithoutModels(self):
+        self.httpClientResponseMock.json = MagicMock(return_value={'options': []})
+        for _ in range(2):
+            self.assertRaises(ValueError, lambda: self.catalog.getVehicleInfoOptions(2024))
+        self.httpClientMock.assert_called_once()
+
+    @parameterized.expand([(RuntimeError('received a 503 status code'),), (requests.Timeout('read timed out'),)])
+    def test_getVehicleInfoOptionsRetriesAfterHttpError(self, error: Exception):
+        self.httpClientMock.side_effect = [error, self.httpClientResponseMock]
+        self.httpClientResponseMock.json = MagicMock(return_value={'options': [{'code': 'blazer', 'title': 'Blazer'}]})
+        self.assertRaises(ValueError, lambda: self.catalog.getVehicleInfoOptions(2024))
+        self.assertEqual([{'code': 'blazer', 'title': 'Blazer'}], self.catalog.getVehicleInfoOptions(2024))
+        self.assertEqual(2, self.httpClientMock.call_count)
+
+    def test_getShoppingLinksRetriesAfterHttpError(self):
+        self.httpClientMock.side_effect = [RuntimeError('received a 500 status code'), self.httpClientResponseMock]
+        self.assertRaises(RuntimeError, self.catalog.getShoppingLinks)
+        self.assertIn('2022', self.catalog.getShoppingLinks())
+
+    def test_gmScraperSharesLookupsBetweenInitAndFetch(self):
+        def getRequest(url, **kwargs):
+            res = Response()
+            if 'shoppingLinks' in url:
+                res.json = MagicMock(return_value={'2022': {'corvette': {'corvette-z06': {}}}})
+            else:
+                res.json = MagicMock(return_value={'options': [{'code': 'corvette-z06', 'title': 'Corvette Z06'}]})
+            return res
+        self.httpClientMock.side_effect = getRequest
+        with mock.patch('extractor.scraper.gm.GmScraper.date') as mockDate:
+            mockDate.today.return_value = date(2022, 1, 1)
+            scraper = GmScraper('Chevrolet', 'https://www.chevrolet.com', noPersist=True)
+        for _ in range(2):
+            self.assertEqual({'corvette-z06'}, scraper._fetchBodyStyles(date(2022, 1, 1)))
+        # shoppingLinks + getVehicleInfo for 2023, 2022, 2021
+        self.assertEqual(4, self.httpClientMock.call_count)
@@ -16,7 +16,7 @@ class TestGmScraper(TestCase):
         self.brand = Brand(brand_id=uuid4(), manufacturer_id=uuid4(), name='General Motors')
         self.httpClientResponseMock = Response()
         self.httpClientResponseMock.json = MagicMock(return_value={})
-        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmScraper.httpClient.getRequest',
+        self.patcherHttpClient = mock.patch('extractor.scraper.gm.GmMetadataCatalog.httpClient.getRequest',
                                             return_value=self.httpClientResponseMock)
         self.httpClientMock = self.patcherHttpClient.start()
         self.scraper = GmScraper('Chevrolet', 'https://www.chevrolet.com', noInit=True, noPersist=True)
@@ -71,7 +71,7 @@ class TestGmScraper(TestCase):
 
     def test__fetchBodyStylesRaisesWhenNoData(self):
         ERROR_MSG = "DummyError"
-        with mock.patch('extractor.scraper.gm.GmScraper.httpClient.getRequest') as errorClient:
+        with mock.patch('extractor.scraper.gm.GmMetadataCatalog.httpClient.getRequest') as errorClient:
             errorClient.side_effect = ValueError(ERROR_MSG)
             # Unfortunately need to distinguish between httpClient throwing a ValueError and _fetchBodyStyles.  So we're
             # making sure our mock's error is being handled by the _fetchBodyStyles method by testing that ERROR_MSG isn't there
@@ -0,0 +1,61 @@
+import asyncio
+import datetime
+from typing import Dict
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+from requests import Response
+
+from common.domain.dto.modelDto import Model as ModelDto
+from extractor.scraper.AsyncModelInfoScraper import AsyncModelInfoScraper
+from extractor.scraper.ModelInfoScraper import ModelInfoScraper
+from extractor.scraper.common.fetchModelData import ModelFetchDto, ModelDtosAndJsonDataByName
+
+
+# Minimal implementation of ModelInfoScraper for testing
+class DiscoveryScraper(ModelInfoScraper):
+
+    def __init__(self, **kwargs):
+        super().__init__(brandName='Test Brand', manufacturerCommon='Test Manufacturer', **kwargs)
+        self.initKwargs = kwargs
+
+    def fetchModelFetchDtos(self, modelYear: datetime.date) -> Dict[str, ModelFetchDto]:
+        return {"Camry": ModelFetchDto(modelName="Camry", modelCode="camry", path="http://www.ericgha.com/camry")}
+
+    def fetchModelYear(self, date: datetime.date) -> ModelDtosAndJsonDataByName:
+        raise AssertionError("Sync fetch should not be called")
+
+
+class TestAsyncModelInfoScraper(TestCase):
+
+    def setUp(self) -> None:
+        self.httpClientResponseMock = Response()
+        self.httpClientResponseMock.json = MagicMock(return_value={"name": "Camry"})
+        self.patcherHttpClient = mock.patch('extractor.scraper.common.fetchModelData.httpClient.getRequest',
+                                            return_value=self.httpClientResponseMock)
+        self.httpClientMock = self.patcherHttpClient.start()
+
+    def tearDown(self) -> None:
+        for mockObj in self.patcherHttpClient,:
+            if mockObj:
+                mockObj.stop()
+
+    def test_createConstructsScraper(self):
+        asyncScraper = asyncio.run(AsyncModelInfoScraper.create(DiscoveryScraper, maxWorkers=2))
+        self.assertEqual({'maxWorkers': 2}, asyncScraper.scraper.initKwargs)
+        self.assertEqual('Test Brand', asyncScraper.getBrandName())
+        self.assertEqual('Test Manufacturer', asyncScraper.getManufacturerCommon())
+
+    def test_fetchModelYear(self):
+        asyncScraper = AsyncModelInfoScraper(DiscoveryScraper())
+        modelYear = datetime.date(2023, 1, 1)
+        found = asyncio.run(asyncScraper.fetchModelYear(modelYear))
+        expected = ModelDtosAndJsonDataByName(modelDtos=[ModelDto(name="Camry", model_year=modelYear)],
+                                              jsonDataByName={"Camry": {"name": "Camry"}})
+        self.assertEqual(expected, found)
+        self.httpClientMock.assert_called_once_with("http://www.ericgha.com/camry")
+
+    def test_fetchModelYearSkipsFailedModels(self):
+        self.httpClientMock.side_effect = RuntimeError("received a 503 status code")
+        found = asyncio.run(AsyncModelInfoScraper(DiscoveryScraper()).fetchModelYear(datetime.date(2023, 1, 1)))
+        self.assertEqual(ModelDtosAndJsonDataByName(modelDtos=list(), jsonDataByName=dict()), found)
@@ -18,6 +18,9 @@ class TestScraper(ModelInfoScraper):
     def persistModelYear(self, date: 'datetime.date') -> None:
         return None
 
+    def fetchModelFetchDtos(self, modelYear: 'datetime.date') -> Dict:
+        return dict()
+
 class TestModelInfoScraper(TestCase):
 
     testBrandName = 'Test Brand'
@@ -66,9 +66,12 @@ class LexusScraper(ModelInfoScraper):
             fetchDtoByName[modelName] = ModelFetchDto(modelCode=modelCode, modelName=modelName, path=fullPath)
         return fetchDtoByName
 
-    def fetchModelYear(self, modelYear: date) -> ModelDtosAndJsonDataByName:
+    def fetchModelFetchDtos(self, modelYear: date) -> Dict[str, 'ModelFetchDto']:
         modelListJson = self._fetchModelList(modelYear)
-        modelFetchDtosByName = self._parseModelList(modelListJson)
-        return fetchModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear)
+        return self._parseModelList(modelListJson)
+
+    def fetchModelYear(self, modelYear: date) -> ModelDtosAndJsonDataByName:
+        modelFetchDtosByName = self.fetchModelFetchDtos(modelYear)
+        return fetchModels(modelFetchDtosByName=modelFetchDtosByName, modelYear=modelYear, maxWorkers=self.maxWorkers)
 
 
@@ -88,8 +88,11 @@ class ToyotaScraper(ModelInfoScraper):
             raise ValueError('Received an empty or null subPath')
         return f'{self.URL_PREFIX}{subPath}/content.json'
 
-    def fetchModelYear(self, modelYear: 'datetime.date') -> ModelDtosAndJsonDataByName:
+    def fetchModelFetchDtos(self, modelYear: 'datetime.date') -> Dict[str, 'ModelFetchDto']:
         modelListJson = self._fetchModelList(modelYear)
-        modelFetchDtosByName = self._parseModelList(modelListJson)
+        return self._parseModelList(modelListJson)
+
+    def fetchModelYear(self, modelYear: 'datetime.date') -> ModelDtosAndJsonDataByName:
+        modelFetchDtosByName = self.fetchModelFetchDtos(modelYear)
         return fetchModels(modelFetchDtosByName=modelFetchDtosByName,
-                           modelYear=modelYear)
+                           modelYear=modelYear, maxWorkers=self.maxWorkers)
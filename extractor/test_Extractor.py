@@ -0,0 +1,164 @@
+import asyncio
+import os
+import tempfile
+from datetime import date
+from typing import Dict, List
+from unittest import TestCase, mock
+from unittest.mock import AsyncMock, MagicMock
+
+from common.domain.dto.modelDto import Model as ModelDto
+from extractor.Extractor import Extractor, extractRange, MAX_CONCURRENT_YEARS
+from extractor.RunJournal import RunJournal
+from extractor.scraper.ModelInfoScraper import ModelInfoScraper
+from extractor.scraper.common.fetchModelData import ModelDtosAndJsonDataByName, ModelDtoAndJsonData, \
+    ModelFetchDto, MAX_WORKERS
+from extractor.scraper.common.HttpClient import HttpClient
+
+
+class YearScraper(ModelInfoScraper):
+    """Fetches a single model per year, fails for years in ``missingYears``"""
+
+    def __init__(self, brandName: str, missingYears=frozenset(), **kwargs):
+        super().__init__(brandName=brandName, manufacturerCommon='Toyota', **kwargs)
+        self.missingYears = missingYears
+
+    def fetchModelYear(self, modelYear: date) -> ModelDtosAndJsonDataByName:
+        if modelYear.year in self.missingYears:
+            raise ValueError(f'No models for year: {modelYear.year}')
+        return ModelDtosAndJsonDataByName(modelDtos=[ModelDto(name='Camry', model_year=modelYear)],
+                                          jsonDataByName={'Camry': {'year': modelYear.year}})
+
+    def fetchModelFetchDtos(self, modelYear: date) -> Dict[str, ModelFetchDto]:
+        return {'Camry': ModelFetchDto(modelName='Camry', modelCode='camry', path=f'camry/{modelYear.year}')}
+
+
+class TestExtractRange(TestCase):
+
+    def createExtractor(self, brandName: str, missingYears=frozenset()) -> Extractor:
+        extractor = Extractor(YearScraper(brandName, missingYears), noPersist=True)
+        extractor._persistModels = MagicMock()
+        return extractor
+
+    def test_extractRangePersistsEachYear(self):
+        extractor = self.createExtractor('Toyota')
+        found = extractor.extractRange(2020, 2022, maxWorkers=2)
+        self.assertEqual({2020: None, 2021: None, 2022: None}, found)
+        persistedYears = {kwargs['jsonDataByName']['Camry']['year']
+                          for _args, kwargs in extractor._persistModels.call_args_list}
+        self.assertEqual({2020, 2021, 2022}, persistedYears)
+
+    def test_extractRangeReportsFailedYears(self):
+        toyota = self.createExtractor('Toyota', missingYears={2021})
+        lexus = self.createExtractor('Lexus')
+        found = extractRange([toyota, lexus], 2020, 2021)
+        self.assertEqual({2020: None}, {year: e for year, e in found['Toyota'].items() if year != 2021})
+        self.assertIsInstance(found['Toyota'][2021], ValueError)
+        self.assertEqual({2020: None, 2021: None}, found['Lexus'])
+        self.assertEqual(1, toyota._persistModels.call_count)
+
+    def test_extractRangeReportsUnexpectedErrors(self):
+        extractor = self.createExtractor('Toyota')
+        persistError = OSError('connection to database lost')
+
+        def persistModels(modelDtos, jsonDataByName):
+            if jsonDataByName['Camry']['year'] == 2021:
+                raise persistError
+        extractor._persistModels.side_effect = persistModels
+        found = extractor.extractRange(2020, 2022)
+        self.assertEqual({2020: None, 2021: persistError, 2022: None}, found)
+
+    def test_extractRangeConcurrencyFitsConnectionPool(self):
+        # requests beyond the pool size open connections that are discarded rather than kept alive
+        self.assertLessEqual(MAX_CONCURRENT_YEARS * MAX_WORKERS, HttpClient.POOL_MAXSIZE)
+
+    def test_extractRangeRaisesOnInvalidRange(self):
+        extractor = self.createExtractor('Toyota')
+        self.assertRaises(ValueError, lambda: extractor.extractRange(2022, 2020))
+        self.assertRaises(ValueError, lambda: extractor.extractRange(2020, 2022, maxWorkers=0))
+
+
+class TestExtractStreaming(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.modelYear = date(2022, 1, 1)
+        self.scraper = YearScraper('Toyota')
+        self.scraper.fetchModelFetchDtos = MagicMock(return_value={
+            f'Model{i}': ModelFetchDto(modelName=f'Model{i}', modelCode=f'model-{i}', path=f'https://www.toyota.com/{i}')
+            for i in range(5)})
+        self.patcherStreamModels = mock.patch('extractor.Extractor.streamModels', side_effect=self.streamModels)
+        self.streamModelsMock = self.patcherStreamModels.start()
+
+    def tearDown(self) -> None:
+        self.patcherStreamModels.stop()
+        self.tempDir.cleanup()
+
+    def streamModels(self, modelFetchDtosByName, modelYear, maxWorkers):
+        for modelName in modelFetchDtosByName:
+            yield ModelDtoAndJsonData(modelDto=ModelDto(name=modelName, model_year=modelYear), jsonData={})
+
+    def createExtractor(self, **kwargs) -> Extractor:
+        extractor = Extractor(self.scraper, noPersist=True, **kwargs)
+        extractor._persistModels = MagicMock()
+        return extractor
+
+    def persistedBatches(self, extractor: Extractor) -> List[List[str]]:
+        return [list(kwargs['jsonDataByName'].keys()) for _args, kwargs in extractor._persistModels.call_args_list]
+
+    def test_extractStreamingPersistsInBatches(self):
+        extractor = self.createExtractor()
+        self.assertEqual(5, extractor.extractStreaming(self.modelYear, batchSize=2))
+        self.assertEqual([['Model0', 'Model1'], ['Model2', 'Model3'], ['Model4']], self.persistedBatches(extractor))
+
+    def test_extractStreamingRaisesOnInvalidBatchSize(self):
+        extractor = self.createExtractor()
+        self.assertRaises(ValueError, lambda: extractor.extractStreaming(self.modelYear, batchSize=0))
+
+    def test_extractStreamingResumesFromJournal(self):
+        journalPath = os.path.join(self.tempDir.name, 'journal.jsonl')
+        interrupted = self.createExtractor(journal=RunJournal(journalPath))
+        interrupted._persistModels.side_effect = [None, RuntimeError('connection lost')]
+        self.assertRaises(RuntimeError, lambda: interrupted.extractStreaming(self.modelYear, batchSize=2))
+
+        resumed = self.createExtractor(journal=RunJournal(journalPath))
+        self.assertEqual(3, resumed.extractStreaming(self.modelYear, batchSize=2))
+        self.assertEqual([['Model2', 'Model3'], ['Model4']], self.persistedBatches(resumed))
+        self.assertTrue(RunJournal(journalPath).isYearComplete('Toyota', self.modelYear))
+
+        completed = self.createExtractor(journal=RunJournal(journalPath))
+        self.assertEqual(0, completed.extractStreaming(self.modelYear))
+        completed._persistModels.assert_not_called()
+
+    def test_extractStreamingDoesNotCompleteYearWithMissingModels(self):
+        journal = RunJournal(os.path.join(self.tempDir.name, 'journal.jsonl'))
+        self.streamModelsMock.side_effect = lambda modelFetchDtosByName, modelYear, maxWorkers: \
+            list(self.streamModels(modelFetchDtosByName, modelYear, maxWorkers))[:-1]  # a fetch failed
+        self.createExtractor(journal=journal).extractStreaming(self.modelYear)
+        self.assertFalse(journal.isYearComplete('Toyota', self.modelYear))
+        self.assertEqual(4, len(journal.getPersistedModels('Toyota', self.modelYear)))
+
+    def test_extractSkipsJournaledYear(self):
+        journal = RunJournal(os.path.join(self.tempDir.name, 'journal.jsonl'))
+        journal.recordYearComplete('Toyota', self.modelYear)
+        extractor = self.createExtractor(journal=journal)
+        self.assertIsNone(extractor.extract(self.modelYear))
+        extractor._persistModels.assert_not_called()
+
+    def test_extractAsyncSkipsJournaledYear(self):
+        journal = RunJournal(os.path.join(self.tempDir.name, 'journal.jsonl'))
+        journal.recordYearComplete('Toyota', self.modelYear)
+        extractor = self.createExtractor(journal=journal)
+        with mock.patch('extractor.Extractor.AsyncModelInfoScraper') as asyncScraperMock:
+            self.assertIsNone(asyncio.run(extractor.extractAsync(self.modelYear)))
+        asyncScraperMock.assert_not_called()
+        extractor._persistModels.assert_not_called()
+
+    def test_extractAsyncRecordsYearComplete(self):
+        journalPath = os.path.join(self.tempDir.name, 'journal.jsonl')
+        extractor = self.createExtractor(journal=RunJournal(journalPath))
+        with mock.patch('extractor.Extractor.AsyncModelInfoScraper') as asyncScraperMock:
+            asyncScraperMock.return_value.fetchModelYear = AsyncMock(
+                return_value=self.scraper.fetchModelYear(self.modelYear))
+            asyncio.run(extractor.extractAsync(self.modelYear))
+        self.assertEqual([['Camry']], self.persistedBatches(extractor))
+        self.assertTrue(RunJournal(journalPath).isYearComplete('Toyota', self.modelYear))
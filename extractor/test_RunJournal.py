@@ -0,0 +1,36 @@
+import os
+import tempfile
+from datetime import date
+from unittest import TestCase
+
+from extractor.RunJournal import RunJournal
+
+
+class TestRunJournal(TestCase):
+
+    def setUp(self) -> None:
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempDir.name, 'journal.jsonl')
+        self.modelYear = date(2022, 1, 1)
+
+    def tearDown(self) -> None:
+        self.tempDir.cleanup()
+
+    def test_entriesSurviveReload(self):
+        journal = RunJournal(self.path)
+        journal.recordModels('Toyota', self.modelYear, ['Camry', 'Corolla'])
+        journal.recordYearComplete('Lexus', self.modelYear)
+        found = RunJournal(self.path)
+        self.assertEqual({'Camry', 'Corolla'}, found.getPersistedModels('Toyota', self.modelYear))
+        self.assertFalse(found.isYearComplete('Toyota', self.modelYear))
+        self.assertTrue(found.isYearComplete('Lexus', self.modelYear))
+        self.assertEqual(set(), found.getPersistedModels('Toyota', date(2021, 1, 1)))
+
+    def test_loadSkipsPartialEntry(self):
+        RunJournal(self.path).recordModels('Toyota', self.modelYear, ['Camry'])
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"brand": "Toyota", "ye')
+        journal = RunJournal(self.path)
+        self.assertEqual({'Camry'}, journal.getPersistedModels('Toyota', self.modelYear))
+        journal.recordModels('Toyota', self.modelYear, ['Corolla'])
+        self.assertEqual({'Camry', 'Corolla'}, RunJournal(self.path).getPersistedModels('Toyota', self.modelYear))
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 
 from common.domain.dto.AttributeDto import AttributeDto
 from common.domain.dto.RawDataDto import RawDataDto
@@ -9,4 +9,13 @@ class TransformDestination(ABC):
 
     @abstractmethod
     def accept(self, attributeDtos: List[AttributeDto], rawDataDto: RawDataDto) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    def acceptMany(self, batch: List[Tuple[List[AttributeDto], RawDataDto]]) -> None:
+        """
+        Accepts the attributes of several raw data rows, destinations able to write them together should override.
+        :param batch: ``(attributeDtos, rawDataDto)`` of each row
+        :return:
+        """
+        for attributeDtos, rawDataDto in batch:
+            self.accept(attributeDtos=attributeDtos, rawDataDto=rawDataDto)
@@ -1,14 +1,19 @@
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.engine import Row
 
 from common.domain.converter.Converter import converter
 from common.domain.dto.AttributeDto import AttributeDto
 from common.domain.dto.RawDataDto import RawDataDto
-from common.domain.entities import ModelAttribute
+from common.domain.entities import ModelAttribute, TransformState
 from common.exception.IllegalArgumentError import IllegalArgumentError
 from common.exception.IllegalStateError import IllegalStateError
+from common.repository.ModelAttributeRepository import modelAttributeRepository
 from common.repository.ModelRepository import modelRepository
+from common.repository.RawDataRepository import rawDataRepository
 from common.repository.SessionFactory import sessionFactory
+from common.repository.TransformStateRepository import transformStateRepository
 from transformer.adapter.TransformDestination import TransformDestination
 
 
@@ -17,18 +22,70 @@ class RepositoryDestination(TransformDestination):
     def __init__(self, **kwargs):
         """
         :param kwargs: ``overwriteExisting``: ``bool`` - delete and replace existing ``ModelAttributes``
-        or raise on existing model attributes.
+        or raise on existing model attributes.  ``replaceStale``: ``bool`` - when not overwriting, still replace
+        attributes that were transformed from a raw data row created before the accepted one, whose row was deleted
+        or with no recorded transform state (written before transform state was tracked).
         """
         self.log = logging.getLogger(type(self).__name__)
         self.overwriteExisting = kwargs.get("overwriteExisting", False)
+        self.replaceStale = kwargs.get("replaceStale", False)
+
+    def _toModelAttribute(self, attributeDto: AttributeDto, modelId: str) -> ModelAttribute:
+        modelAttribute = converter.convert(obj=attributeDto, outputType=ModelAttribute)
+        modelAttribute.model_id = modelId
+        return modelAttribute
+
+    def _isStale(self, state: Optional[TransformState], rawDataDto: RawDataDto, summariesById: Dict[str, Row]) -> bool:
+        """
+        :param state: of the model, ``None`` if its attributes predate transform state tracking
+        :param rawDataDto: row whose attributes are accepted
+        :param summariesById: ``RawDataRepository`` summaries of ``rawDataDto`` and of the row ``state`` references
+        :return: ``True`` if the model's attributes were transformed from a row created before ``rawDataDto``'s
+        """
+        if state is None or state.data_id is None:
+            return True
+        current = summariesById.get(state.data_id)
+        accepted = summariesById.get(str(rawDataDto.dataId))
+        return current is None or (accepted is not None and current.created_at < accepted.created_at)
 
     def accept(self, attributeDtos: List[AttributeDto], rawDataDto: RawDataDto) -> None:
-        attributes = [converter.convert(obj=attributeDto, outputType=ModelAttribute) for attributeDto in attributeDtos]
+        self.acceptMany([(attributeDtos, rawDataDto)])
+
+    def acceptMany(self, batch: List[Tuple[List[AttributeDto], RawDataDto]]) -> None:
+        """
+        Writes the attributes of every row in a single transaction.  Replaced attributes are diffed against the
+        stored ones (``ModelAttributeRepository.sync``) so only new, changed and vanished attributes are written, with
+        one statement per kind of change, followed by one transform state upsert.
+        :param batch: ``(attributeDtos, rawDataDto)`` of each row, at most one row per model
+        :return:
+        :raises: ``IllegalArgumentError`` if a model is missing or repeated, ``IllegalStateError`` if a model has
+        attributes that may not be replaced, in either case nothing is written
+        """
+        modelIds = [str(rawDataDto.modelId) for _attributeDtos, rawDataDto in batch]
+        if len(set(modelIds)) != len(modelIds):
+            raise IllegalArgumentError("A batch may contain at most one raw data row per model.")
         with sessionFactory.newSession() as session:
-            model = modelRepository.getModelByModelId(modelId=rawDataDto.modelId, session=session)
-            if not model:
-                raise IllegalArgumentError(f"No model for {rawDataDto.modelId} exists")
-            if model.model_attribute and not self.overwriteExisting:
-                raise IllegalStateError(f"Attributes for {model} already exist")
-            model.model_attribute = attributes
+            foundModelIds = {model.model_id
+                             for model in modelRepository.getModelsByModelIds(modelIds=modelIds, session=session)}
+            withAttributes = modelAttributeRepository.getModelIdsWithAttributes(modelIds=modelIds, session=session)
+            statesById = {state.model_id: state
+                          for state in transformStateRepository.getByModelIds(modelIds=modelIds, session=session)}
+            summariesById = {summary.data_id: summary for summary in rawDataRepository.getSummariesByDataIds(
+                dataIds=[rawDataDto.dataId for _attributeDtos, rawDataDto in batch]
+                + [state.data_id for state in statesById.values() if state.data_id is not None], session=session)}
+            hashesById = {dataId: summary.content_hash for dataId, summary in summariesById.items()}
+            for modelId, (_attributeDtos, rawDataDto) in zip(modelIds, batch):
+                if modelId not in foundModelIds:
+                    raise IllegalArgumentError(f"No model for {rawDataDto.modelId} exists")
+                if modelId in withAttributes and not (self.overwriteExisting or (
+                        self.replaceStale and self._isStale(statesById.get(modelId), rawDataDto, summariesById))):
+                    raise IllegalStateError(f"Attributes for model {modelId} already exist")
+            syncResult = modelAttributeRepository.sync(
+                modelIds=modelIds, session=session,
+                modelAttributes=[self._toModelAttribute(attributeDto, modelId) for modelId, (attributeDtos, _rawDataDto)
+                                 in zip(modelIds, batch) for attributeDto in attributeDtos])
+            self.log.debug(f"Synced attributes of {len(modelIds)} model(s): {syncResult}")
+            transformStateRepository.upsertMany(
+                [(modelId, rawDataDto.dataId, hashesById.get(str(rawDataDto.dataId)))
+                 for modelId, (_attributeDtos, rawDataDto) in zip(modelIds, batch)], session=session)
             session.commit()
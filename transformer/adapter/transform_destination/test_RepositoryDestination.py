@@ -1,5 +1,6 @@
 import uuid
 from datetime import date, datetime
+from typing import Set
 from unittest import TestCase
 
 from common.domain.converter.Converter import converter
@@ -14,6 +15,7 @@ from common.exception.IllegalArgumentError import IllegalArgumentError
 from common.exception.IllegalStateError import IllegalStateError
 from common.repository.ModelAttributeRepository import modelAttributeRepository
 from common.repository.SessionFactory import sessionFactory
+from common.repository.TransformStateRepository import transformStateRepository
 from common.repository.test_common.DbContainer import DbContainer
 from transformer.adapter.transform_destination.RepositoryDestination import RepositoryDestination
 
@@ -123,3 +125,111 @@ class IntegrationTestRepositoryDestination(TestCase):
         attributeDtos = [Transmission(title="Transmission")]
         self.assertRaises(IllegalArgumentError,
                           lambda: self.destination.accept(attributeDtos=attributeDtos, rawDataDto=self.rawDataDto))
+
+    def test_acceptRecordsTransformState(self):
+        self.destination.accept(attributeDtos=[Grade(title="Grade")], rawDataDto=self.rawDataDto)
+        with sessionFactory.newSession() as session:
+            state = transformStateRepository.getByModelId(modelId=self.rawDataDto.modelId, session=session)
+            self.assertEqual(str(self.rawDataDto.dataId), state.data_id)
+            self.assertEqual([], transformStateRepository.getPending(session=session))
+
+    def _insertNewerRawDataDto(self) -> RawDataDto:
+        with sessionFactory.newSession() as session:
+            newData = RawData(model_id=self.rawDataDto.modelId, raw_data={'fake': False})
+            session.add(newData)
+            session.commit()
+            return converter.convert(newData, RawDataDto)
+
+    def _insertUntrackedAttribute(self) -> None:
+        # attributes written before transform state was tracked
+        with sessionFactory.newSession() as session:
+            session.add(self.destination._toModelAttribute(Grade(title="Grade"), str(self.rawDataDto.modelId)))
+            session.commit()
+
+    def _getAttributeTitles(self) -> Set[str]:
+        with sessionFactory.newSession() as session:
+            return {modelAttribute.title for modelAttribute in
+                    modelAttributeRepository.getAttributesByModelId(modelId=self.rawDataDto.modelId, session=session)}
+
+    def test_acceptRaisesOnNewerDataWhenReplaceStaleIsFalse(self):
+        self.destination.accept(attributeDtos=[Grade(title="Grade")], rawDataDto=self.rawDataDto)
+        newRawDataDto = self._insertNewerRawDataDto()
+        self.assertRaises(IllegalStateError, lambda: self.destination.accept(
+            attributeDtos=[Transmission(title="Transmission")], rawDataDto=newRawDataDto))
+        self.assertEqual({"Grade"}, self._getAttributeTitles())
+
+    def test_acceptRaisesOnUntrackedAttributesWhenReplaceStaleIsFalse(self):
+        self._insertUntrackedAttribute()
+        self.assertRaises(IllegalStateError, lambda: self.destination.accept(
+            attributeDtos=[Transmission(title="Transmission")], rawDataDto=self.rawDataDto))
+        self.assertEqual({"Grade"}, self._getAttributeTitles())
+
+    def test_acceptReplacesAttributesTransformedFromOlderData(self):
+        self.destination = RepositoryDestination(overwriteExisting=False, replaceStale=True)
+        self.destination.accept(attributeDtos=[Grade(title="Grade")], rawDataDto=self.rawDataDto)
+        newRawDataDto = self._insertNewerRawDataDto()
+        self.destination.accept(attributeDtos=[Transmission(title="Transmission")], rawDataDto=newRawDataDto)
+        self.assertEqual({"Transmission"}, self._getAttributeTitles())
+        with sessionFactory.newSession() as session:
+            state = transformStateRepository.getByModelId(modelId=self.rawDataDto.modelId, session=session)
+            self.assertEqual(str(newRawDataDto.dataId), state.data_id)
+
+    def test_acceptRaisesOnOlderDataWhenReplaceStaleIsTrue(self):
+        self.destination = RepositoryDestination(overwriteExisting=False, replaceStale=True)
+        newRawDataDto = self._insertNewerRawDataDto()
+        self.destination.accept(attributeDtos=[Transmission(title="Transmission")], rawDataDto=newRawDataDto)
+        self.assertRaises(IllegalStateError, lambda: self.destination.accept(
+            attributeDtos=[Grade(title="Grade")], rawDataDto=self.rawDataDto))
+        self.assertEqual({"Transmission"}, self._getAttributeTitles())
+        with sessionFactory.newSession() as session:
+            state = transformStateRepository.getByModelId(modelId=self.rawDataDto.modelId, session=session)
+            self.assertEqual(str(newRawDataDto.dataId), state.data_id)
+
+    def test_acceptRaisesOnSameDataWhenReplaceStaleIsTrue(self):
+        self.destination = RepositoryDestination(overwriteExisting=False, replaceStale=True)
+        self.destination.accept(attributeDtos=[Grade(title="Grade")], rawDataDto=self.rawDataDto)
+        self.assertRaises(IllegalStateError, lambda: self.destination.accept(
+            attributeDtos=[Transmission(title="Transmission")], rawDataDto=self.rawDataDto))
+
+    def test_acceptAdoptsAttributesWithoutTransformStateWhenReplaceStaleIsTrue(self):
+        self.destination = RepositoryDestination(overwriteExisting=False, replaceStale=True)
+        self._insertUntrackedAttribute()
+        with sessionFactory.newSession() as session:
+            self.assertEqual([str(self.rawDataDto.dataId)],
+                             [str(row.data_id) for row in transformStateRepository.getPending(session=session)])
+        self.destination.accept(attributeDtos=[Grade(title="Grade"), Transmission(title="Transmission")],
+                                rawDataDto=self.rawDataDto)
+        self.assertEqual({"Grade", "Transmission"}, self._getAttributeTitles())
+        with sessionFactory.newSession() as session:
+            state = transformStateRepository.getByModelId(modelId=self.rawDataDto.modelId, session=session)
+            self.assertEqual(str(self.rawDataDto.dataId), state.data_id)
+            self.assertEqual([], transformStateRepository.getPending(session=session))
+
+    def test_acceptManyWritesAttributes(self):
+        self.destination.acceptMany([([BodyStyle(title="BodyStyle"), Grade(title="Grade")], self.rawDataDto)])
+        with sessionFactory.newSession() as session:
+            modelAttributes = list(
+                modelAttributeRepository.getAttributesByModelId(modelId=self.rawDataDto.modelId, session=session))
+            self.assertEqual({"BodyStyle", "Grade"}, {modelAttribute.title for modelAttribute in modelAttributes})
+            self.assertEqual([], transformStateRepository.getPending(session=session))
+
+    def test_acceptManyRaisesIllegalArgumentErrorOnRepeatedModel(self):
+        batch = [([Grade(title="Grade")], self.rawDataDto), ([BodyStyle(title="BodyStyle")], self.rawDataDto)]
+        self.assertRaises(IllegalArgumentError, lambda: self.destination.acceptMany(batch))
+
+    def test_acceptKeepsUnchangedAttributes(self):
+        self.destination = RepositoryDestination(overwriteExisting=True)
+        self.destination.accept(attributeDtos=[Grade(title="Grade"), BodyStyle(title="BodyStyle")],
+                                rawDataDto=self.rawDataDto)
+        with sessionFactory.newSession() as session:
+            before = modelAttributeRepository.getAttributeByTypeAndTitle(
+                attributeType=AttributeType.GRADE, title="Grade", modelId=self.rawDataDto.modelId, session=session)
+        self.destination.accept(attributeDtos=[Grade(title="Grade"), Transmission(title="Transmission")],
+                                rawDataDto=self.rawDataDto)
+        with sessionFactory.newSession() as session:
+            after = modelAttributeRepository.getAttributeByTypeAndTitle(
+                attributeType=AttributeType.GRADE, title="Grade", modelId=self.rawDataDto.modelId, session=session)
+            modelAttributes = list(
+                modelAttributeRepository.getAttributesByModelId(modelId=self.rawDataDto.modelId, session=session))
+        self.assertEqual((before.attribute_id, before.updated_at), (after.attribute_id, after.updated_at))
+        self.assertCountEqual(["Grade", "Transmission"], [modelAttribute.title for modelAttribute in modelAttributes])
@@ -1,5 +1,5 @@
 from collections.abc import Sequence
-from typing import Optional, List, Iterator, Any
+from typing import Optional, List, Iterator, Any, Dict, Tuple
 
 from common.domain.dto.AttributeDto import AttributeDto
 from common.domain.dto.AttributeMetadata import AttributeMetadata
@@ -16,33 +16,33 @@ class AttributeSet(Sequence):
     """
 
     def __init__(self, updater: MetadataUpdater):
-        self.elements = dict()
+        # AttributeDto.identity() -> the added AttributeDto whose metadata is current
+        self.elements: Dict[Tuple, AttributeDto] = dict()
         self.updater = updater
 
     def add(self, element: AttributeDto) -> bool:
-        newAttribute = element.__class__(**element.__dict__) # defensive copy
-        newMetadata = newAttribute.metadata
-        newAttribute.metadata = None
-        if newAttribute not in self.elements:
-            self.elements[newAttribute] = newMetadata
+        """
+        Elements are stored, not copied, and must not be modified once added.  On an update the new element replaces
+        the old, it differs only in its metadata.
+        :param element:
+        :return: ``True`` if the element was added or its metadata replaced the existing
+        """
+        key = element.identity()
+        if (existing := self.elements.get(key)) is None:
+            self.elements[key] = element
             return True
-        oldMetadata = self.elements[newAttribute]
-        if self.updater.update(dictMetadata=oldMetadata, newMetadata=newMetadata):
-            self.elements[newAttribute] = newMetadata
+        if self.updater.update(dictMetadata=existing.metadata, newMetadata=element.metadata):
+            self.elements[key] = element
             return True
         return False
 
     def __getitem__(self, attribute: AttributeDto) -> Optional[List[AttributeMetadata]]:
-        if attribute not in self.elements:
+        if (element := self.elements.get(attribute.identity())) is None:
             raise KeyError(f"Attribute {attribute} not found")
-        return self.elements[attribute]
+        return element.metadata
 
     def __iter__(self) -> Iterator[AttributeDto]:
-        attributeDtos = list()
-        for attribute, metadata in self.elements.items():
-            mergedParams = {**attribute.__dict__, **{"metadata": metadata}} if metadata else {**attribute.__dict__}
-            attributeDtos.append(attribute.__class__(**mergedParams))
-        return iter(attributeDtos)
+        return iter(list(self.elements.values()))
 
     def __contains__(self, item: Any) -> bool:
         """
@@ -50,7 +50,7 @@ class AttributeSet(Sequence):
         :param item:
         :return:
         """
-        return item in self.elements
+        return isinstance(item, AttributeDto) and item.identity() in self.elements
 
     def __len__(self):
         return len(self.elements)
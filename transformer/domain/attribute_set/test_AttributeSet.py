@@ -67,3 +67,13 @@ class TestAttributeSet(TestCase):
         self.set.add(transmission0)
         self.assertTrue(Transmission(title="transmission0") in self.set)
 
+    def test_addStoresElementWithoutCopying(self):
+        self.set.updater = AlwaysUpdates()
+        transmission0 = Transmission(title="transmission0")
+        transmission1 = Transmission(title="transmission0",
+                                     metadata=[AttributeMetadata(metadataType=MetadataType.COMMON_MSRP, value=0)])
+        self.set.add(transmission0)
+        self.assertIs(transmission0, next(iter(self.set)))
+        self.set.add(transmission1)
+        self.assertIs(transmission1, next(iter(self.set)))
+        self.assertIsNone(transmission0.metadata, "replaced element is not modified")
@@ -0,0 +1,101 @@
+import logging
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from common.domain.entities import RawData, RawDataDiff
+from common.domain.json.jsonDiff import diffJson, subtreeHashes
+from common.exception.IllegalArgumentError import IllegalArgumentError
+from common.repository.RawDataDiffRepository import rawDataDiffRepository
+from common.repository.RawDataRepository import rawDataRepository
+from common.repository.SessionFactory import sessionFactory
+
+
+class RawDataDiffService:
+    """
+    Computes and stores structural diffs (see ``diffJson``) between raw data snapshots of a model.  Snapshots with
+    equal content hashes are diffed without loading their payloads.  Otherwise each snapshot's subtree hashes are
+    computed once, stored, and reused by later diffs so only changed subtrees are walked.
+    """
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def _getRawDataSummary(self, dataId: UUID | str, session: 'Session') -> Row:
+        if not (summary := rawDataRepository.getSummaryByDataId(dataId=dataId, session=session)):
+            raise IllegalArgumentError(f"No raw data found for dataId: {dataId}")
+        return summary
+
+    def _getSubtreeHashes(self, rawData: RawData) -> Dict[str, str]:
+        if rawData.subtree_hashes is None:
+            rawData.subtree_hashes = subtreeHashes(rawData.raw_data)
+        return rawData.subtree_hashes
+
+    def _diff(self, oldDataId: UUID | str, newDataId: UUID | str, session: 'Session') -> RawDataDiff:
+        if (existing := rawDataDiffRepository.getByDataIds(oldDataId=oldDataId, newDataId=newDataId, session=session)):
+            return existing
+        # compare identities and hashes before loading payloads
+        old = self._getRawDataSummary(oldDataId, session)
+        new = self._getRawDataSummary(newDataId, session)
+        if old.model_id != new.model_id:
+            raise IllegalArgumentError(f"Raw data {oldDataId} and {newDataId} belong to different models.")
+        if old.content_hash and old.content_hash == new.content_hash:
+            changes = list()
+        else:
+            oldRawData = rawDataRepository.getByDataId(dataId=old.data_id, session=session)
+            newRawData = rawDataRepository.getByDataId(dataId=new.data_id, session=session)
+            changes = diffJson(old=oldRawData.raw_data, new=newRawData.raw_data,
+                               oldHashes=self._getSubtreeHashes(oldRawData),
+                               newHashes=self._getSubtreeHashes(newRawData))
+        rawDataDiff = RawDataDiff(model_id=new.model_id, old_data_id=old.data_id, new_data_id=new.data_id,
+                                  changes=changes)
+        rawDataDiffRepository.insert(rawDataDiff, session=session)
+        return rawDataDiff
+
+    def diff(self, oldDataId: UUID | str, newDataId: UUID | str) -> RawDataDiff:
+        """
+        Diffs two raw data rows of the same model, storing the result.  A stored diff is returned without being
+        recomputed.
+        :param oldDataId:
+        :param newDataId:
+        :return:
+        :raises: ``IllegalArgumentError`` if either row is missing or the rows belong to different models
+        """
+        with sessionFactory.newSession() as session:
+            session.begin()
+            rawDataDiff = self._diff(oldDataId=oldDataId, newDataId=newDataId, session=session)
+            session.commit()
+            session.refresh(rawDataDiff)
+            session.expunge(rawDataDiff)
+        return rawDataDiff
+
+    def diffAllMostRecent(self) -> int:
+        """
+        Diffs the two most recent raw data rows of every model that has no diff for that pair yet, i.e. after a
+        nightly extraction.  Each model is committed separately so only one pair of payloads is held at a time.
+        :return: number of diffs stored
+        """
+        with sessionFactory.newSession() as session:
+            pairs = rawDataDiffRepository.getUndiffedPairs(session=session)
+        changed = 0
+        for modelId, oldDataId, newDataId in pairs:
+            with sessionFactory.newSession() as session:
+                session.begin()
+                if self._diff(oldDataId=oldDataId, newDataId=newDataId, session=session).changes:
+                    changed += 1
+                session.commit()
+        self.log.info(f"Diffed {len(pairs)} model(s), {changed} changed.")
+        return len(pairs)
+
+    def getMostRecentDiff(self, modelId: UUID | str) -> Optional[RawDataDiff]:
+        with sessionFactory.newSession() as session:
+            diffs = rawDataDiffRepository.getDiffsFor(modelId=modelId, session=session)
+            if not diffs:
+                return None
+            session.expunge(diffs[0])
+            return diffs[0]
+
+
+rawDataDiffService = RawDataDiffService()
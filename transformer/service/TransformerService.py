@@ -1,12 +1,20 @@
+import dataclasses
+import itertools
 import logging
-from typing import List, NamedTuple
+import os
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Dict, Tuple
 
 from common.domain.converter.Converter import converter
+from common.domain.dto.AttributeDto import AttributeDto
 from common.domain.dto.RawDataDto import RawDataDto
+from common.domain.entities import RawData
 from common.exception.IllegalArgumentError import IllegalArgumentError
 from common.exception.IllegalStateError import IllegalStateError
 from common.repository.RawDataRepository import rawDataRepository
 from common.repository.SessionFactory import sessionFactory
+from common.repository.TransformStateRepository import transformStateRepository
 from transformer.adapter.TransformDestination import TransformDestination
 from transformer.adapter.transform_destination.RepositoryDestination import RepositoryDestination
 from transformer.transform.Transformer import Transformer
@@ -19,10 +27,49 @@ class RawDataDtoAndBrandName(NamedTuple):
     brandName: str
 
 
+class TransformPendingResult(NamedTuple):
+    transformed: int
+    failed: int
+    # every pending row created at or before the watermark was transformed, pass it as ``since`` to the next run
+    watermark: Optional[datetime]
+
+
+# transformers of a transformParallel worker process, by brand name
+_workerTransformers: Dict[str, Transformer] = dict()
+
+
+def _initTransformWorker(brandNameToTransformer: Dict[str, Transformer]) -> None:
+    global _workerTransformers
+    _workerTransformers = brandNameToTransformer
+
+
+def _transformInWorker(brandNamesAndRawDataDtos: List[Tuple[str, RawDataDto]]) -> List[List[AttributeDto] | ValueError]:
+    results = list()
+    for brandName, rawDataDto in brandNamesAndRawDataDtos:
+        try:
+            results.append(_workerTransformers[brandName].transform(rawDataDto))
+        except ValueError as e:
+            results.append(e)
+    return results
+
+
 class TransformerService:
+    # raw data rows transformed and written together by transformPending
+    TRANSFORM_BATCH_SIZE = 50
+    # created_at is the inserting transaction's start time, a row committed after a run may be older than the
+    # watermark that run returned, rows this much older are reconsidered (rows already transformed are not pending)
+    WATERMARK_OVERLAP = timedelta(hours=1)
 
-    def __init__(self, destination: TransformDestination, transformers: List[Transformer]):
+    def __init__(self, destination: TransformDestination, transformers: List[Transformer],
+                 pendingDestination: Optional[TransformDestination] = None):
+        """
+        :param destination:
+        :param transformers:
+        :param pendingDestination: destination of ``transformPending``, which replaces attributes transformed from
+        older raw data (i.e. ``RepositoryDestination(replaceStale=True)``), defaults to ``destination``
+        """
         self.destination = destination
+        self.pendingDestination = destination if pendingDestination is None else pendingDestination
         self.log = logging.getLogger(self.__class__.__name__)
         self.brandNameToTransformer = dict()
         self._registerTransformers(transformers)
@@ -39,15 +86,28 @@ class TransformerService:
         if not rawDataDto.dataId:
             raise IllegalArgumentError("RawDataDto must have (data_id or raw_data) and model_id.")
 
+    def _toRawDataDtoAndBrandName(self, rawDataDto: RawDataDto, rawDataEntity: Optional[RawData]) \
+            -> RawDataDtoAndBrandName:
+        if not rawDataEntity:
+            raise IllegalArgumentError(f"No raw data found for dataId: {rawDataDto.dataId}")
+        if rawDataDto.modelId and str(rawDataDto.modelId) != rawDataEntity.model_id:
+            self.log.warning(f"Expected modelId: {rawDataDto.modelId} found modelId: {rawDataEntity.model_id}.")
+            raise IllegalStateError("The provided modelId is inconsistent with the fetched model_id")
+        fetchedDto = converter.convert(obj=rawDataEntity, outputType=RawDataDto)
+        return RawDataDtoAndBrandName(rawDataDto=fetchedDto, brandName=rawDataEntity.model.brand.name)
+
     def _fetchRawDataDtoAndBrandName(self, rawDataDto: RawDataDto) -> RawDataDtoAndBrandName:
         with sessionFactory.newSession() as session:
             rawDataEntity = rawDataRepository.getByDataId(dataId=rawDataDto.dataId, session=session)
-            if rawDataDto.modelId and rawDataDto.modelId != rawDataEntity.model_id:
-                self.log.warning(f"Expected modelId: {rawDataDto.modelId} found modelId: {rawDataEntity.model_id}.")
-                raise IllegalStateError("The provided modelId is inconsistent with the fetched model_id")
-            fetchedDto = converter.convert(obj=rawDataEntity, outputType=RawDataDto)
-            brandName = rawDataEntity.model.brand.name
-        return RawDataDtoAndBrandName(rawDataDto=fetchedDto, brandName=brandName)
+            return self._toRawDataDtoAndBrandName(rawDataDto, rawDataEntity)
+
+    def _fetchRawDataDtosAndBrandNames(self, rawDataDtos: List[RawDataDto]) -> List[RawDataDtoAndBrandName]:
+        with sessionFactory.newSession() as session:
+            rawDataEntities = rawDataRepository.getByDataIdsWithModelAndBrand(
+                dataIds=[rawDataDto.dataId for rawDataDto in rawDataDtos], session=session)
+            rawDataEntitiesById = {rawData.data_id: rawData for rawData in rawDataEntities}
+            return [self._toRawDataDtoAndBrandName(rawDataDto, rawDataEntitiesById.get(str(rawDataDto.dataId)))
+                    for rawDataDto in rawDataDtos]
 
     def _selectTransformer(self, brandName: str) -> Transformer:
         try:
@@ -62,12 +122,143 @@ class TransformerService:
         as when it is provided it is verified with the retrived object.
         :return:
         """
+        self._transform(rawDataDto, self.destination)
+
+    def _transform(self, rawDataDto: RawDataDto, destination: TransformDestination) -> None:
         self._validateRawDataDto(rawDataDto)
         syncedRawDataDto, brandName = self._fetchRawDataDtoAndBrandName(rawDataDto)
         transformer = self._selectTransformer(brandName)
-        attributeDtos = transformer.transform(rawDataDto)
-        self.destination.accept(attributeDtos=attributeDtos, rawDataDto=syncedRawDataDto)
+        attributeDtos = transformer.transform(syncedRawDataDto)
+        destination.accept(attributeDtos=attributeDtos, rawDataDto=syncedRawDataDto)
+
+    def transformMany(self, rawDataDtos: List[RawDataDto]) -> None:
+        """
+        Transforms a batch of raw data.  The rows, their models and brands are fetched by a single query and the
+        attributes of every row are handed to the destination together (``TransformDestination.acceptMany``).
+        :param rawDataDtos: as ``transform``, at most one per model
+        :return:
+        :raises: as ``transform``, if any row fails nothing is accepted
+        """
+        self._transformMany(rawDataDtos, self.destination)
+
+    def _transformMany(self, rawDataDtos: List[RawDataDto], destination: TransformDestination) -> None:
+        for rawDataDto in rawDataDtos:
+            self._validateRawDataDto(rawDataDto)
+        batch = list()
+        for syncedRawDataDto, brandName in self._fetchRawDataDtosAndBrandNames(rawDataDtos):
+            transformer = self._selectTransformer(brandName)
+            batch.append((transformer.transform(syncedRawDataDto), syncedRawDataDto))
+        destination.acceptMany(batch)
+
+    def _submitTransformChunk(self, executor: ProcessPoolExecutor, rawDataDtos: List[RawDataDto]) \
+            -> Tuple[Future, List[RawDataDto]]:
+        brandNamesAndRawDataDtos = list()
+        for syncedRawDataDto, brandName in self._fetchRawDataDtosAndBrandNames(rawDataDtos):
+            self._selectTransformer(brandName)
+            brandNamesAndRawDataDtos.append((brandName, syncedRawDataDto))
+        future = executor.submit(_transformInWorker, brandNamesAndRawDataDtos)
+        # the writer only needs the ids, the payload lives in the worker
+        return future, [dataclasses.replace(rawDataDto, rawData=None) for _brandName, rawDataDto
+                        in brandNamesAndRawDataDtos]
+
+    def _acceptTransformed(self, rawDataDtos: List[RawDataDto], results: List[List[AttributeDto] | ValueError]) -> int:
+        batch = list()
+        for rawDataDto, result in zip(rawDataDtos, results):
+            if isinstance(result, ValueError):
+                self.log.warning(f"Failed to transform dataId: {rawDataDto.dataId}: {result}")
+            else:
+                batch.append((result, rawDataDto))
+        try:
+            self.destination.acceptMany(batch)
+            return len(batch)
+        except (IllegalArgumentError, IllegalStateError) as e:
+            self.log.info(f"Batch failed, writing its {len(batch)} row(s) individually: {e}")
+        written = 0
+        for attributeDtos, rawDataDto in batch:
+            try:
+                self.destination.accept(attributeDtos=attributeDtos, rawDataDto=rawDataDto)
+                written += 1
+            except (IllegalArgumentError, IllegalStateError) as e:
+                self.log.warning(f"Failed to write attributes of dataId: {rawDataDto.dataId}: {e}")
+        return written
+
+    def transformParallel(self, rawDataDtos: List[RawDataDto], maxWorkers: Optional[int] = None) -> int:
+        """
+        Process pool counterpart of ``transformMany`` for CPU bound backfills.  This process fetches the rows and
+        writes the attributes in chunks of ``TRANSFORM_BATCH_SIZE``, workers only receive each row's brand name and
+        raw data and return its attributes.  At most two chunks per worker are in flight.  Rows that fail to
+        transform or to be written are logged and skipped.
+        :param rawDataDtos: as ``transform``
+        :param maxWorkers: number of worker processes, defaults to the number of CPUs
+        :return: number of rows whose attributes were written
+        :raises: ``IllegalArgumentError``, ``IllegalStateError`` if a row is missing, inconsistent or has no
+        registered transformer
+        """
+        maxWorkers = os.cpu_count() if maxWorkers is None else maxWorkers
+        if maxWorkers < 1:
+            raise ValueError(f"maxWorkers must be >= 1, received: {maxWorkers}")
+        for rawDataDto in rawDataDtos:
+            self._validateRawDataDto(rawDataDto)
+        chunks = (rawDataDtos[start:start + self.TRANSFORM_BATCH_SIZE]
+                  for start in range(0, len(rawDataDtos), self.TRANSFORM_BATCH_SIZE))
+        written = 0
+        with ProcessPoolExecutor(max_workers=maxWorkers, initializer=_initTransformWorker,
+                                 initargs=(self.brandNameToTransformer,)) as executor:
+            pending = dict(self._submitTransformChunk(executor, chunk)
+                           for chunk in itertools.islice(chunks, 2 * maxWorkers))
+            while pending:
+                done, _notDone = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunkRawDataDtos = pending.pop(future)
+                    if (nextChunk := next(chunks, None)) is not None:
+                        nextFuture, nextRawDataDtos = self._submitTransformChunk(executor, nextChunk)
+                        pending[nextFuture] = nextRawDataDtos
+                    written += self._acceptTransformed(chunkRawDataDtos, future.result())
+        self.log.info(f"Transformed and wrote {written} of {len(rawDataDtos)} raw data row(s).")
+        return written
+
+    def transformPending(self, since: Optional[datetime] = None) -> TransformPendingResult:
+        """
+        Transforms each model's most recent raw data if the model's attributes were not transformed from it yet,
+        skipping models whose raw data is unchanged since their last transform.  Rows are transformed in batches
+        (``transformMany``), a failed batch is retried row by row and a row that fails is logged and retried by the
+        next run.
+        :param since: watermark returned by a previous run, ``None`` considers all raw data.  Rows created up to
+        ``WATERMARK_OVERLAP`` before it are considered as well.
+        :return:
+        """
+        with sessionFactory.newSession() as session:
+            pending = transformStateRepository.getPending(
+                session=session, since=None if since is None else since - self.WATERMARK_OVERLAP)
+        transformedAt = list()
+        failedAt = list()
+        for start in range(0, len(pending), self.TRANSFORM_BATCH_SIZE):
+            rawDataDtos = [RawDataDto(dataId=dataId, rawData=None, modelId=modelId, createdAt=createdAt)
+                           for dataId, modelId, createdAt in pending[start:start + self.TRANSFORM_BATCH_SIZE]]
+            try:
+                self._transformMany(rawDataDtos, self.pendingDestination)
+                transformedAt.extend(rawDataDto.createdAt for rawDataDto in rawDataDtos)
+                continue
+            except (IllegalArgumentError, IllegalStateError, ValueError) as e:
+                self.log.info(f"Batch failed, transforming its {len(rawDataDtos)} row(s) individually: {e}")
+            for rawDataDto in rawDataDtos:
+                try:
+                    self._transform(rawDataDto, self.pendingDestination)
+                    transformedAt.append(rawDataDto.createdAt)
+                except (IllegalArgumentError, IllegalStateError, ValueError) as e:
+                    self.log.warning(f"Failed to transform dataId: {rawDataDto.dataId} for modelId: "
+                                     f"{rawDataDto.modelId}: {e}")
+                    failedAt.append(rawDataDto.createdAt)
+        # the watermark must stay below the oldest failed row so the next run retries it
+        oldestFailedAt = min(failedAt, default=None)
+        watermark = max((createdAt for createdAt in transformedAt
+                         if oldestFailedAt is None or createdAt < oldestFailedAt), default=since)
+        transformed = len(pending) - len(failedAt)
+        self.log.info(f"Transformed {transformed} of {len(pending)} pending raw data row(s), {len(failedAt)} failed.")
+        return TransformPendingResult(transformed=transformed, failed=len(failedAt), watermark=watermark)
 
 
 transformerService = TransformerService(destination=RepositoryDestination(overwriteExisting=False),
-                                        transformers=[ToyotaTransformer(), GmTransformer()])
+                                        transformers=[ToyotaTransformer(), GmTransformer()],
+                                        pendingDestination=RepositoryDestination(overwriteExisting=False,
+                                                                                 replaceStale=True))
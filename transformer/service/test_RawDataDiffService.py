@@ -0,0 +1,59 @@
+import datetime
+from unittest import TestCase
+
+from common.domain.entities import Manufacturer, Brand, Model, RawData
+from common.exception.IllegalArgumentError import IllegalArgumentError
+from common.repository.RawDataDiffRepository import rawDataDiffRepository
+from common.repository.SessionFactory import sessionFactory
+from common.repository.test_common.DbContainer import DbContainer
+from transformer.service.RawDataDiffService import RawDataDiffService
+
+
+class IntegrationTestRawDataDiffService(TestCase):
+    container: DbContainer = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.container = DbContainer()
+        cls.container.start()
+        cls.container.initTables()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.container.stop()
+
+    def setUp(self):
+        self.rawDataDiffService = RawDataDiffService()
+        with sessionFactory.newSession() as session:
+            toyotaManufacturer = Manufacturer(official_name='Toyota Motor Company', common_name='Toyota')
+            toyotaBrand = Brand(name='Toyota', manufacturer=toyotaManufacturer)
+            camry = Model(name='Camry', model_year=datetime.date(2023, 1, 1), brand=toyotaBrand)
+            supra = Model(name='Supra', model_year=datetime.date(2023, 1, 1), brand=toyotaBrand)
+            now = datetime.datetime.now(datetime.timezone.utc)
+            self.camryOld = RawData(model=camry, created_at=now - datetime.timedelta(days=1),
+                                    raw_data={'price': 100, 'colors': ['red', 'blue']})
+            self.camryNew = RawData(model=camry, created_at=now, raw_data={'price': 110, 'colors': ['red']})
+            self.supra = RawData(model=supra, raw_data={'price': 500})
+            session.add_all([toyotaManufacturer, toyotaBrand, camry, supra, self.camryOld, self.camryNew, self.supra])
+            session.commit()
+            self.camryOldId, self.camryNewId, self.supraId = \
+                self.camryOld.data_id, self.camryNew.data_id, self.supra.data_id
+
+    def tearDown(self) -> None:
+        self.container.deleteAll()
+
+    def test_diffStoresChanges(self):
+        found = self.rawDataDiffService.diff(self.camryOldId, self.camryNewId)
+        expected = [{'op': 'remove', 'path': '/colors/1', 'old': 'blue'},
+                    {'op': 'replace', 'path': '/price', 'old': 100, 'new': 110}]
+        self.assertEqual(expected, found.changes)
+        with sessionFactory.newSession() as session:
+            queried = list(rawDataDiffRepository.getDiffsContaining({'op': 'replace', 'path': '/price'}, session))
+            self.assertEqual([found.diff_id], [rawDataDiff.diff_id for rawDataDiff in queried])
+
+    def test_diffRaisesForDifferentModels(self):
+        self.assertRaises(IllegalArgumentError, lambda: self.rawDataDiffService.diff(self.camryOldId, self.supraId))
+
+    def test_diffAllMostRecentDiffsOnlyNewPairs(self):
+        self.assertEqual(1, self.rawDataDiffService.diffAllMostRecent())
+        self.assertEqual(0, self.rawDataDiffService.diffAllMostRecent())
@@ -1,11 +1,14 @@
 import uuid
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+from typing import List
 
 from parameterized import parameterized
 
 from common.domain.converter.Converter import converter
-from common.domain.dto.AttributeDto import Other
+from common.domain.dto.AttributeDto import Other, AttributeDto
 from common.domain.dto.RawDataDto import RawDataDto
 from common.domain.entities import Manufacturer, Brand, Model, RawData
 from common.exception.IllegalArgumentError import IllegalArgumentError
@@ -13,8 +16,20 @@ from common.exception.IllegalStateError import IllegalStateError
 from common.repository.SessionFactory import sessionFactory
 from common.repository.test_common.DbContainer import DbContainer
 from transformer.adapter.transform_destination.MockDestination import MockDestination
-from transformer.service.TransformerService import TransformerService
+from transformer.service.TransformerService import TransformerService, RawDataDtoAndBrandName
 from transformer.transform.MockTransformer import MockTransformer
+from transformer.transform.Transformer import Transformer
+
+
+class TitleTransformer(Transformer):
+    """Picklable transformer for worker processes, transforms ``{'title': ...}`` to a single attribute"""
+
+    def __init__(self):
+        super().__init__(manufacturerCommon='manufacturer', brandNames=['brand'])
+
+    def transform(self, rawDataDto: RawDataDto) -> List[AttributeDto]:
+        self._assertValidJsonData(rawDataDto.rawData)
+        return [Other(title=rawDataDto.rawData['title'])]
 
 
 class TestTransformerService(TestCase):
@@ -46,6 +61,83 @@ class TestTransformerService(TestCase):
         self.assertRaises(IllegalArgumentError, lambda: self.transformerService.transform(invalidDto))
 
 
+class TestTransformPending(TestCase):
+
+    def setUp(self):
+        self.start = datetime(2023, 1, 1)
+        self.pending = [(uuid.uuid4(), uuid.uuid4(), self.start + timedelta(hours=i)) for i in range(4)]
+        self.patcherSessionFactory = mock.patch('transformer.service.TransformerService.sessionFactory')
+        self.patcherSessionFactory.start()
+        self.patcherGetPending = mock.patch(
+            'transformer.service.TransformerService.transformStateRepository.getPending', return_value=self.pending)
+        self.getPendingMock = self.patcherGetPending.start()
+        self.pendingDestination = MockDestination()
+        self.transformerService = TransformerService(destination=MockDestination(), transformers=[],
+                                                     pendingDestination=self.pendingDestination)
+        self.transformerService.TRANSFORM_BATCH_SIZE = 2
+        self.transformerService._transformMany = MagicMock()
+        self.transformerService._transform = MagicMock()
+
+    def tearDown(self) -> None:
+        self.patcherGetPending.stop()
+        self.patcherSessionFactory.stop()
+
+    def test_transformPendingTransformsEachPendingRow(self):
+        result = self.transformerService.transformPending(since=self.start)
+        self.assertEqual((4, 0, self.pending[-1][2]), result)
+        self.assertEqual(self.start - TransformerService.WATERMARK_OVERLAP,
+                         self.getPendingMock.call_args.kwargs['since'])
+        transformedDataIds = [[rawDataDto.dataId for rawDataDto in args[0]]
+                              for args, _kwargs in self.transformerService._transformMany.call_args_list]
+        self.assertEqual([[dataId for dataId, _modelId, _createdAt in self.pending[:2]],
+                          [dataId for dataId, _modelId, _createdAt in self.pending[2:]]], transformedDataIds)
+        self.assertTrue(all(args[1] is self.pendingDestination
+                            for args, _kwargs in self.transformerService._transformMany.call_args_list))
+        self.transformerService._transform.assert_not_called()
+
+    def test_transformPendingRetriesFailedBatchRowByRow(self):
+        self.transformerService._transformMany.side_effect = [IllegalStateError('exists'), None]
+        self.transformerService._transform.side_effect = [None, IllegalStateError('exists')]
+        result = self.transformerService.transformPending()
+        self.assertEqual((3, 1, self.pending[0][2]), result)
+        self.assertEqual(2, self.transformerService._transform.call_count)
+
+    def test_transformPendingConsidersAllRowsWithoutWatermark(self):
+        self.transformerService.transformPending()
+        self.assertIsNone(self.getPendingMock.call_args.kwargs['since'])
+
+    def test_transformPendingWatermarkUnchangedWhenNothingTransformed(self):
+        self.getPendingMock.return_value = []
+        self.assertEqual((0, 0, self.start), self.transformerService.transformPending(since=self.start))
+
+
+class TestTransformParallel(TestCase):
+
+    def setUp(self):
+        self.rawDataDtos = [RawDataDto(dataId=uuid.uuid4(), rawData={'title': f'title{i}'} if i != 3 else {},
+                                       modelId=uuid.uuid4(), createdAt=datetime(2023, 1, 1)) for i in range(5)]
+        self.destination = MockDestination()
+        self.transformerService = TransformerService(destination=self.destination, transformers=[TitleTransformer()])
+        self.transformerService.TRANSFORM_BATCH_SIZE = 2
+        self.transformerService._fetchRawDataDtosAndBrandNames = MagicMock(
+            side_effect=lambda rawDataDtos: [RawDataDtoAndBrandName(rawDataDto, 'brand') for rawDataDto in rawDataDtos])
+
+    def test_transformParallelWritesWorkerResults(self):
+        self.assertEqual(4, self.transformerService.transformParallel(self.rawDataDtos, maxWorkers=2))
+        titlesByDataId = {rawDataDto.dataId: [attributeDto.title for attributeDto in attributeDtos]
+                          for attributeDtos, rawDataDto in self.destination.calledWith}
+        expected = {rawDataDto.dataId: [rawDataDto.rawData['title']] for rawDataDto in self.rawDataDtos
+                    if rawDataDto.rawData}
+        self.assertEqual(expected, titlesByDataId)
+        self.assertTrue(all(rawDataDto.rawData is None for _attributeDtos, rawDataDto in self.destination.calledWith),
+                        "payloads are not sent back to the writer")
+
+    @parameterized.expand([0, -1])
+    def test_transformParallelRaisesOnInvalidMaxWorkers(self, maxWorkers: int):
+        self.assertRaises(ValueError,
+                          lambda: self.transformerService.transformParallel(self.rawDataDtos, maxWorkers=maxWorkers))
+
+
 class IntegrationTestTransformerService(TestCase):
     container: DbContainer = None
     rawDataDto: RawDataDto = None  # source for transformations
@@ -104,3 +196,16 @@ class IntegrationTestTransformerService(TestCase):
         self.transformerService.transform(self.rawDataDto)
         self.assertEqual((attributeDtos, self.rawDataDto), self.mockDestination.calledWith[0])
         self.assertEqual(1, len(self.mockDestination.calledWith))
+
+    def test_transformManyCallsDestinationWithEachRow(self):
+        attributeDtos = [Other(title="Fake Attribute")]
+        self.mockTransformer.addReturnValues(returnValues=[attributeDtos])
+        self.transformerService.transformMany([self.rawDataDto])
+        self.assertEqual([self.rawDataDto], self.mockTransformer.calledWith)
+        self.assertEqual([(attributeDtos, self.rawDataDto)], self.mockDestination.calledWith)
+
+    def test_transformManyRaisesWhenRawDataNotFound(self):
+        missingDto = RawDataDto(dataId=uuid.uuid4(), rawData=None, modelId=None, createdAt=None)
+        self.assertRaises(IllegalArgumentError,
+                          lambda: self.transformerService.transformMany([self.rawDataDto, missingDto]))
+        self.assertEqual([], self.mockDestination.calledWith)
@@ -0,0 +1,120 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# a path is a dotted str of dict keys, i.e. 'attributes.msrp.value', or a sequence of dict keys and list indices
+PathSpec = str | Sequence[str | int]
+
+_MISSING = object()
+
+
+def _compilePath(path: PathSpec) -> Tuple[str | int, ...]:
+    segments = tuple(path.split('.')) if isinstance(path, str) else tuple(path)
+    if not segments or any(segment == '' for segment in segments):
+        raise ValueError(f"Invalid path: {path!r}")
+    return segments
+
+
+def _lookup(value: Any, segment: str | int) -> Any:
+    if isinstance(value, dict):
+        return value.get(segment, _MISSING)
+    if isinstance(value, list) and type(segment) is int and -len(value) <= segment < len(value):
+        return value[segment]
+    return _MISSING
+
+
+class PathMiss(NamedTuple):
+    path: Tuple[str | int, ...]
+    # number of segments resolved before the miss
+    depth: int
+
+    @property
+    def key(self) -> str | int:
+        return self.path[self.depth]
+
+    def error(self) -> KeyError:
+        """
+        :return: the ``KeyError`` indexing the path would have raised, for logging (not raised)
+        """
+        return KeyError(self.key)
+
+
+class PathResult:
+    __slots__ = ('values', 'misses')
+
+    def __init__(self, values: Dict[str, Any], misses: Dict[str, PathMiss]):
+        self.values = values
+        self.misses = misses
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.values.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(values={self.values}, misses={self.misses})"
+
+
+class _Node:
+    __slots__ = ('children', 'names', 'subtreeNames')
+
+    def __init__(self):
+        self.children: Dict[str | int, '_Node'] = dict()
+        # paths ending at this node
+        self.names: List[str] = list()
+        # paths ending at or below this node, all miss together when this node is missing
+        self.subtreeNames: List[str] = list()
+
+
+class PathQuery:
+    """
+    A precompiled set of named JSON paths, resolved together in a single traversal: paths sharing a prefix walk it
+    once.  A path that can't be followed (missing key, index out of range, unexpected type) is reported as a
+    ``PathMiss`` rather than raised, keeping exceptions out of parser loops::
+
+        query = PathQuery({'msrp': 'attributes.msrp.value', 'seating': 'attributes.seating.value'})
+        result = query.resolve(modelJson)
+        result.get('msrp'), result.misses.get('seating')
+
+    Queries are immutable, create them once (i.e. as class attributes) and reuse them.
+    """
+
+    def __init__(self, paths: Dict[str, PathSpec]):
+        self.paths = {name: _compilePath(path) for name, path in paths.items()}
+        self._root = _Node()
+        for name, segments in self.paths.items():
+            node = self._root
+            node.subtreeNames.append(name)
+            for segment in segments:
+                node = node.children.setdefault(segment, _Node())
+                node.subtreeNames.append(name)
+            node.names.append(name)
+
+    def resolve(self, data: Any) -> PathResult:
+        values = dict()
+        misses = dict()
+        stack = [(self._root, data, 0)]
+        while stack:
+            node, value, depth = stack.pop()
+            for name in node.names:
+                values[name] = value
+            for segment, child in node.children.items():
+                if (found := _lookup(value, segment)) is _MISSING:
+                    for name in child.subtreeNames:
+                        misses[name] = PathMiss(path=self.paths[name], depth=depth)
+                else:
+                    stack.append((child, found, depth + 1))
+        return PathResult(values=values, misses=misses)
+
+    def get(self, data: Any, name: str, default: Optional[Any] = None) -> Any:
+        """
+        Resolves only the path ``name``.
+        :param data:
+        :param name:
+        :param default: returned on a miss
+        :return:
+        """
+        value = data
+        for segment in self.paths[name]:
+            if (value := _lookup(value, segment)) is _MISSING:
+                return default
+        return value
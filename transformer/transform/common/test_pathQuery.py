@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from transformer.transform.common.pathQuery import PathQuery, PathMiss
+
+
+class TestPathQuery(TestCase):
+
+    def setUp(self) -> None:
+        self.data = {'attributes': {'msrp': {'value': '$101,500'}, 'seating': {'value': None}},
+                     'grades': [{'title': 'LE'}, {'title': 'XLE'}]}
+
+    def test_resolve(self):
+        query = PathQuery({'msrp': 'attributes.msrp.value', 'seating': 'attributes.seating.value',
+                           'lastGrade': ('grades', -1, 'title')})
+        result = query.resolve(self.data)
+        self.assertEqual({'msrp': '$101,500', 'seating': None, 'lastGrade': 'XLE'}, result.values)
+        self.assertEqual(dict(), result.misses)
+
+    def test_resolveReportsMisses(self):
+        query = PathQuery({'cab': 'cab.title', 'dealerTrim': 'attributes.dealertrim.value',
+                           'deepMsrp': 'attributes.msrp.value.amount', 'grade': ('grades', 2, 'title'),
+                           'byKey': 'grades.title'})
+        result = query.resolve(self.data)
+        self.assertEqual(dict(), result.values)
+        self.assertEqual(PathMiss(path=('cab', 'title'), depth=0), result.misses['cab'])
+        self.assertEqual('dealertrim', result.misses['dealerTrim'].key)
+        self.assertEqual('amount', result.misses['deepMsrp'].key, "str has no keys")
+        self.assertEqual(2, result.misses['grade'].key, "index out of range")
+        self.assertEqual('title', result.misses['byKey'].key, "list has no keys")
+        self.assertIsInstance(result.misses['cab'].error(), KeyError)
+
+    def test_resolveSharedPrefixMisses(self):
+        query = PathQuery({'bed': 'bed.title', 'bedLength': 'bed.length.value'})
+        result = query.resolve({})
+        self.assertEqual({'bed', 'bedLength'}, result.misses.keys())
+        self.assertTrue(all(miss.key == 'bed' for miss in result.misses.values()))
+
+    def test_get(self):
+        query = PathQuery({'msrp': 'attributes.msrp.value', 'cab': 'cab.title'})
+        self.assertEqual('$101,500', query.get(self.data, 'msrp'))
+        self.assertEqual('Standard', query.get(self.data, 'cab', default='Standard'))
+
+    def test_invalidPathRaises(self):
+        self.assertRaises(ValueError, lambda: PathQuery({'empty': ''}))
+        self.assertRaises(ValueError, lambda: PathQuery({'empty': 'attributes..value'}))
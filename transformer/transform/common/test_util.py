@@ -13,17 +13,31 @@ class Test_Util(TestCase):
                            ["$1,000.99", 1_001],
                            ["-$1,000.99", -1_001],
                            [1_000.51, 1_001],
-                           [1_000, 1_000]
+                           [1_000, 1_000],
+                           ["1000", 1_000],
+                           ["-3", -3]
                            ])
     def test_priceStrToInt(self, priceStr: str | int | float, expected: int):
         found = util.priceToInt(priceStr)
         self.assertEqual(expected, found)
 
+    @parameterized.expand([["$"], ["-"], ["."], ["$1.0.0"], ["Free"]])
+    def test_priceToIntInvalid(self, priceStr: str):
+        self.assertRaises(ValueError, util.priceToInt, priceStr)
+
+    def test_pricesToInts(self):
+        found = util.pricesToInts(["$0", "$1,000.99", None, "", "$0", 425, 7.5])
+        self.assertEqual([0, 1_001, None, None, 0, 425, 8], found)
+
+    def test_pricesToIntsInvalid(self):
+        self.assertRaises(ValueError, util.pricesToInts, ["$0", "Free"])
+
     @parameterized.expand([["ALL-WEATHER FLOOR LINERS[FLOORMAT8]", "ALL-WEATHER FLOOR LINERS"],
                            ["TORSEN&reg;[TORSEN] LIMITED-SLIP REAR DIFFERENTIAL AND YAMAHA&reg",
                             "TORSEN&reg; LIMITED-SLIP REAR DIFFERENTIAL AND YAMAHA&reg"],
                            ["Not Bracketed[Bracketed], Not Bracketed[Bracketed].",
-                            "Not Bracketed, Not Bracketed."]
+                            "Not Bracketed, Not Bracketed."],
+                           [" Not Bracketed ", "Not Bracketed"]
                            ])
     def test_removeBracketed(self, bracketedText: str, expected: str):
         found = util.removeBracketed(bracketedText)
@@ -34,7 +48,9 @@ class Test_Util(TestCase):
         ["153 Angry Cats", 153],
         ["Blind Mice: -3", -3],
         [100, 100],
-        [2.99, 3]
+        [2.99, 3],
+        ["42", 42],
+        ["No Digits", None]
     ])
     def testDigitsToInt(self, input: str | int | float, expected: int):
         found = util.digitsToInt(input)
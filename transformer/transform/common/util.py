@@ -1,10 +1,22 @@
 import re
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
+
+_NUM_PATTERN = re.compile(r"-?\d*\.?\d*")
+_DIGITS_PATTERN = re.compile(r"-?\d+")
+_BRACKETED_PATTERN = re.compile(r'\[[^]]*]')
+
+
+def _isIntStr(numStr: str) -> bool:
+    # fast path for already clean ints, i.e. "1000" or "-3"
+    digits = numStr[1:] if numStr[:1] == '-' else numStr
+    return digits.isdecimal()
 
 
 def numStrToInt(numStr: str) -> int:
     numStr = numStr.strip().replace(",", "")
-    if not re.fullmatch("-?\d*\.?\d*", numStr) or numStr in {'.', '-', '-.'}:
+    if _isIntStr(numStr):
+        return int(numStr)
+    if not _NUM_PATTERN.fullmatch(numStr) or numStr in {'.', '-', '-.'}:
         # '.' falls through regex pattern
         # number at the end of a sentence accurately parsed, although a bit of an edge case
         raise ValueError(f"Invalid input: {numStr}")
@@ -21,16 +33,40 @@ def priceToInt(price: int | str | float) -> int:
     return numStrToInt(price)
 
 
+def pricesToInts(prices: Iterable[Optional[int | str | float]]) -> List[Optional[int]]:
+    """
+    ``priceToInt`` of a whole column of prices, i.e. every accessory price of a model.  Each distinct price is
+    parsed once, a column usually repeats a handful of values (``"$0"``, ``"$425"``).
+    :param prices:
+    :return: in order, ``None`` where the price is ``None`` or empty
+    :raises: ``ValueError`` if a price is un-parsable
+    """
+    parsed: Dict[int | str | float, int] = dict()
+    ints = list()
+    for price in prices:
+        if price is None or price == '':
+            ints.append(None)
+        elif (priceInt := parsed.get(price)) is not None:
+            ints.append(priceInt)
+        else:
+            ints.append(parsed.setdefault(price, priceToInt(price)))
+    return ints
+
+
 def digitsToInt(input: str | int | float) -> Optional[int]:
     if type(input) is int:
         return input
     if type(input) is float:
         return int(round(input, 0))
+    if input.isdecimal():
+        return int(input)
     # creates an int from first group of consecutive digits in text
-    if not (matchObj := re.search(r"-?\d+", input)):
+    if not (matchObj := _DIGITS_PATTERN.search(input)):
         return None
     return int(matchObj.group())
 
 
 def removeBracketed(text: str) -> str:
-    return re.sub(r'\[[^]]*]', '', text).strip()
+    if '[' not in text:
+        return text.strip()
+    return _BRACKETED_PATTERN.sub('', text).strip()
@@ -34,4 +34,5 @@ class GmTransformer(Transformer):
                 attributes.extend(parser.parse(dataDict))
             except Exception as e:
                 self.loggingTools.logParserFailure(transformer=type(self), parser=type(parser), exception=e)
+        self.loggingTools.clearModelIdentifier()
         return attributes
@@ -12,6 +12,11 @@ from transformer.transform.AttributeParser import AttributeParser
 from transformer.transform.common import util
 from transformer.transform.gm.parser.LoggingTools import LoggingTools
 
+_HORSEPOWER_PATTERN = re.compile(r"(\d+(\.\d)?)\s?hp", flags=re.IGNORECASE)
+_DISPLACEMENT_PATTERN = re.compile(r"\d(\.\d)?L")
+_DIESEL_PATTERN = re.compile("diesel", flags=re.IGNORECASE)
+_ELECTRIC_PATTERN = re.compile("electric", flags=re.IGNORECASE)
+
 
 class EngineParser(AttributeParser):
     def __init__(self, loggingTools: LoggingTools):
@@ -28,7 +33,7 @@ class EngineParser(AttributeParser):
         metadataType = MetadataType.ENGINE_HORSEPOWER
         for engineDetails in engineDict.get("extendedCFD", ""), engineDict.get("longCFD", ""):
             # hp can be listed in 2 locations (inconsistent)
-            if (hpResult := re.search(pattern="(\d+(\.\d)?)\s?hp", string=engineDetails, flags=re.IGNORECASE)):
+            if (hpResult := _HORSEPOWER_PATTERN.search(engineDetails)):
                 hpInt = util.numStrToInt(hpResult.group(1))
                 return AttributeMetadata(metadataType=metadataType, value=hpInt, unit=MetadataUnit.HORSEPOWER)
         self.loggingTools.logtAttributeFailure(parser=type(self), metadataType=metadataType,
@@ -38,12 +43,12 @@ class EngineParser(AttributeParser):
     def _getFuelType(self, engineDict: Dict, modelIdentifier: str) -> Optional[AttributeMetadata]:
         # use displacement (#L or #.#L) as identifier for internal combustion engine
         engineName = engineDict.get("primaryName") or ""
-        if re.search(pattern="\d(\.\d)?L", string=engineName):
-            if re.search(pattern="diesel", string=engineName, flags=re.IGNORECASE):
+        if _DISPLACEMENT_PATTERN.search(engineName):
+            if _DIESEL_PATTERN.search(engineName):
                 fuelType = FuelType.DIESEL.value
             else:
                 fuelType = FuelType.GASOLINE.value
-        elif re.search(pattern="electric", string=engineDict.get("description") or "", flags=re.IGNORECASE):
+        elif _ELECTRIC_PATTERN.search(engineDict.get("description") or ""):
             fuelType = FuelType.ELECTRIC.value
         # no hybrid, GM has none currently (1-2023)
         else:
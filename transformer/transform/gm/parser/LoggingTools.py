@@ -9,6 +9,9 @@ class LoggingTools:
 
     def __init__(self, logger: logging.Logger):
         self.log = logger
+        # getModelIdentifier is called by every parser, cache the identifier of the payload being parsed
+        self._identifiedDataDict: Optional[Dict] = None
+        self._modelIdentifier: Optional[str] = None
 
     def logNoAttributes(self, parser: Type, modelIdentifier: str):
         """
@@ -17,36 +20,49 @@ class LoggingTools:
         the model being parsed such as "{Year} {Brand} {Model}"
         :return:
         """
-        self.log.info(f"No Attributes found for: {modelIdentifier} - {parser.__name__}")
+        self.log.info("No Attributes found for: %s - %s", modelIdentifier, parser.__name__)
 
     def logTitleFailure(self, parser: type, modelIdentifier: str):
-        self.log.debug(f"Failure parsing title for: {modelIdentifier} - {parser.__name__}")
+        self.log.debug("Failure parsing title for: %s - %s", modelIdentifier, parser.__name__)
 
     def logtAttributeFailure(self, parser: type, modelIdentifier: str, metadataType: MetadataType):
-        self.log.debug(f"Failure to metadata: {metadataType} from {parser.__name__}: {modelIdentifier} ")
+        self.log.debug("Failure to metadata: %s from %s: %s ", metadataType, parser.__name__, modelIdentifier)
 
     def logUnexpectedSchema(self, parser: type, modelIdentifier: str, exception: Optional[Exception]):
-        self.log.warning(f"Encountered an unexpected RawData Schema: {modelIdentifier} - {parser.__name__}",
+        self.log.warning("Encountered an unexpected RawData Schema: %s - %s", modelIdentifier, parser.__name__,
                          exc_info=exception)
 
     def logParserFailure(self, transformer: type, parser: type, exception: Exception) -> None:
-        logging.info(f"{transformer.__name__} - {parser.__name__} ")
+        logging.info("%s - %s ", transformer.__name__, parser.__name__)
         logging.debug("Parser Failure:\n", exc_info=exception)
 
     def logInfo(self, parser: type, msg: str, modelIdentifier: str = None):
         if modelIdentifier:
-            prefix = f"{parser.__name__} : {modelIdentifier} INFO"
+            self.log.info("%s : %s INFO: %s", parser.__name__, modelIdentifier, msg)
         else:
-            prefix = f"{parser.__name__} INFO"
-        self.log.info(f"{prefix}: {msg}")
+            self.log.info("%s INFO: %s", parser.__name__, msg)
 
     def getModelIdentifier(self, dataDict: Dict) -> str:
         """
         Return an identifier that can be used for logging (optimally human-readable,
-        but non-readable and consistent as a fallback)
+        but non-readable and consistent as a fallback).  Computed once per payload, repeated calls with the same
+        ``dataDict`` return the cached identifier.
         :param dataDict:
         :return:
         """
+        if dataDict is not self._identifiedDataDict:
+            self._modelIdentifier = self._createModelIdentifier(dataDict)
+            self._identifiedDataDict = dataDict
+        return self._modelIdentifier
+
+    def clearModelIdentifier(self) -> None:
+        """
+        Releases the payload held for ``getModelIdentifier``'s cache, call once the payload has been parsed.
+        """
+        self._identifiedDataDict = None
+        self._modelIdentifier = None
+
+    def _createModelIdentifier(self, dataDict: Dict) -> str:
         try:
             params = dataDict['config']['vsParams']
             paramsByName = {param['name']: param['value'] for param in params if
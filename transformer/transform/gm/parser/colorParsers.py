@@ -8,9 +8,15 @@ from transformer.domain.attribute_set.AttributeSet import AttributeSet
 from transformer.domain.attribute_set.metadata_updater.implementation.PriceUpdater import PriceUpdater
 from transformer.transform.AttributeParser import AttributeParser
 from transformer.transform.common import util
+from transformer.transform.common.pathQuery import PathQuery
 from transformer.transform.gm.parser.LoggingTools import LoggingTools
 
 
+# color categories by kind, ``ColorParser.getColorCategories``
+COLOR_CATEGORY_PATHS = PathQuery({'interior': 'config.OPTIONS.COLOR.interior',
+                                  'exterior': 'config.OPTIONS.COLOR.exterior'})
+
+
 class ColorParser:
 
     def __init__(self, attributeType: Type, attributeParser: AttributeParser, loggingTools: LoggingTools):
@@ -51,6 +57,20 @@ class ColorParser:
                 metadata = [priceMetadata]
             return self.attributeConstructor(title=title, metadata=metadata)
 
+    def getColorCategories(self, dataDict: Dict, name: str, modelIdentifier: str) -> List[Dict]:
+        """
+        :param dataDict:
+        :param name: ``'interior'`` or ``'exterior'``
+        :param modelIdentifier:
+        :return:
+        """
+        paths = COLOR_CATEGORY_PATHS.resolve(dataDict)
+        if (miss := paths.misses.get(name)):
+            self.loggingTools.logUnexpectedSchema(parser=self.attributeParser, modelIdentifier=modelIdentifier,
+                                                  exception=miss.error())
+            return list()
+        return paths.get(name) or list()
+
     def getColors(self, categoryDicts: List[Dict], modelIdentifier: str) -> List[AttributeDto]:
         colors = AttributeSet(updater=PriceUpdater(metadataType=MetadataType.COMMON_MSRP, keepLowest=False))
         for category in categoryDicts:
@@ -70,12 +90,7 @@ class InteriorColorParser(AttributeParser):
         self.colorParser = ColorParser(attributeType=InteriorColor, attributeParser=self, loggingTools=loggingTools)
 
     def _getInteriorColorCategories(self, dataDict: Dict, modelIdentifier: str) -> List[Dict]:
-        try:
-            colorCategories = dataDict['config']['OPTIONS']['COLOR']['interior']
-        except KeyError as e:
-            self.loggingTools.logUnexpectedSchema(parser=type(self), modelIdentifier=modelIdentifier, exception=e)
-            return list()
-        return colorCategories or list()
+        return self.colorParser.getColorCategories(dataDict=dataDict, name='interior', modelIdentifier=modelIdentifier)
 
     def parse(self, dataDict: Dict) -> List[InteriorColor]:
         modelIdentifier = self.loggingTools.getModelIdentifier(dataDict)
@@ -90,12 +105,7 @@ class ExteriorColorParser(AttributeParser):
         self.colorParser = ColorParser(attributeType=ExteriorColor, attributeParser=self, loggingTools=loggingTools)
 
     def _getInteriorColorCategories(self, dataDict: Dict, modelIdentifier: str) -> List[Dict]:
-        try:
-            colorCategories = dataDict['config']['OPTIONS']['COLOR']['exterior']
-        except KeyError as e:
-            self.loggingTools.logUnexpectedSchema(parser=type(self), modelIdentifier=modelIdentifier, exception=e)
-            return list()
-        return colorCategories or list()
+        return self.colorParser.getColorCategories(dataDict=dataDict, name='exterior', modelIdentifier=modelIdentifier)
 
     def parse(self, dataDict: Dict) -> List[InteriorColor]:
         modelIdentifier = self.loggingTools.getModelIdentifier(dataDict)
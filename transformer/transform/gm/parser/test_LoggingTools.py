@@ -0,0 +1,36 @@
+import logging
+from unittest import TestCase
+from unittest.mock import patch
+
+from transformer.transform.gm.parser.LoggingTools import LoggingTools
+
+
+class TestLoggingTools(TestCase):
+
+    def setUp(self) -> None:
+        self.loggingTools = LoggingTools(logging.getLogger(name=type(self).__name__))
+
+    def _dataDict(self):
+        return {'config': {'vsParams': [{'name': 'years', 'value': '2023'}, {'name': 'makes', 'value': 'chevrolet'},
+                                        {'name': 'models', 'value': 'colorado'}, {'name': 'other', 'value': 'x'}]}}
+
+    def test_getModelIdentifier(self):
+        self.assertEqual("2023 - chevrolet colorado", self.loggingTools.getModelIdentifier(self._dataDict()))
+
+    def test_getModelIdentifierCachedPerPayload(self):
+        dataDict = {'modelMatrix': dict()}
+        with patch('transformer.transform.gm.parser.LoggingTools.json.dumps', return_value='{}') as dumps:
+            first = self.loggingTools.getModelIdentifier(dataDict)
+            second = self.loggingTools.getModelIdentifier(dataDict)
+        self.assertTrue(first.startswith("Unknown - "))
+        self.assertEqual(first, second)
+        dumps.assert_called_once()
+
+    def test_getModelIdentifierNewPayload(self):
+        self.loggingTools.getModelIdentifier({'modelMatrix': dict()})
+        self.assertEqual("2023 - chevrolet colorado", self.loggingTools.getModelIdentifier(self._dataDict()))
+
+    def test_clearModelIdentifier(self):
+        self.loggingTools.getModelIdentifier(self._dataDict())
+        self.loggingTools.clearModelIdentifier()
+        self.assertIsNone(self.loggingTools._identifiedDataDict)
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 from common.domain.dto.AttributeDto import AttributeDto, Accessory, Package
 from common.domain.dto.RawDataDto import RawDataDto
@@ -18,8 +18,13 @@ from transformer.transform.toyota.parser.TransmissionParser import TransmissionP
 
 class ToyotaTransformer(Transformer):
 
-    def __init__(self):
+    def __init__(self, singlePass: bool = True):
+        """
+        :param singlePass: walk ``jsonData['model']`` once, handing each entry to every parser, rather than once per
+        parser.  Results are the same either way.
+        """
         super().__init__(manufacturerCommon='Toyota', brandNames=['Toyota', "Lexus"])
+        self.singlePass = singlePass
         self.log = logging.getLogger(self.__class__.__name__)
         self.loggingTools = LoggingTools(logger=self.log)
         self.parsers = [EngineParser(self.loggingTools), TransmissionParser(self.loggingTools),
@@ -31,13 +36,46 @@ class ToyotaTransformer(Transformer):
     def transform(self, rawDataDto: RawDataDto) -> List[AttributeDto]:
         jsonData = rawDataDto.rawData
         self._assertValidJsonData(jsonData)
+        attributes = self._parseSinglePass(jsonData) if self.singlePass else self._parseEach(jsonData)
+        return self._deDupAccessoryPackage(attributes)
+
+    def _parseEach(self, jsonData: Dict) -> List[AttributeDto]:
         attributes = list()
         for parser in self.parsers:
             try:
                 attributes.extend(parser.parse(jsonData))
             except Exception as e:
                 self.loggingTools.logParserFailure(transformer=type(self), parser=type(parser), exception=e)
-        return self._deDupAccessoryPackage(attributes)
+        return attributes
+
+    def _parseSinglePass(self, jsonData: Dict) -> List[AttributeDto]:
+        """
+        Same result as ``_parseEach``: a parser raising on any model entry contributes no attributes.
+        """
+        accumulators = {parser: parser.newAccumulator() for parser in self.parsers}
+        failures = dict()
+        try:
+            for modelJson in jsonData['model']:
+                for parser, accumulator in accumulators.items():
+                    if parser in failures:
+                        continue
+                    try:
+                        parser.acceptModel(modelJson, accumulator)
+                    except Exception as e:
+                        failures[parser] = e
+        except Exception as e:
+            # missing or non-iterable model array, every parser fails
+            failures = {parser: failures.get(parser, e) for parser in self.parsers}
+        attributes = list()
+        for parser, accumulator in accumulators.items():
+            if (failure := failures.get(parser)) is None:
+                try:
+                    attributes.extend(parser.finish(accumulator))
+                    continue
+                except Exception as e:
+                    failure = e
+            self.loggingTools.logParserFailure(transformer=type(self), parser=type(parser), exception=failure)
+        return attributes
 
     def _deDupAccessoryPackage(self, attributes: List[AttributeDto]):
         """
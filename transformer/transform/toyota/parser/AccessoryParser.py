@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Optional, List
+from typing import Dict, Iterable, Optional
 
 from common.domain.dto.AttributeDto import Accessory
 from common.domain.dto.AttributeMetadata import AttributeMetadata
@@ -6,15 +6,11 @@ from common.domain.enum.MetadataType import MetadataType
 from common.domain.enum.MetadataUnit import MetadataUnit
 from transformer.domain.attribute_set.AttributeSet import AttributeSet
 from transformer.domain.attribute_set.metadata_updater.implementation.PriceUpdater import PriceUpdater
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
 
 
-class AccessoryParser(AttributeParser):
-
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
+class AccessoryParser(ModelParser):
 
     def _getTitle(self, accessoryJson: Dict, modelJson: Dict) -> Optional[str]:
         try:
@@ -57,12 +53,12 @@ class AccessoryParser(AttributeParser):
                 metadata = [metaAttribute for metaAttribute in rawMetadata if metaAttribute]
                 yield Accessory(title=title, metadata=metadata if metadata else None)
 
-    def parse(self, jsonData: Dict) -> List[Accessory]:
-        accessoryDtos = AttributeSet(
+    def newAccumulator(self) -> AttributeSet:
+        return AttributeSet(
             updater=PriceUpdater(metadataType=MetadataType.COMMON_MSRP, keepLowest=False))  # keeps the highest price
-        for modelJson in jsonData['model']:
-            for accessory in self._parseModel(modelJson):
-                if accessory in accessoryDtos:
-                    self.loggingTools.logDuplicateAttributeDto(parser=self.__class__, attributeDto=accessory)
-                accessoryDtos.add(accessory)
-        return list(accessoryDtos)
+
+    def acceptModel(self, modelJson: Dict, accessoryDtos: AttributeSet) -> None:
+        for accessory in self._parseModel(modelJson):
+            if accessory in accessoryDtos:
+                self.loggingTools.logDuplicateAttributeDto(parser=self.__class__, attributeDto=accessory)
+            accessoryDtos.add(accessory)
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from common.domain.dto.AttributeDto import BodyStyle
 from common.domain.dto.AttributeMetadata import AttributeMetadata
@@ -7,31 +7,36 @@ from common.domain.enum.MetadataType import MetadataType
 from common.domain.enum.MetadataUnit import MetadataUnit
 from transformer.domain.attribute_set.AttributeSet import AttributeSet
 from transformer.domain.attribute_set.metadata_updater.implementation.PriceUpdater import PriceUpdater
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
+from transformer.transform.common.pathQuery import PathQuery, PathResult
 
 
-class BodyStyleParser(AttributeParser):
+class BodyStyleParser(ModelParser):
+    PATHS = PathQuery({MetadataType.BODY_STYLE_BED.name: 'bed.title',
+                       MetadataType.BODY_STYLE_CAB.name: 'cab.title',
+                       MetadataType.BODY_STYLE_SEATING.name: 'attributes.seating.value',
+                       MetadataType.COMMON_BASE_MSRP.name: 'attributes.msrp.value'})  # ex "$101,500"
 
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
+    def newAccumulator(self) -> AttributeSet:
+        return AttributeSet(updater=PriceUpdater(metadataType=MetadataType.COMMON_BASE_MSRP, keepLowest=True))
 
-    def parse(self, jsonData: Dict) -> List[BodyStyle]:
-        bodyStyleDtos = AttributeSet(updater=PriceUpdater(metadataType=MetadataType.COMMON_BASE_MSRP, keepLowest=True))
-        for modelJson in jsonData['model']:
-            bodyStyleDto = self._parseModel(modelJson)
-            if bodyStyleDto in bodyStyleDtos:
-                self.loggingTools.logDuplicateAttributeDto(parser=self.__class__, attributeDto=bodyStyleDto)
-            bodyStyleDtos.add(bodyStyleDto)
+    def acceptModel(self, modelJson: Dict, bodyStyleDtos: AttributeSet) -> None:
+        bodyStyleDto = self._parseModel(modelJson)
+        if bodyStyleDto in bodyStyleDtos:
+            self.loggingTools.logDuplicateAttributeDto(parser=self.__class__, attributeDto=bodyStyleDto)
+        bodyStyleDtos.add(bodyStyleDto)
+
+    def finish(self, bodyStyleDtos: AttributeSet) -> List[BodyStyle]:
         if not bodyStyleDtos:
             self.loggingTools.logNoAttributes(self.__class__)
         return list(bodyStyleDtos)
 
     def _parseModel(self, modelJson: Dict) -> BodyStyle:
+        paths = self.PATHS.resolve(modelJson)
         metadata = list()
         for metadataFn in self._getMSRP, self._getSeating, self._getCab, self._getBed:
-            if foundData := metadataFn(modelJson):
+            if foundData := metadataFn(modelJson, paths):
                 metadata.append(foundData)
         title = self._createTitle(metadata)
         return BodyStyle(title=title, metadata=metadata)
@@ -48,51 +53,38 @@ class BodyStyleParser(AttributeParser):
         bed = titleByType.get(MetadataType.BODY_STYLE_BED)
         return " ".join([part for part in [cab, bed] if part]) or "Standard"
 
-    def _getBed(self, modelJson: Dict) -> Optional[AttributeMetadata]:
-        metadataType = MetadataType.BODY_STYLE_BED
-        try:
-            bed = modelJson['bed']['title']
-        except KeyError as e:
-            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=e, modelJson=modelJson)
+    def _getValue(self, metadataType: MetadataType, modelJson: Dict, paths: Optional[PathResult]) -> Optional[Any]:
+        paths = paths if paths is not None else self.PATHS.resolve(modelJson)
+        if (miss := paths.misses.get(metadataType.name)):
+            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=miss.error(), modelJson=modelJson)
             return None
-        if not bed:
+        return paths.get(metadataType.name)
+
+    def _getBed(self, modelJson: Dict, paths: Optional[PathResult] = None) -> Optional[AttributeMetadata]:
+        metadataType = MetadataType.BODY_STYLE_BED
+        if not (bed := self._getValue(metadataType=metadataType, modelJson=modelJson, paths=paths)):
             return None
         if not re.search("bed", bed, re.IGNORECASE):
             # Toyota is inconsistent, sometimes bed title is "5-ft." others "5-ft. Bed"
             bed = f"{bed.strip()} Bed"
         return AttributeMetadata(metadataType=metadataType, value=util.removeBracketed(bed))
 
-    def _getCab(self, modelJson: Dict) -> Optional[AttributeMetadata]:
+    def _getCab(self, modelJson: Dict, paths: Optional[PathResult] = None) -> Optional[AttributeMetadata]:
         metadataType = MetadataType.BODY_STYLE_CAB
-        try:
-            cab = modelJson['cab']['title']
-        except KeyError as e:
-            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=e, modelJson=modelJson)
-            return None
-        if not cab:
+        if not (cab := self._getValue(metadataType=metadataType, modelJson=modelJson, paths=paths)):
             return None
         return AttributeMetadata(metadataType=metadataType, value=util.removeBracketed(cab))
 
-    def _getSeating(self, modelJson: Dict) -> Optional[AttributeMetadata]:
+    def _getSeating(self, modelJson: Dict, paths: Optional[PathResult] = None) -> Optional[AttributeMetadata]:
         metadataType = MetadataType.BODY_STYLE_SEATING
-        try:
-            seatingStr = modelJson['attributes']['seating']['value']
-        except KeyError as e:
-            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=e, modelJson=modelJson)
-            return None
-        if not seatingStr:
+        if not (seatingStr := self._getValue(metadataType=metadataType, modelJson=modelJson, paths=paths)):
             return None
         seatingInt = util.digitsToInt(seatingStr)
         return AttributeMetadata(metadataType=metadataType, value=seatingInt, unit=MetadataUnit.PASSENGERS)
 
-    def _getMSRP(self, modelJson: Dict) -> Optional[AttributeMetadata]:
+    def _getMSRP(self, modelJson: Dict, paths: Optional[PathResult] = None) -> Optional[AttributeMetadata]:
         metadataType = MetadataType.COMMON_BASE_MSRP
-        try:
-            msrpStr = modelJson['attributes']['msrp']['value']  # ex "$101,500"
-        except KeyError as e:
-            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=e, modelJson=modelJson)
-            return None
-        if not msrpStr:
+        if not (msrpStr := self._getValue(metadataType=metadataType, modelJson=modelJson, paths=paths)):
             return None
         msrp = util.priceToInt(msrpStr)
         return AttributeMetadata(metadataType=metadataType, value=msrp, unit=MetadataUnit.DOLLARS)
@@ -1,22 +1,18 @@
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Set
 
 from common.domain.dto.AttributeDto import Drive
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
 
 
-class DriveParser(AttributeParser):
+class DriveParser(ModelParser):
 
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
+    def newAccumulator(self) -> Set[Drive]:
+        return set()
 
-    def parse(self, jsonData: Dict) -> List[Drive]:
-        driveDtos = set()
-        for modelJson in jsonData['model']:
-            if driveDto := self._getDrive(modelJson):
-                driveDtos.add(driveDto)
-        return list(driveDtos)
+    def acceptModel(self, modelJson: Dict, driveDtos: Set[Drive]) -> None:
+        if driveDto := self._getDrive(modelJson):
+            driveDtos.add(driveDto)
 
     def _getDrive(self, modelJson: Dict) -> Optional[Drive]:
         try:
@@ -1,28 +1,27 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from common.domain.dto.AttributeDto import Engine
 from common.domain.dto.AttributeMetadata import AttributeMetadata
 from common.domain.enum.FuelType import FuelType
 from common.domain.enum.MetadataType import MetadataType
 from common.domain.enum.MetadataUnit import MetadataUnit
-from transformer.transform.AttributeParser import AttributeParser
 from transformer.transform.common import util
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 
 
-class EngineParser(AttributeParser):
+class EngineParser(ModelParser):
 
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
+    def newAccumulator(self) -> Set[Engine]:
+        return set()
 
-    def parse(self, jsonData: Dict) -> List[Engine]:
-        engineAttributeDtos = set()
-        for modelJson in jsonData['model']:
-            if engine := self._parseModel(modelJson):
-                if engine in engineAttributeDtos:
-                    self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=engine)
-                else:
-                    engineAttributeDtos.add(engine)
+    def acceptModel(self, modelJson: Dict, engineAttributeDtos: Set[Engine]) -> None:
+        if engine := self._parseModel(modelJson):
+            if engine in engineAttributeDtos:
+                self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=engine)
+            else:
+                engineAttributeDtos.add(engine)
+
+    def finish(self, engineAttributeDtos: Set[Engine]) -> List[Engine]:
         if not engineAttributeDtos:
             self.loggingTools.logNoAttributes(self.__class__)
         return list(engineAttributeDtos)
@@ -6,60 +6,52 @@ from common.domain.enum.MetadataType import MetadataType
 from common.domain.enum.MetadataUnit import MetadataUnit
 from transformer.domain.attribute_set.AttributeSet import AttributeSet
 from transformer.domain.attribute_set.metadata_updater.implementation.PriceUpdater import PriceUpdater
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
+from transformer.transform.common.pathQuery import PathQuery, PathResult
 
 
-class GradeParser(AttributeParser):
+class GradeParser(ModelParser):
+    PATHS = PathQuery({'grade': 'grade.attributes.title.value',  # Toyota
+                       'dealerTrim': 'attributes.dealertrim.value',  # Lexus
+                       'msrp': 'attributes.msrp.value'})  # ex "$101,500"
 
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
+    def newAccumulator(self) -> AttributeSet:
+        return AttributeSet(updater=PriceUpdater(metadataType=MetadataType.COMMON_BASE_MSRP, keepLowest=True))
 
-    def parse(self, jsonData: Dict) -> List[Grade]:
-        gradeAttributeDtos = AttributeSet(updater=PriceUpdater(metadataType=MetadataType.COMMON_BASE_MSRP, keepLowest=True))
-        for modelJson in jsonData['model']:
-            grade = self._parseModel(modelJson)
-            if grade in gradeAttributeDtos:
-                self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=grade)
-            gradeAttributeDtos.add(grade)
+    def acceptModel(self, modelJson: Dict, gradeAttributeDtos: AttributeSet) -> None:
+        grade = self._parseModel(modelJson)
+        if grade in gradeAttributeDtos:
+            self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=grade)
+        gradeAttributeDtos.add(grade)
+
+    def finish(self, gradeAttributeDtos: AttributeSet) -> List[Grade]:
         if not gradeAttributeDtos:
             self.loggingTools.logNoAttributes(self.__class__)
         return list(gradeAttributeDtos)
 
-    def _getGrade(self, modelJson: Dict) -> Optional[str]:
-        # More domain for Toyota
-        try:
-            return modelJson['grade']['attributes']['title']['value']
-        except KeyError as e:
-            self.loggingTools.logTitleFailure(parser=self.__class__, exception=e, modelJson=modelJson)
-        return None
-
-    def _getDealerTrim(self, modelJson: Dict) -> Optional[str]:
-        # more domain for Lexus
-        try:
-            return modelJson['attributes']['dealertrim']['value']
-        except KeyError as e:
-            self.loggingTools.logTitleFailure(parser=self.__class__, exception=e, modelJson=modelJson)
-        return None
+    def _getTitle(self, paths: PathResult, modelJson: Dict, name: str) -> Optional[str]:
+        if (miss := paths.misses.get(name)):
+            self.loggingTools.logTitleFailure(parser=self.__class__, exception=miss.error(), modelJson=modelJson)
+            return None
+        return paths.get(name)
 
     def _parseModel(self, modelJson: Dict) -> Grade:
+        paths = self.PATHS.resolve(modelJson)
         # Lexus: has no concept of "Standard" trim, instead the Standard model has no dealertrim
         # Toyota: the base/standard grade is usually (always?) the model name
-        title = self._getGrade(modelJson) or self._getDealerTrim(modelJson) or "Standard"
+        title = self._getTitle(paths, modelJson, 'grade') or self._getTitle(paths, modelJson, 'dealerTrim') \
+            or "Standard"
         title = util.removeBracketed(title)
-        optionalMSRP = self._getMSRP(modelJson)
+        optionalMSRP = self._getMSRP(paths, modelJson)
         return Grade(title=title, metadata=[optionalMSRP] if optionalMSRP else None)
 
-    def _getMSRP(self, modelJson: Dict) -> Optional[AttributeMetadata]:
+    def _getMSRP(self, paths: PathResult, modelJson: Dict) -> Optional[AttributeMetadata]:
         metadataType = MetadataType.COMMON_BASE_MSRP
-        try:
-            msrpStr = modelJson['attributes']['msrp']['value']  # ex "$101,500"
-        except KeyError as e:
-            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=e, modelJson=modelJson)
+        if (miss := paths.misses.get('msrp')):
+            self.loggingTools.logMetadataFailure(metadataType=metadataType, exception=miss.error(), modelJson=modelJson)
             return None
-        if not msrpStr:
+        if not (msrpStr := paths.get('msrp')):
             return None
         msrp = util.priceToInt(msrpStr)
         return AttributeMetadata(metadataType=metadataType, value=msrp, unit=MetadataUnit.DOLLARS)
-
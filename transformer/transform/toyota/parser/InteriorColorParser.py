@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Optional, List
+from typing import Dict, Iterable, Optional
 
 from common.domain.dto.AttributeDto import InteriorColor
 from common.domain.dto.AttributeMetadata import AttributeMetadata
@@ -6,18 +6,14 @@ from common.domain.enum.MetadataType import MetadataType
 from common.domain.enum.MetadataUnit import MetadataUnit
 from transformer.domain.attribute_set.AttributeSet import AttributeSet
 from transformer.domain.attribute_set.metadata_updater.implementation.PriceUpdater import PriceUpdater
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
 
 
-class InteriorColorParser(AttributeParser):
+class InteriorColorParser(ModelParser):
 
     # Interior and InteriorColorParsers are essentially the same
 
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
-
     def _getTitle(self, colorJson: Dict, modelJson: Dict) -> Optional[str]:
         try:
             colorTitle = colorJson['title']
@@ -48,12 +44,12 @@ class InteriorColorParser(AttributeParser):
                     metadata = [priceMetadata]
                 yield InteriorColor(title=title, metadata=metadata)
 
-    def parse(self, jsonData: Dict) -> List[InteriorColor]:
-        interiorDtos = AttributeSet(
+    def newAccumulator(self) -> AttributeSet:
+        return AttributeSet(
             updater=PriceUpdater(metadataType=MetadataType.COMMON_MSRP, keepLowest=False))  # keeps highest MSRP
-        for modelJson in jsonData['model']:
-            for interiorColor in self._parseModel(modelJson):
-                if interiorColor in interiorDtos:
-                    self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=interiorColor)
-                interiorDtos.add(interiorColor)
-        return list(interiorDtos)
+
+    def acceptModel(self, modelJson: Dict, interiorDtos: AttributeSet) -> None:
+        for interiorColor in self._parseModel(modelJson):
+            if interiorColor in interiorDtos:
+                self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=interiorColor)
+            interiorDtos.add(interiorColor)
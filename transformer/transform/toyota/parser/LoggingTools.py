@@ -16,26 +16,33 @@ class LoggingTools:
             return None
         return title
 
+    # parsers log a failure for nearly every optional field they don't find, the model name lookups below are
+    # skipped entirely unless debug is enabled
+
     def logMetadataFailure(self, metadataType: MetadataType, exception: Exception, modelJson: Dict) -> None:
-        self.log.debug(f"Failure to parse: {metadataType.name} for model {self._getModelName(modelJson)}")
-        self.log.debug(f"Error message:\n", exception.__cause__)
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return
+        self.log.debug("Failure to parse: %s for model %s", metadataType.name, self._getModelName(modelJson))
+        self.log.debug("Error message:\n%r", exception)
 
     def logTitleFailure(self, parser: type, exception: Exception, modelJson: Dict) -> None:
-        self.log.debug(f"Failure to parse title: {parser.__name__} for model {self._getModelName(modelJson)}")
-        self.log.debug(f"Error message:\n", exception.__cause__)
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return
+        self.log.debug("Failure to parse title: %s for model %s", parser.__name__, self._getModelName(modelJson))
+        self.log.debug("Error message:\n%r", exception)
 
     def logNoAttributes(self, parser: type) -> None:
-        self.log.debug(f"No Attributes found for {parser.__name__}")
+        self.log.debug("No Attributes found for %s", parser.__name__)
 
     def logDuplicateAttributeDto(self, parser: type, attributeDto: AttributeDto) -> None:
-        self.log.debug(f"{parser.__name__} - duplicate attribute for {attributeDto}")
+        self.log.debug("%s - duplicate attribute for %s", parser.__name__, attributeDto)
 
     def logDebug(self, message: str, parser: Optional[type] = "Unknown Transformer", modelJson: Optional[Dict] = None):
-        if not modelJson:
-            modelName = "Unknown Model"
-        modelName = self._getModelName(modelJson)
-        self.log.debug(f"{parser.__name__} : {modelName} - {message}")
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return
+        modelName = self._getModelName(modelJson) if modelJson else "Unknown Model"
+        self.log.debug("%s : %s - %s", getattr(parser, '__name__', parser), modelName, message)
 
     def logParserFailure(self, transformer: type, parser: type, exception: Exception) -> None:
-        logging.info(f"{transformer.__name__} - {parser.__name__} ")
+        logging.info("%s - %s ", transformer.__name__, parser.__name__)
         logging.debug("Parser Failure:\n", exc_info=exception)
@@ -0,0 +1,43 @@
+from abc import abstractmethod
+from typing import Any, Dict, List
+
+from common.domain.dto.AttributeDto import AttributeDto
+from transformer.transform.AttributeParser import AttributeParser
+from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+
+
+class ModelParser(AttributeParser):
+    """
+    A Toyota attribute parser that parses each entry of ``jsonData['model']`` independently, accumulating the
+    results.  Parsing is split into ``newAccumulator``, ``acceptModel`` and ``finish`` so the ``ToyotaTransformer``
+    can walk the model array once, handing each entry to every parser.
+    """
+
+    def __init__(self, loggingTools: LoggingTools):
+        self.loggingTools = loggingTools
+
+    @abstractmethod
+    def newAccumulator(self) -> Any:
+        """
+        :return: an empty collection for ``acceptModel`` to add to (i.e. a ``set`` or ``AttributeSet``)
+        """
+        pass
+
+    @abstractmethod
+    def acceptModel(self, modelJson: Dict, accumulator: Any) -> None:
+        """
+        Parses a single entry of ``jsonData['model']`` into ``accumulator``.
+        :param modelJson:
+        :param accumulator: from ``newAccumulator``
+        :return:
+        """
+        pass
+
+    def finish(self, accumulator: Any) -> List[AttributeDto]:
+        return list(accumulator)
+
+    def parse(self, jsonData: Dict) -> List[AttributeDto]:
+        accumulator = self.newAccumulator()
+        for modelJson in jsonData['model']:
+            self.acceptModel(modelJson, accumulator)
+        return self.finish(accumulator)
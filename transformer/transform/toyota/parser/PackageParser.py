@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Optional
 
 from common.domain.dto.AttributeDto import Package
 from common.domain.dto.AttributeMetadata import AttributeMetadata
@@ -6,28 +6,24 @@ from common.domain.enum.MetadataType import MetadataType
 from common.domain.enum.MetadataUnit import MetadataUnit
 from transformer.domain.attribute_set.AttributeSet import AttributeSet
 from transformer.domain.attribute_set.metadata_updater.implementation.PriceUpdater import PriceUpdater
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
 
 
-class PackageParser(AttributeParser):
+class PackageParser(ModelParser):
 
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
-
-    def parse(self, jsonData: Dict) -> List[Package]:
-        packages = AttributeSet(updater=PriceUpdater(
+    def newAccumulator(self) -> AttributeSet:
+        return AttributeSet(updater=PriceUpdater(
             metadataType=MetadataType.COMMON_MSRP, keepLowest=False))  # keeps highest MSRP
-        for modelJson in jsonData['model']:
-            for package in self._parseModel(modelJson):
-                if not package:
-                    continue
-                if package in packages:
-                    self.loggingTools.logDuplicateAttributeDto(
-                        parser=self.__class__, attributeDto=package)
-                packages.add(package)
-        return list(packages)
+
+    def acceptModel(self, modelJson: Dict, packages: AttributeSet) -> None:
+        for package in self._parseModel(modelJson):
+            if not package:
+                continue
+            if package in packages:
+                self.loggingTools.logDuplicateAttributeDto(
+                    parser=self.__class__, attributeDto=package)
+            packages.add(package)
 
     def _parseModel(self, modelJson: Dict) -> Iterable[Package]:
         for packageJson in modelJson.get("packages", list()):
@@ -1,15 +1,11 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 
 from common.domain.dto.AttributeDto import Transmission
-from transformer.transform.AttributeParser import AttributeParser
-from transformer.transform.toyota.parser.LoggingTools import LoggingTools
+from transformer.transform.toyota.parser.ModelParser import ModelParser
 from transformer.transform.common import util
 
 
-class TransmissionParser(AttributeParser):
-
-    def __init__(self, loggingTools: LoggingTools):
-        self.loggingTools = loggingTools
+class TransmissionParser(ModelParser):
 
     def _getTitle(self, modelJson: Dict) -> Optional[str]:
         try:
@@ -21,15 +17,18 @@ class TransmissionParser(AttributeParser):
             return None
         return util.removeBracketed(title)
 
-    def parse(self, jsonData: Dict) -> List[Transmission]:
-        transmissionAttributeDtos = set()
-        for modelJson in jsonData['model']:
-            if not (title := self._getTitle(modelJson)):
-                continue
-            if (transmission := Transmission(title=title)) in transmissionAttributeDtos:
-                self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=transmission)
-            else:
-                transmissionAttributeDtos.add(transmission)
+    def newAccumulator(self) -> Set[Transmission]:
+        return set()
+
+    def acceptModel(self, modelJson: Dict, transmissionAttributeDtos: Set[Transmission]) -> None:
+        if not (title := self._getTitle(modelJson)):
+            return
+        if (transmission := Transmission(title=title)) in transmissionAttributeDtos:
+            self.loggingTools.logDuplicateAttributeDto(parser=type(self), attributeDto=transmission)
+        else:
+            transmissionAttributeDtos.add(transmission)
+
+    def finish(self, transmissionAttributeDtos: Set[Transmission]) -> List[Transmission]:
         if not transmissionAttributeDtos:
             self.loggingTools.logNoAttributes(self.__class__)
         return list(transmissionAttributeDtos)
@@ -1,6 +1,8 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from common.domain.dto.AttributeDto import Accessory, Package, Engine
+from common.domain.dto.RawDataDto import RawDataDto
 from transformer.transform.toyota.ToyotaTransformer import ToyotaTransformer
 
 
@@ -13,4 +15,51 @@ class TestToyotaTransformer(TestCase):
         foundAttributes = set(self.transformer._deDupAccessoryPackage(rawAttributes))
         expectedAttributes = {Package(title="Premium Package"), Engine(title="1ZZ")}
         self.assertEqual(expectedAttributes, foundAttributes)
-        
+
+    def _rawDataDto(self, jsonData) -> RawDataDto:
+        return RawDataDto(dataId=None, rawData=jsonData, modelId=None, createdAt=None)
+
+    def _jsonData(self):
+        return {'model': [{'engine': {'title': '2.7L 4-Cyl.'}, 'transmission': {'title': '6-Speed Automatic'},
+                           'drive': {'title': '4x2'}, 'cab': {'title': 'Access Cab'}, 'bed': {'title': '6-ft.'},
+                           'grade': {'attributes': {'title': {'value': 'SR'}}},
+                           'attributes': {'msrp': {'value': '$27,150'}, 'seating': {'value': '4'}},
+                           'packages': [{'title': 'SR Convenience Package', 'price': '$1,000'}],
+                           'exteriorcolor': [{'title': 'Silver', 'price': '$0'}],
+                           'interiorcolor': [{'title': 'Cement', 'price': '$0'}],
+                           'accessories': [{'title': 'SR Convenience Package', 'price': '$995'},
+                                           {'title': 'Bed Mat', 'price': '$120'}]},
+                          {'engine': {'title': '3.5L V6'}, 'transmission': {'title': '6-Speed Manual'},
+                           'drive': {'title': '4x4'}, 'cab': {'title': 'Double Cab'}, 'bed': {'title': '5-ft. Bed'},
+                           'grade': {'attributes': {'title': {'value': 'TRD Off-Road'}}},
+                           'attributes': {'msrp': {'value': '$38,000'}, 'seating': {'value': '5'}},
+                           'exteriorcolor': [{'title': 'Silver', 'price': '$425'}],
+                           'accessories': [{'title': 'Bed Mat', 'price': '$150'}]}]}
+
+    def test_transformSinglePassMatchesEachParser(self):
+        singlePass = ToyotaTransformer(singlePass=True).transform(self._rawDataDto(self._jsonData()))
+        eachParser = ToyotaTransformer(singlePass=False).transform(self._rawDataDto(self._jsonData()))
+        self.assertEqual(len(eachParser), len(singlePass))
+        self.assertEqual(set(eachParser), set(singlePass))
+        for found, expected in zip(singlePass, eachParser):
+            expected._assertStrictEq(found)
+
+    def test_transformSinglePassFailedParserContributesNothing(self):
+        transformer = ToyotaTransformer(singlePass=True)
+        engineParser = transformer.parsers[0]
+        acceptModel = engineParser.acceptModel
+
+        def acceptFirstModel(modelJson, accumulator):
+            if 'packages' not in modelJson:
+                raise ValueError('bad model')
+            acceptModel(modelJson, accumulator)
+
+        engineParser.acceptModel = MagicMock(side_effect=acceptFirstModel)
+        attributes = transformer.transform(self._rawDataDto(self._jsonData()))
+        self.assertFalse([attribute for attribute in attributes if isinstance(attribute, Engine)])
+        self.assertEqual(2, engineParser.acceptModel.call_count)
+        self.assertTrue(attributes)
+
+    def test_transformSinglePassMissingModel(self):
+        transformer = ToyotaTransformer(singlePass=True)
+        self.assertEqual(list(), transformer._parseSinglePass({'notModel': list()}))